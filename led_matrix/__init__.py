@@ -21,6 +21,18 @@ STATIC_RESOURCES_DIR: Path
 with resources.as_file(resources.files("led_matrix")) as STATIC_RESOURCES_DIR:
     STATIC_RESOURCES_DIR = (STATIC_RESOURCES_DIR / "static_res").resolve()
 
+# files that can be recreated at any time, e.g. compiled animations
+CACHE_DIR: Path
+if IS_ALPINE_LINUX:
+    # this is not on the persistent storage and it is not committed with 'lbu'
+    CACHE_DIR = Path("/") / "var" / "cache" / "led-matrix"
+else:
+    CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "led-matrix"
+
+
+def _is_cache_path(path: Path) -> bool:
+    return path == CACHE_DIR or CACHE_DIR in path.parents
+
 
 def _patch_open_function() -> None:
     # this class managees rw access to the LBU directory
@@ -48,6 +60,7 @@ def _patch_open_function() -> None:
                                         "a" in mode or
                                         "+" in mode)
             is_lbu_path: bool = LBU_PATH in file_obj.parents
+            is_cache_path: bool = _is_cache_path(file_obj)
 
             # before doing anything with the file, enable writing on the LBU directory
             if writing_requested and is_lbu_path:
@@ -70,7 +83,7 @@ def _patch_open_function() -> None:
                     if is_lbu_path:
                         # disable writing on the LBU directory again
                         alpine_lbu.remount_ro()
-                    else:
+                    elif not is_cache_path:
                         # this normally means that the config file was altered
                         # use 'lbu commit -d' to save the /etc directory
                         alpine_lbu_commit_d()
@@ -101,6 +114,10 @@ def _patch_pathlib() -> None:
                 with AlpineLBU():
                     return func(*args, **kwargs)
 
+            # the cache is not persisted
+            if _is_cache_path(path_self):
+                return func(*args, **kwargs)
+
             r: R = func(*args, **kwargs)
             alpine_lbu_commit_d()
             return r
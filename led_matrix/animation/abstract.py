@@ -1,55 +1,86 @@
 """
 This is the sceleton code for all animations.
 """
+import asyncio
+import hashlib
+import importlib
 import time
 from abc import ABC, abstractmethod
-from dataclasses import Field, dataclass, fields
+from collections import deque
+from dataclasses import Field, dataclass, field, fields
 from enum import Enum
 from io import BytesIO
 from logging import Logger
 from pathlib import Path
-from queue import Empty, Queue
-from threading import Event, Thread
-from typing import (Callable, ClassVar, Iterator, Optional, Self, final,
-                    get_args)
+from threading import TIMEOUT_MAX, Event, Thread, current_thread
+from typing import (Callable, ClassVar, Final, Generator, Iterator, Optional,
+                    Self, cast, final, get_args)
 from uuid import UUID, uuid4
 
+import numpy as np
+from numpy.typing import NDArray
+
+from led_matrix.animation.frame_store import FRAME_STORE, FrameStore
+from led_matrix.animation.render_cache import (RENDER_CACHE,
+                                               RenderedFrames,
+                                               RenderedFramesBuilder)
+from led_matrix.animation.runtime import AnimationRuntime
+from led_matrix.animation.variant_index import VariantIndex, VariantMetadata
 from led_matrix.common.color import Color
+from led_matrix.common.frame import FrameEnvelope, FrameQueue, FrameRing
+from led_matrix.common.frame_pool import FramePool
 from led_matrix.common.log import LOG
-from led_matrix.common.threading import EventWithUnsetSignal
+from led_matrix.common.threading import (EventWithUnsetSignal,
+                                         lower_thread_priority)
 
 
 class AnimationVariant(Enum):
     @classmethod
     def build_variants_from_files(cls, name: str, search_dir: Path, glob_str: str) -> type[Self]:
-        variants: dict[str, Path] = {}
+        variant_index: VariantIndex = VariantIndex(search_dir=search_dir, glob_str=glob_str)
+        variant_index.refresh()
 
-        found_file: Path
-        for found_file in sorted(search_dir.glob(glob_str), key=lambda s: s.name.lower()):
-            if found_file.is_file():
-                variants[found_file.stem] = found_file.resolve()
+        return cls.__build_variants_from_index(name=name, variant_index=variant_index)
 
+    @classmethod
+    def __build_variants_from_index(cls, name: str, variant_index: VariantIndex) -> type[Self]:
         # this works, because AnimationVariant is derived from Enum
-        new_type: type[Self] = AnimationVariant(name, variants)  # type: ignore # pylint: disable=E1121
+        new_type: type[Self] = AnimationVariant(name, variant_index.variants)  # type: ignore # pylint: disable=E1121
 
-        setattr(new_type, "__search_dir__", search_dir)
-        setattr(new_type, "__glob_str__", glob_str)
+        setattr(new_type, "__variant_index__", variant_index)
 
         return new_type
 
     @classmethod
-    def refresh_variants(cls) -> type[Self]:
-        search_dir: Path | None = getattr(cls, "__search_dir__", None)
-        glob_str: str | None = getattr(cls, "__glob_str__", None)
+    def refresh_variants(cls, changed_path: Path | None=None) -> type[Self]:
+        """
+        @param changed_path: The file of the variant that was added or removed.
+                             If it's set, only this file is updated instead of scanning the whole directory.
+        """
+        variant_index: VariantIndex | None = get_variant_index(cls)
 
-        if glob_str is None or search_dir is None:
+        if variant_index is None:
             # this happens if no dynamic variant was built with the 'build_variants_from_files' method above
             # so, can't refresh anything
             return cls
 
-        return cls.build_variants_from_files(name=cls.__name__,
-                                             search_dir=search_dir,
-                                             glob_str=glob_str)
+        # only the changed files are updated in the index
+        if changed_path is None:
+            variant_index.refresh(force=True)
+        else:
+            variant_index.refresh_file(changed_path)
+
+        return cls.__build_variants_from_index(name=cls.__name__,
+                                               variant_index=variant_index)
+
+
+
+def get_variant_index(variant_enum: type[AnimationVariant]) -> VariantIndex | None:
+    """
+    @return: The index of the variant files, if the variants were built from files.
+    """
+    # not a method of the enum, because variants with the same name would hide it
+    return getattr(variant_enum, "__variant_index__", None)
 
 
 AnimationParameterTypes = str | bool | int | float | Color
@@ -79,9 +110,76 @@ class AnimationSettings:
     repeat: int = 0
 
 
+@dataclass(kw_only=True)
+class AnimationStatistics:
+    # number of the last render times that are kept for the percentiles
+    RENDER_TIME_SAMPLES: ClassVar[int] = 1024
+
+    frames: int = 0
+    # number of frames that were rendered too late for their deadline
+    deadline_misses: int = 0
+    # the time the animation was running (not paused)
+    active_time_ns: int = 0
+    render_times_ns: deque[int] = field(default_factory=lambda: deque(maxlen=AnimationStatistics.RENDER_TIME_SAMPLES))
+
+    @property
+    def frames_per_second(self) -> float:
+        """The achieved frame rate."""
+        if self.active_time_ns == 0:
+            return 0.
+
+        return self.frames / self.active_time_ns * 1e9
+
+    def add_render_time(self, render_time_ns: int) -> None:
+        self.frames += 1
+        self.render_times_ns.append(render_time_ns)
+
+    def render_time_percentile(self, percentile: float) -> float:
+        """The percentile (0 .. 100) of the recent render times in seconds."""
+        if not self.render_times_ns:
+            return 0.
+
+        return float(np.percentile(self.render_times_ns, percentile)) / 1e9
+
+
+def _get_parameter_key(settings: AnimationSettings) -> tuple | None:
+    if settings.parameter is None:
+        return None
+
+    return tuple((f.name, repr(value)) for f, value in settings.parameter.iterate_fields())
+
+
+def _get_frame_store_entry(settings: AnimationSettings, width: int, height: int) -> tuple[str, list] | None:
+    """
+    The name and the source state of an animation in the frame store.
+    Only variants that are files (or directories) are stored.
+    """
+    if settings.variant is None or not isinstance(settings.variant.value, Path):
+        return None
+
+    try:
+        stat_result = settings.variant.value.stat()
+    except OSError:
+        return None
+
+    parameter_hash: str = hashlib.sha1(repr(_get_parameter_key(settings)).encode("utf-8")).hexdigest()[:12]
+
+    return (FrameStore.get_name(settings.variant.name, f"{width}x{height}-{parameter_hash}"),
+            [str(settings.variant.value), stat_result.st_mtime_ns, stat_result.st_size])
+
+
+# how long to wait before checking again if a full frame ring has room, if its oldest frame is overdue
+_RENDER_AHEAD_POLL_NS: Final[int] = 1_000_000
+
+
 class AbstractAnimation(ABC, Thread):
+    # how many frames the animations that support it render ahead
+    # it's set from the configuration by the animation controller
+    render_ahead_frames: ClassVar[int] = 0
+    __render_ahead: ClassVar[bool] = False
+
     def __init__(self, width: int, height: int,
-                 frame_queue: Queue, settings: AnimationSettings,
+                 frame_queue: FrameQueue, frame_pool: FramePool, settings: AnimationSettings,
                  logger: Logger,
                  on_finish_callable: Callable[[], None]) -> None:
         super().__init__(daemon=True)
@@ -90,9 +188,12 @@ class AbstractAnimation(ABC, Thread):
 
         self._width: int = width  # width of frames to produce
         self._height: int = height  # height of frames to produce
-        self._frame_queue: Queue = frame_queue  # queue to put frames onto
+        self._frame_queue: FrameQueue = frame_queue  # queue to put frames onto
+        self.__frame_pool: FramePool = frame_pool  # pool of the frame buffers
         self._settings: AnimationSettings = settings
         self._repeat: int = self._settings.repeat
+        # the (width, height) of the variant source, e.g. an image, should be set when the frames are rendered
+        self._source_size: tuple[int, int] | None = None
         self.__remaining_repeat: int = self._repeat - 1
         self.__on_finish_callable: Callable[[], None] = on_finish_callable
 
@@ -105,61 +206,472 @@ class AbstractAnimation(ABC, Thread):
         self.__animation_paused: EventWithUnsetSignal = EventWithUnsetSignal()
 
         # default animation speed 60 fps
-        self.__animation_speed: float = 1/60
+        self.__animation_speed_ns: int = 1_000_000_000 // 60
+        # the deadline of the frame that is currently rendered, it is presented at this time
+        self.__frame_deadline_ns: int = 0
+        # the frames that were rendered ahead, None if the animation renders every frame just in time
+        self.__frame_ring: FrameRing | None = (FrameRing(capacity=self.render_ahead_frames)
+                                               if type(self).__render_ahead and self.render_ahead_frames > 0
+                                               else None)
+        # the deadline at which the animation ends, once its last frame was rendered
+        self.__end_deadline_ns: int | None = None
+
+        self.__statistics: AnimationStatistics = AnimationStatistics()
+
+        # only used if the animation runs in the event loop of a runtime instead of in its own thread
+        self.__runtime: AnimationRuntime | None = None
+        self.__task: asyncio.Task | None = None
+        # set once the animation is over
+        self.__ended: Event = Event()
+
+        # only used if the frames of the animation are rendered once and replayed afterwards
+        self.__frame_renderer: Callable[[], Iterator[tuple[float, NDArray[np.uint8]]]] | None = None
+        self.__rendered_frames: RenderedFrames | None = None
+        self.__frames_builder: RenderedFramesBuilder | None = None
+
+    def __init_subclass__(cls, *, render_ahead: bool=False, **kwargs) -> None:
+        """
+        @param render_ahead: True if the frames of the animation can be rendered before they are due.
+                             This requires that they do not depend on the time they are rendered at.
+        """
+        super().__init_subclass__(**kwargs)
+        cls.__render_ahead = render_ahead
 
     @property
     def _log(self) -> Logger:
         return self.__log
 
+    @property
+    def statistics(self) -> AnimationStatistics:
+        """The pacing statistics of the animation."""
+        return self.__statistics
+
+    def __render(self, deadline_ns: int) -> bool | None:
+        """
+        Render the frame for the deadline.
+        @return: True if the next frame is due at the next deadline.
+                 False if a new iteration starts, so the next frame is due now.
+                 None if the animation has ended.
+        """
+        start_time_ns: int = time.monotonic_ns()
+
+        # add the next frame to the frame queue
+        self.__frame_deadline_ns = deadline_ns
+        try:
+            more: bool = self.render_next_frame()
+        except Exception as e:  # pylint: disable=W0718
+            self.__log.error("During the execution of the animation the following error occurred:",
+                             exc_info=e)
+            return None
+
+        self.__statistics.add_render_time(time.monotonic_ns() - start_time_ns)
+
+        # check if the animation has finished
+        if not more:
+            # check for more iterations
+            if self.is_next_iteration():
+                # decrease iteration count
+                self.__remaining_repeat -= 1
+                # start a new iteration
+                return False
+
+            # the animation has finished, but the frames that were rendered ahead are still presented until the deadline
+            self.__end_deadline_ns = deadline_ns
+            # stop here
+            return None
+
+        return True
+
+    def __next_deadline(self, deadline_ns: int, count_miss: bool) -> int:
+        # the animation speed can change with every frame
+        frame_interval_ns: int = self.__animation_speed_ns
+        deadline_ns += frame_interval_ns
+
+        now_ns: int = time.monotonic_ns()
+        if now_ns >= deadline_ns:
+            if count_miss:
+                self.__statistics.deadline_misses += 1
+
+            # do not render the missed frames in a burst, skip forward to the next deadline instead
+            if frame_interval_ns > 0:
+                deadline_ns += ((now_ns - deadline_ns) // frame_interval_ns + 1) * frame_interval_ns
+            else:
+                deadline_ns = now_ns
+
+        return deadline_ns
+
+    def __render_delay_ns(self, deadline_ns: int, render_ahead: bool) -> int:
+        """
+        @return: How long to wait until the frame for the deadline can be rendered.
+        """
+        now_ns: int = time.monotonic_ns()
+        if self.__frame_ring is None or not render_ahead:
+            return deadline_ns - now_ns
+
+        full_until_ns: int | None = self.__frame_ring.full_until_ns()
+        if full_until_ns is None:
+            # there is room in the ring, so render it right away
+            return 0
+
+        # the display side takes the oldest frame around its presentation time
+        return max(full_until_ns - now_ns, _RENDER_AHEAD_POLL_NS)
+
+    def __log_statistics(self) -> None:
+        self.__log.debug("Rendered %d frames (%.2f fps), %d deadline misses, "
+                         "render time: p50 %.2f ms, p95 %.2f ms, p99 %.2f ms",
+                         self.__statistics.frames,
+                         self.__statistics.frames_per_second,
+                         self.__statistics.deadline_misses,
+                         self.__statistics.render_time_percentile(50) * 1000,
+                         self.__statistics.render_time_percentile(95) * 1000,
+                         self.__statistics.render_time_percentile(99) * 1000)
+
     def run(self) -> None:
+        # the frames are paced by absolute deadlines of a monotonic clock
+        # so errors do not accumulate and clock adjustments (e.g. by NTP) have no effect
+        deadline_ns: int = time.monotonic_ns()
+
         while not self._stop_event.is_set():
-            start_time: float = time.time()
-            if not self._pause_event.is_set():
+            start_time_ns: int = time.monotonic_ns()
+            paused: bool = self._pause_event.is_set()
+            if not paused:
                 # if the animation is still marked as paused, unset it here
                 if self.__animation_paused.is_set():
                     # also notifies the resume method that now the animation is running again
                     self.__animation_paused.clear()
+                    # the deadlines of the pause are meaningless
+                    deadline_ns = start_time_ns
 
-                # add the next frame to the frame queue
-                try:
-                    more: bool = self.render_next_frame()
-                except Exception as e:  # pylint: disable=W0718
-                    self.__log.error("During the execution of the animation the following error occurred:",
-                                     exc_info=e)
-                    break
-
-                # check if the animation has finished
-                if not more:
-                    # check for more iterations
-                    if self.is_next_iteration():
-                        # decrease iteration count
-                        self.__remaining_repeat -= 1
-                        # start a new iteration
-                        continue
-
-                    # the animation has finished
-                    self.__on_finish_callable()
-                    # stop here
+                rendered: bool | None = self.__render(deadline_ns)
+                if rendered is None:
                     break
+                if not rendered:
+                    continue
             else:
                 # notify the pause method that the animation is now paused
                 self.__animation_paused.set()
 
-            # limit fps = animation_speed - the execution time
-            wait_time: float = self.__animation_speed - (time.time() - start_time)
-            if wait_time > 0:
-                self._stop_event.wait(wait_time)
+            deadline_ns = self.__next_deadline(deadline_ns, count_miss=not paused)
+
+            # a paused animation does not render ahead
+            delay_ns: int = self.__render_delay_ns(deadline_ns, render_ahead=not paused)
+            while delay_ns > 0 and not self._stop_event.wait(min(delay_ns / 1e9, TIMEOUT_MAX)):
+                delay_ns = self.__render_delay_ns(deadline_ns, render_ahead=not paused)
+
+            if not paused:
+                self.__statistics.active_time_ns += time.monotonic_ns() - start_time_ns
+
+        if self.__end_deadline_ns is not None:
+            self._stop_event.wait(min(max(0, self.__end_deadline_ns - time.monotonic_ns()) / 1e9, TIMEOUT_MAX))
+            if not self._stop_event.is_set():
+                self.__on_finish_callable()
+
+        self.__log_statistics()
+
+    async def __render_in_executor(self, deadline_ns: int) -> bool | None:
+        # a slow render, e.g. decoding a picture, must not stall the other animations of the event loop
+        if self.__runtime is None:
+            raise RuntimeError("The animation does not run in a runtime.")
+
+        render: asyncio.Future[bool | None] = self.__runtime.run_in_executor(self.__render, deadline_ns)
+        try:
+            return await asyncio.shield(render)
+        except asyncio.CancelledError:
+            # the render can't be cancelled, so the animation is only paused or stopped once the frame is rendered
+            await asyncio.wait((render,))
+            raise
+
+    async def __run_async(self) -> None:
+        # like the run method, but the frames are paced by timers of the event loop
+        # pausing cancels this task, resuming creates a new one
+        deadline_ns: int = time.monotonic_ns()
+
+        try:
+            # an animation that was paused after its last frame just ends
+            while not self._stop_event.is_set() and self.__end_deadline_ns is None:
+                start_time_ns: int = time.monotonic_ns()
+
+                rendered: bool | None = await self.__render_in_executor(deadline_ns)
+                if rendered is None:
+                    break
+                if not rendered:
+                    continue
+
+                deadline_ns = self.__next_deadline(deadline_ns, count_miss=True)
+
+                delay_ns: int = self.__render_delay_ns(deadline_ns, render_ahead=True)
+                while delay_ns > 0:
+                    await asyncio.sleep(delay_ns / 1e9)
+                    delay_ns = self.__render_delay_ns(deadline_ns, render_ahead=True)
+
+                self.__statistics.active_time_ns += time.monotonic_ns() - start_time_ns
+
+            if self.__end_deadline_ns is not None and not self._stop_event.is_set():
+                await asyncio.sleep(max(0, self.__end_deadline_ns - time.monotonic_ns()) / 1e9)
+                self.__on_finish_callable()
+        except asyncio.CancelledError:
+            if not self._stop_event.is_set():
+                # just paused
+                return
+
+        self.__ended.set()
+        self.__log_statistics()
+
+    @final
+    def start_in(self, runtime: AnimationRuntime) -> None:
+        """Run the animation as a task of the event loop of the runtime instead of in its own thread."""
+        self.__runtime = runtime
+        runtime.call(self.__start_task)
+
+    def __start_task(self) -> None:
+        # this runs in the event loop
+        if self.__runtime is not None and not self.__ended.is_set():
+            self.__task = self.__runtime.create_task(self.__run_async())
+
+    def __pause_task(self) -> asyncio.Task | None:
+        # this runs in the event loop, but the current frame could still be rendered by a worker thread
+        self._pause_event.set()
+        if self.__task is None or self.__task.done():
+            return None
+
+        self.__task.cancel()
+        return self.__task
+
+    def __resume_task(self) -> None:
+        self._pause_event.clear()
+        self.__start_task()
+
+    def __stop_task(self) -> asyncio.Task | None:
+        if self.__task is None or self.__task.done():
+            # not running, e.g. if it is paused
+            self.__ended.set()
+            return None
+
+        self.__task.cancel()
+        return self.__task
+
+    @property
+    def is_running(self) -> bool:
+        """
+        @return: True if the animation has not ended yet. Paused animations are still running.
+        """
+        if self.__runtime is None:
+            return self.is_alive()
+
+        return not self.__ended.is_set()
+
+    def wait_finished(self, timeout: float | None=None) -> bool:
+        """
+        Block until the animation has ended, no matter if it runs in its own thread or in a runtime.
+        @return: False if the timeout occurred before.
+        """
+        if self.__runtime is None:
+            self.join(timeout)
+            return not self.is_alive()
+
+        return self.__ended.wait(timeout)
+
+    @final
+    def _lease_frame(self) -> NDArray[np.uint8]:
+        """
+        Get a frame buffer from the frame pool. Fill it and put it onto the frame queue with _submit_frame.
+        Its content is undefined, so every pixel must be set.
+        """
+        return self.__frame_pool.lease()
+
+    @final
+    def _submit_frame(self, frame: NDArray[np.uint8]) -> None:
+        """
+        Put a leased frame buffer onto the frame queue. It is returned to the pool after it was displayed.
+        The frame is presented at its deadline for the current animation speed. If it's too late for that, it's dropped.
+        So the animation speed must be set before the frame is submitted.
+        """
+        envelope: FrameEnvelope = FrameEnvelope(frame=frame,
+                                                source_id=self.name,
+                                                presentation_time_ns=self.__frame_deadline_ns,
+                                                duration_ns=self.__animation_speed_ns,
+                                                ring=self.__frame_ring)
+        if self.__frame_ring is not None:
+            self.__frame_ring.push(envelope)
+
+        self._frame_queue.put(envelope)
+
+    @final
+    def _submit_frame_copy(self, frame: NDArray[np.uint8]) -> None:
+        """Copy the frame into a leased frame buffer and put that onto the frame queue."""
+        buffer: NDArray[np.uint8] = self._lease_frame()
+        np.copyto(buffer, frame)
+        self._submit_frame(buffer)
 
     def _set_animation_speed(self, animation_speed: float) -> None:
-        self.__animation_speed = animation_speed
+        self.__animation_speed_ns = int(animation_speed * 1e9)
+
+    def __render_cache_key(self) -> tuple:
+        variant_key: tuple | None = None
+        if self._settings.variant is not None:
+            variant_key = (self._settings.variant.name, str(self._settings.variant.value))
+
+            # a file could have been replaced by another one with the same name
+            if isinstance(self._settings.variant.value, Path):
+                try:
+                    stat_result = self._settings.variant.value.stat()
+                    variant_key += (stat_result.st_mtime_ns, stat_result.st_size)
+                except OSError:
+                    pass
+
+        return (type(self).__name__, variant_key, _get_parameter_key(self._settings), self._width, self._height)
+
+    def __update_variant_metadata(self, rendered_frames: RenderedFrames, only_missing: bool=False) -> None:
+        variant: AnimationVariant | None = self._settings.variant
+        if variant is None or not isinstance(variant.value, Path):
+            return
+
+        variant_index: VariantIndex | None = get_variant_index(type(variant))
+        if variant_index is None:
+            return
+
+        # the size of the source is only known if the variant was rendered
+        if only_missing and variant_index.get_metadata(variant.name) is not None:
+            return
+
+        width: int | None = None
+        height: int | None = None
+        if self._source_size is not None:
+            width, height = self._source_size
+
+        variant_index.set_metadata(variant.name, variant.value,
+                                   VariantMetadata(frame_count=len(rendered_frames.frames),
+                                                   duration=float(rendered_frames.hold_times.sum()),
+                                                   width=width,
+                                                   height=height))
+
+    @property
+    def _variant_metadata(self) -> VariantMetadata | None:
+        """
+        @return: The metadata of the variant from the variant index, if it was rendered before.
+        """
+        variant: AnimationVariant | None = self._settings.variant
+        if variant is None:
+            return None
+
+        variant_index: VariantIndex | None = get_variant_index(type(variant))
+        if variant_index is None:
+            return None
+
+        return variant_index.get_metadata(variant.name)
+
+    @final
+    def _set_frame_renderer(self, render: Callable[[], Iterator[tuple[float, NDArray[np.uint8]]]]) -> None:
+        """
+        Set how all frames of the animation are rendered. They are only rendered if they are not compiled or cached yet.
+        This can only be used if the frames depend on nothing else than the settings and the display size.
+        @param render: Yields the frames with the time in seconds they should be shown.
+        """
+        self.__frame_renderer = render
+
+        store_entry: tuple[str, list] | None = _get_frame_store_entry(self._settings, self._width, self._height)
+        if store_entry is not None:
+            self.__rendered_frames = FRAME_STORE.load(type(self).__name__, *store_entry)
+            if self.__rendered_frames is not None:
+                self.__update_variant_metadata(self.__rendered_frames, only_missing=True)
+                return
+
+        self.__rendered_frames = RENDER_CACHE.get(self.__render_cache_key())
+
+    @final
+    def _reserve_frames(self, frame_count: int) -> None:
+        """
+        The renderer can call this once it knows how many frames it renders.
+        So the memory for all frames is allocated at once.
+        """
+        if self.__frames_builder is not None:
+            self.__frames_builder.reserve(frame_count)
+
+    @final
+    def _iterate_rendered_frames(self) -> Generator[tuple[float, NDArray[np.uint8]], None, None]:
+        """
+        Generator function to iterate once through all frames with the time in seconds they should be shown.
+        The frames are rendered during the first iteration, afterwards the rendered frames are replayed.
+        """
+        if self.__rendered_frames is not None:
+            yield from zip(self.__rendered_frames.hold_times.tolist(), self.__rendered_frames.frames)
+            return
+
+        if self.__frame_renderer is None:
+            raise RuntimeError("The frame renderer of the animation is not set.")
+
+        self.__frames_builder = RenderedFramesBuilder(width=self._width, height=self._height)
+        try:
+            hold_time: float
+            frame: NDArray[np.uint8]
+            for hold_time, frame in self.__frame_renderer():
+                # the incomplete frames are not cached
+                if self._stop_event.is_set():
+                    return
+
+                try:
+                    frame = self.__frames_builder.append(hold_time, frame)
+                except ValueError as e:
+                    self.__log.warning("Skipped a frame that does not fit the display: %s", e)
+                    continue
+
+                yield (hold_time, frame)
+
+            self.__rendered_frames = self.__save_rendered_frames(self.__frames_builder.build())
+        finally:
+            self.__frames_builder = None
+
+    def __save_rendered_frames(self, rendered_frames: RenderedFrames) -> RenderedFrames:
+        self.__update_variant_metadata(rendered_frames)
+
+        # compiled frames are mapped from the page cache, so they don't need to be kept on the heap
+        group: str = type(self).__name__
+        store_entry: tuple[str, list] | None = _get_frame_store_entry(self._settings, self._width, self._height)
+        if store_entry is not None and FRAME_STORE.save(group, *store_entry, rendered_frames):
+            return FRAME_STORE.load(group, *store_entry) or rendered_frames
+
+        RENDER_CACHE.put(self.__render_cache_key(), rendered_frames)
+
+        return rendered_frames
+
+    @final
+    def compile_frames(self) -> RenderedFrames:
+        """
+        Render all frames at once, if they are not compiled or cached yet.
+        @return: All frames of the animation.
+        """
+        _frame: tuple[float, NDArray[np.uint8]]
+        for _frame in self._iterate_rendered_frames():
+            pass
+
+        if self.__rendered_frames is None:
+            raise RuntimeError("The animation was stopped before all frames were rendered.")
+
+        return self.__rendered_frames
 
     def pause(self) -> None:
-        self._pause_event.set()
+        if self.__runtime is not None:
+            task: asyncio.Task | None = self.__runtime.call(self.__pause_task)
+            # wait until the current frame is rendered
+            if task is not None and current_thread() is not self.__runtime:
+                self.__runtime.wait(task)
+        else:
+            self._pause_event.set()
+
+            # wait until the current frame is rendered
+            # the animation could also end meanwhile, if it presents the frames that were rendered ahead
+            while not self.__animation_paused.wait(timeout=0.1) and self.is_running:
+                pass
 
-        # wait until the current frame is rendered
-        self.__animation_paused.wait()
+        # the frames that were rendered ahead must not be presented while the animation is paused
+        if self.__frame_ring is not None:
+            self.__frame_ring.discard()
 
     def resume(self) -> None:
+        if self.__runtime is not None:
+            self.__runtime.call(self.__resume_task)
+            return
+
         self._pause_event.clear()
 
         # wait until the animation is running again
@@ -168,16 +680,17 @@ class AbstractAnimation(ABC, Thread):
     def stop_and_wait(self) -> None:
         self._stop_event.set()
 
-        # the current running animation could still try to insert new frames onto the frame queue
-        # but if we reach this point, no more frames should be generated
-        # to release the queue lock it must be cleared
-        while self._frame_queue.qsize() != 0:
-            try:
-                self._frame_queue.get_nowait()
-            except Empty:
-                break
+        if self.__runtime is not None:
+            task: asyncio.Task | None = self.__runtime.call(self.__stop_task)
+            # the task can't be awaited in the event loop itself
+            if task is not None and current_thread() is not self.__runtime:
+                self.__runtime.wait(task)
+        else:
+            self.wait_finished()
 
-        self.join()
+        # the stopped animation could still have frames on the frame queue, also the ones it put while stopping
+        # but if we reach this point, none of them should be displayed
+        self._frame_queue.discard(self.name)
 
     def is_next_iteration(self) -> bool:
         # no repeat
@@ -209,7 +722,7 @@ class AbstractAnimation(ABC, Thread):
 
 class AbstractAnimationController(ABC):
     __animation_name: ClassVar[str]
-    __animation_class: ClassVar[type[AbstractAnimation]]
+    __animation_class: ClassVar[type[AbstractAnimation] | str]
     __settings_class: ClassVar[type[AnimationSettings]]
     __accepts_dynamic_variant: ClassVar[bool]
     __is_repeat_supported: ClassVar[bool]
@@ -217,13 +730,19 @@ class AbstractAnimationController(ABC):
     __parameter_class: ClassVar[type[AnimationParameter] | None]
 
     def __init__(self, width: int, height: int,
-                 frame_queue: Queue, on_finish_callable: Callable[["AbstractAnimationController"], None]) -> None:
+                 frame_queue: FrameQueue, frame_pool: FramePool,
+                 on_finish_callable: Callable[["AbstractAnimationController"], None],
+                 runtime: AnimationRuntime | None=None) -> None:
         # width of frames to produce
         self.__width: int = width
         # height of frames to produce
         self.__height: int = height
         # queue to put frames onto
-        self.__frame_queue: Queue = frame_queue
+        self.__frame_queue: FrameQueue = frame_queue
+        # pool of the frame buffers that are put onto the queue
+        self.__frame_pool: FramePool = frame_pool
+        # the animations run in the event loop of this runtime, or in their own threads if it's None
+        self.__runtime: AnimationRuntime | None = runtime
         # this gets called whenever an animation stops/finishes
         self.__on_finish_callable: Callable[[AbstractAnimationController], None] = on_finish_callable
 
@@ -239,7 +758,7 @@ class AbstractAnimationController(ABC):
 
     def __init_subclass__(cls, *,
                           animation_name: str,
-                          animation_class: type[AbstractAnimation],
+                          animation_class: type[AbstractAnimation] | str,
                           settings_class: type[AnimationSettings],
                           accepts_dynamic_variant: bool,
                           is_repeat_supported: bool,
@@ -270,9 +789,24 @@ class AbstractAnimationController(ABC):
     @property
     def animation_class(self) -> type[AbstractAnimation]:
         """
-        @return: The animation class.
+        @return: The animation class. If it was given as 'module:class', the module gets imported on the first access.
         """
-        return self.__animation_class
+        if isinstance(self.__animation_class, str):
+            module_name, class_name = self.__animation_class.split(":", 1)
+            type(self).__animation_class = getattr(importlib.import_module(module_name), class_name)
+
+        return cast(type[AbstractAnimation], self.__animation_class)
+
+    @final
+    @property
+    def animation_class_name(self) -> str:
+        """
+        @return: The name of the animation class, without importing it.
+        """
+        if isinstance(self.__animation_class, str):
+            return self.__animation_class.rsplit(":", 1)[-1]
+
+        return self.__animation_class.__name__
 
     @final
     @property
@@ -320,7 +854,7 @@ class AbstractAnimationController(ABC):
     @property
     def settings(self) -> AnimationSettings:
         if (self._current_animation is not None and
-                self._current_animation[1].is_alive()):
+                self._current_animation[1].is_running):
             return self._current_animation[1].settings
 
         return self.default_settings
@@ -333,10 +867,10 @@ class AbstractAnimationController(ABC):
         """
         return self.__is_repeat_supported
 
-    def __refresh_variant_enum(self) -> None:
+    def __refresh_variant_enum(self, changed_path: Path | None=None) -> None:
         # this method should be called whenever a dynamic variant has changed
         if self.__variant_enum is not None:
-            type(self).__variant_enum = self.__variant_enum.refresh_variants()
+            type(self).__variant_enum = self.__variant_enum.refresh_variants(changed_path)
 
     @final
     def add_dynamic_variant(self, file_name: str, file_content: BytesIO) -> None:
@@ -353,7 +887,12 @@ class AbstractAnimationController(ABC):
         self._add_dynamic_variant(file_name, file_content)
 
         # refresh the variant enum class
-        self.__refresh_variant_enum()
+        variant_index: VariantIndex | None = (get_variant_index(self.__variant_enum)
+                                              if self.__variant_enum is not None else None)
+        self.__refresh_variant_enum(variant_index.search_dir / file_name if variant_index is not None else None)
+
+        # compile the new variant without blocking the upload
+        self.compile_variants_in_background()
 
     def _add_dynamic_variant(self, file_name: str, file_content: BytesIO) -> None:
         """
@@ -377,9 +916,10 @@ class AbstractAnimationController(ABC):
                 if (v.name == variant.name and
                         v.value == v.value):
                     self._remove_dynamic_variant(variant)
+                    FRAME_STORE.remove(self.animation_class_name, variant.name)
 
                     # refresh the variant enum class
-                    self.__refresh_variant_enum()
+                    self.__refresh_variant_enum(variant.value if isinstance(variant.value, Path) else None)
 
                     return
 
@@ -392,6 +932,59 @@ class AbstractAnimationController(ABC):
         """
         raise NotImplementedError
 
+    def compile_variants(self) -> None:
+        """
+        Compile all variants of the animation with their default parameters into the frame store.
+        So they don't need to be decoded when they are played. Variants that are up to date are skipped.
+        """
+        # only the uploaded variants are files that can be compiled
+        if not self.accepts_dynamic_variant or self.variant_enum is None:
+            return
+
+        variant: AnimationVariant
+        for variant in self.variant_enum:
+            settings: AnimationSettings = self.settings_class(variant=variant)
+
+            # this does not need to import the animation
+            store_entry: tuple[str, list] | None = _get_frame_store_entry(settings, self.__width, self.__height)
+            if store_entry is not None and FRAME_STORE.contains(self.animation_class_name, *store_entry):
+                continue
+
+            try:
+                # the animation is not started, only its frames are rendered
+                self.animation_class(
+                    width=self.__width, height=self.__height,
+                    frame_queue=self.__frame_queue,
+                    frame_pool=self.__frame_pool,
+                    settings=settings,
+                    logger=self.__log,
+                    on_finish_callable=lambda: None
+                ).compile_frames()
+            except Exception as e:  # pylint: disable=W0718
+                self.__log.warning("Could not compile the variant '%s': %s",
+                                   variant.name, e)
+
+    def __compile_variants_with_low_priority(self) -> None:
+        lower_thread_priority()
+        self.compile_variants()
+
+    def compile_variants_in_background(self) -> None:
+        Thread(target=self.__compile_variants_with_low_priority, daemon=True,
+               name=f"{self.animation_name}-compile").start()
+
+    def variant_metadata(self, variant: AnimationVariant) -> VariantMetadata | None:
+        """
+        @return: The metadata of a variant file, without decoding it. None if it was never rendered.
+        """
+        if self.variant_enum is None:
+            return None
+
+        variant_index: VariantIndex | None = get_variant_index(self.variant_enum)
+        if variant_index is None:
+            return None
+
+        return variant_index.get_metadata(variant.name)
+
     @property
     def is_running(self) -> bool:
         return self.__animation_running_event.is_set()
@@ -403,11 +996,14 @@ class AbstractAnimationController(ABC):
         animation_thread: AbstractAnimation = self.animation_class(
             width=self.__width, height=self.__height,
             frame_queue=self.__frame_queue,
+            frame_pool=self.__frame_pool,
             settings=animation_settings,
             logger=self.__log,
             on_finish_callable=self.__animation_finished
         )
         animation_uuid: UUID = uuid4()
+        # the name identifies the source of the frames
+        animation_thread.name = f"{self.animation_name}-{animation_uuid}"
         self.__animation_threads[animation_uuid] = animation_thread
 
         return animation_uuid
@@ -427,12 +1023,15 @@ class AbstractAnimationController(ABC):
         self.__animation_running_event.set()
 
         # start the animation thread
-        animation_thread.start()
+        if self.__runtime is None:
+            animation_thread.start()
+        else:
+            animation_thread.start_in(self.__runtime)
 
     def pause(self) -> UUID | None:
         if (self.__animation_running_event.is_set() and
                 self._current_animation is not None and
-                self._current_animation[1].is_alive()):
+                self._current_animation[1].is_running):
             self._current_animation[1].pause()
             self.__animation_running_event.clear()
 
@@ -467,7 +1066,7 @@ class AbstractAnimationController(ABC):
     def stop(self) -> None:
         # stop the animation if it's currently running.
         if (self._current_animation is not None and
-                self._current_animation[1].is_alive()):
+                self._current_animation[1].is_running):
             self._current_animation[1].stop_and_wait()
 
             # clear
@@ -486,7 +1085,7 @@ class AbstractAnimationController(ABC):
             self.__log.error("Could not find the animation to wait for.")
             return
 
-        animation_thread.join()
+        animation_thread.wait_finished()
 
     def __animation_finished(self) -> None:
         self.__log.info("Animation finished")
@@ -1,15 +1,16 @@
-from importlib import resources
+import importlib
+import pkgutil
 from logging import Logger
-from queue import Empty, LifoQueue, Queue
+from pkgutil import ModuleInfo
+from queue import Empty, LifoQueue
 from threading import Event, Thread
-from typing import cast
+from types import ModuleType
+from typing import Final, cast
 from uuid import UUID
 
-import numpy as np
-from numpy.typing import NDArray
-from simple_plugin_loader import Loader
-
-from led_matrix.animation.abstract import (AbstractAnimationController,
+from led_matrix import animations
+from led_matrix.animation.abstract import (AbstractAnimation,
+                                           AbstractAnimationController,
                                            AnimationParameter,
                                            AnimationSettings, AnimationVariant)
 from led_matrix.animation.dummy import DummyController
@@ -19,12 +20,22 @@ from led_matrix.animation.event import (AnimationEvent, AnimationEventQueue,
                                         AnimationStartEvent,
                                         AnimationStopEvent, ResumeSettings,
                                         StartSettings, StopSettings)
+from led_matrix.animation.render_cache import RENDER_CACHE
+from led_matrix.animation.runtime import AnimationRuntime
+from led_matrix.common.frame import FrameQueue
+from led_matrix.common.frame_pool import FramePool
 from led_matrix.common.log import LOG
+from led_matrix.common.threading import lower_thread_priority
 from led_matrix.config import Configuration
 
+# how many seconds after the start the uploaded variants are compiled
+# so the decoders of the animations are not imported while the application starts
+_COMPILE_DELAY: Final[float] = 60
+
 
 class MainAnimationController(Thread):
-    def __init__(self, config: Configuration, display_frame_queue: Queue[NDArray[np.uint8]]) -> None:
+    def __init__(self, config: Configuration,
+                 display_frame_queue: FrameQueue, frame_pool: FramePool) -> None:
         super().__init__(daemon=True)
 
         self.__log: Logger = LOG.create(MainAnimationController.__name__)
@@ -33,6 +44,14 @@ class MainAnimationController(Thread):
         self.__controll_queue: AnimationEventQueue = AnimationEventQueue()
         self.__pause_queue: LifoQueue[tuple[AbstractAnimationController, UUID]] = LifoQueue()
 
+        # all animations run in the event loop of this runtime if enabled, otherwise each in its own thread
+        self.__runtime: AnimationRuntime | None = AnimationRuntime() if config.main.animation_event_loop else None
+
+        # the budget of the render cache, which is shared by all animations
+        RENDER_CACHE.budget_bytes = config.main.render_cache_size * 1024 * 1024
+        # how many frames the animations render ahead
+        AbstractAnimation.render_ahead_frames = max(0, config.main.render_ahead_frames)
+
         # the current running animation
         self.__current_animation_controller: AbstractAnimationController | None = None
 
@@ -43,24 +62,23 @@ class MainAnimationController(Thread):
         dummy_animation: DummyController = DummyController(width=config.main.display_width,
                                                            height=config.main.display_height,
                                                            frame_queue=display_frame_queue,
-                                                           on_finish_callable=self.__on_animation_finished)
+                                                           frame_pool=frame_pool,
+                                                           on_finish_callable=self.__on_animation_finished,
+                                                           runtime=self.__runtime)
         self.__all_animation_controllers[dummy_animation.animation_name] = dummy_animation
 
         # load all available animations
-        with resources.as_file(resources.files("led_matrix.animations")) as animations_dir:
-            animation_loader: Loader = Loader()
-            animation_loader.load_plugins(path=str(animations_dir.resolve()),
-                                          plugin_base_class=AbstractAnimationController)
-
-
-
-        animation_cls: type[AbstractAnimationController]
-        for animation_cls in animation_loader.plugins.values():
-            animation_controller: AbstractAnimationController = animation_cls(
+        # only the light-weight modules that declare the animations are imported here
+        # the implementation of an animation is imported when it's started the first time
+        animation_controller_cls: type[AbstractAnimationController]
+        for animation_controller_cls in self.__find_animation_controllers():
+            animation_controller: AbstractAnimationController = animation_controller_cls(
                 width=config.main.display_width,
                 height=config.main.display_height,
                 frame_queue=display_frame_queue,
-                on_finish_callable=self.__on_animation_finished
+                frame_pool=frame_pool,
+                on_finish_callable=self.__on_animation_finished,
+                runtime=self.__runtime
             )
             self.__all_animation_controllers[animation_controller.animation_name] = animation_controller
 
@@ -87,6 +105,34 @@ class MainAnimationController(Thread):
             self.__default_animation_settings = dummy_animation.default_settings
 
 
+    def __find_animation_controllers(self) -> list[type[AbstractAnimationController]]:
+        animation_controller_classes: list[type[AbstractAnimationController]] = []
+
+        module_info: ModuleInfo
+        for module_info in pkgutil.iter_modules(animations.__path__, prefix=f"{animations.__name__}."):
+            # private modules contain the implementations of the animations
+            if module_info.name.rsplit(".", 1)[-1].startswith("_"):
+                continue
+
+            try:
+                module: ModuleType = importlib.import_module(module_info.name)
+            except ImportError as e:
+                self.__log.error("Can't import the animation module '%s'! (%s) -> Skipping it.",
+                                 module_info.name, e)
+                continue
+
+            attribute: object
+            for attribute in vars(module).values():
+                if (
+                    isinstance(attribute, type) and
+                    issubclass(attribute, AbstractAnimationController) and
+                    # skip the imported base class
+                    attribute.__module__ == module.__name__
+                ):
+                    animation_controller_classes.append(attribute)
+
+        return animation_controller_classes
+
     def __on_last_element_processed(self) -> AnimationEvent:
         # check for paused animations
         try:
@@ -122,7 +168,14 @@ class MainAnimationController(Thread):
                              event.event_settings.animation_name)
         else:
             # create the animation thread instance
-            animation_uuid: UUID = animation.create_animation(event.event_settings.animation_settings)
+            # this imports the implementation of the animation on its first start
+            animation_uuid: UUID
+            try:
+                animation_uuid = animation.create_animation(event.event_settings.animation_settings)
+            except ImportError as e:
+                self.__log.error("The animation '%s' could not be loaded! (%s)",
+                                 event.event_settings.animation_name, e)
+                return
 
             # check if the current animation should be paused
             if (
@@ -272,7 +325,27 @@ class MainAnimationController(Thread):
 
         return ""
 
+    def __compile_variants(self) -> None:
+        if self.__stop_event.wait(_COMPILE_DELAY):
+            return
+
+        lower_thread_priority()
+
+        animation_controller: AbstractAnimationController
+        for animation_controller in self.__all_animation_controllers.values():
+            if self.__stop_event.is_set():
+                return
+
+            animation_controller.compile_variants()
+
     def run(self) -> None:
+        if self.__runtime is not None:
+            self.__runtime.start()
+
+        # compile the uploaded variants once in the background, so they don't need to be decoded when they are played
+        # the animations that are played meanwhile are compiled on their first play anyway
+        Thread(target=self.__compile_variants, daemon=True, name="CompileVariants").start()
+
         # on start show default animation
         self.__create_start_event(animation_name=self.__default_animation_name,
                                   animation_settings=self.__default_animation_settings,
@@ -318,3 +391,12 @@ class MainAnimationController(Thread):
         # after the control thread has stopped, there could be an animation thread remaining
         # so stop this animation
         self.__stop_animation()
+
+        if self.__runtime is not None:
+            self.__runtime.stop()
+
+        self.__log.debug("Render cache: %d hits, %d misses, %d evictions, %d bytes used",
+                         RENDER_CACHE.statistics.hits,
+                         RENDER_CACHE.statistics.misses,
+                         RENDER_CACHE.statistics.evictions,
+                         RENDER_CACHE.size_bytes)
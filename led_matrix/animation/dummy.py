@@ -1,6 +1,6 @@
+import time
 from dataclasses import dataclass
 from logging import Logger
-from queue import Queue
 from typing import Callable, cast
 
 import numpy as np
@@ -10,6 +10,8 @@ from led_matrix.animation import DUMMY_ANIMATION_NAME
 from led_matrix.animation.abstract import (AbstractAnimation,
                                            AbstractAnimationController,
                                            AnimationSettings)
+from led_matrix.common.frame import FrameEnvelope, FrameQueue
+from led_matrix.common.frame_pool import FramePool
 
 
 @dataclass(kw_only=True)
@@ -19,10 +21,10 @@ class DummySettings(AnimationSettings):
 
 class DummyAnimation(AbstractAnimation):
     def __init__(self, width: int, height: int,
-                 frame_queue: Queue, settings: AnimationSettings,
+                 frame_queue: FrameQueue, frame_pool: FramePool, settings: AnimationSettings,
                  logger: Logger,
                  on_finish_callable: Callable[[], None]) -> None:
-        super().__init__(width, height, frame_queue, settings, logger, on_finish_callable)
+        super().__init__(width, height, frame_queue, frame_pool, settings, logger, on_finish_callable)
 
         self.__first_run: bool = True
 
@@ -30,9 +32,9 @@ class DummyAnimation(AbstractAnimation):
         # only on first run
         if self.__first_run:
             # clear the current display
-            frame: NDArray[np.uint8] = np.zeros((self._height, self._width, 3),
-                                                dtype=np.uint8)
-            self._frame_queue.put(frame)
+            frame: NDArray[np.uint8] = self._lease_frame()
+            frame.fill(0)
+            self._submit_frame(frame)
             self.__first_run = False
 
         # do nothing more here, but continue
@@ -42,7 +44,10 @@ class DummyAnimation(AbstractAnimation):
         # check stop and pause event
         if not (self._stop_event.is_set() or
                 self._pause_event.is_set()):
-            self._frame_queue.put(frame)
+            # external frames are presented immediately and until the next one arrives
+            self._frame_queue.put(FrameEnvelope(frame=frame,
+                                                source_id=self.name,
+                                                presentation_time_ns=time.monotonic_ns()))
 
 
 class DummyController(AbstractAnimationController,
@@ -0,0 +1,138 @@
+"""
+This module stores compiled animations on disk, so they don't need to be decoded again when they are played.
+"""
+import json
+from logging import Logger
+from pathlib import Path
+from typing import Any, Final
+
+import numpy as np
+from numpy.typing import NDArray
+
+from led_matrix import CACHE_DIR
+from led_matrix.animation.render_cache import RenderedFrames
+from led_matrix.common.atomic_file import replace_file
+from led_matrix.common.log import LOG
+
+_log: Logger = LOG.create("FrameStore")
+
+
+class FrameStore:
+    """
+    Every compiled animation consists of a .npy file with all frames and a small JSON header with their hold times.
+    The frames are memory-mapped for playing, so they are kept in the page cache instead of the heap.
+    """
+    # increase this if the format of the stored files changes
+    VERSION: Final[int] = 1
+
+    def __init__(self, directory: Path) -> None:
+        self.__directory: Path = directory
+
+    @staticmethod
+    def get_name(variant_name: str, key: str) -> str:
+        """
+        The name of a compiled animation in its group.
+        @param key: Distinguishes the compiled animations of one variant, e.g. by their size. It must not contain '@'.
+        """
+        return f"{variant_name}@{key}"
+
+    def __paths(self, group: str, name: str) -> tuple[Path, Path]:
+        base_path: Path = self.__directory / group / name
+        return (base_path.with_name(f"{base_path.name}.npy"), base_path.with_name(f"{base_path.name}.json"))
+
+    def __read_header(self, header_path: Path, source: list[Any]) -> dict[str, Any] | None:
+        try:
+            header: dict[str, Any] = json.loads(header_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+        if header.get("version") != FrameStore.VERSION or header.get("source") != source:
+            return None
+
+        return header
+
+    def contains(self, group: str, name: str, source: list[Any]) -> bool:
+        """Check if an animation is compiled and up to date, without mapping its frames."""
+        frames_path: Path
+        header_path: Path
+        frames_path, header_path = self.__paths(group, name)
+
+        return self.__read_header(header_path, source) is not None and frames_path.is_file()
+
+    def load(self, group: str, name: str, source: list[Any]) -> RenderedFrames | None:
+        """
+        Map the frames of a compiled animation.
+        @param source: Identifies the state of the source file. The frames are only loaded if it did not change.
+        @return: None if the animation is not compiled or is outdated.
+        """
+        frames_path: Path
+        header_path: Path
+        frames_path, header_path = self.__paths(group, name)
+
+        header: dict[str, Any] | None = self.__read_header(header_path, source)
+        if header is None:
+            return None
+
+        try:
+            frames: NDArray[np.uint8] = np.load(frames_path, mmap_mode="r")
+        except (OSError, ValueError):
+            return None
+
+        hold_times: NDArray[np.float64] = np.array(header.get("hold_times", []), dtype=np.float64)
+        # the frames could have been replaced after the header was read
+        if frames.shape[0] != header.get("frame_count") or len(hold_times) != frames.shape[0]:
+            return None
+
+        return RenderedFrames(frames=frames, hold_times=hold_times)
+
+    def save(self, group: str, name: str, source: list[Any], rendered_frames: RenderedFrames) -> bool:
+        """
+        Compile the rendered frames of an animation. A previous version gets replaced.
+        @return: True if the frames were stored.
+        """
+        # an empty file can't be memory-mapped
+        if len(rendered_frames.frames) == 0:
+            return False
+
+        frames_path: Path
+        header_path: Path
+        frames_path, header_path = self.__paths(group, name)
+
+        header: dict[str, Any] = {
+            "version": FrameStore.VERSION,
+            "source": source,
+            "frame_count": len(rendered_frames.frames),
+            "hold_times": rendered_frames.hold_times.tolist()
+        }
+
+        try:
+            frames_path.parent.mkdir(parents=True, exist_ok=True)
+
+            # the old files are replaced at once
+            # animations that currently play the old frames keep their mapping
+            replace_file(frames_path,
+                         lambda f: np.save(f, np.ascontiguousarray(rendered_frames.frames)),
+                         binary=True)
+            replace_file(header_path, lambda f: json.dump(header, f))
+        except OSError as e:
+            _log.warning("Could not store the compiled animation '%s/%s'.", group, name,
+                         exc_info=e)
+            return False
+
+        return True
+
+    def remove(self, group: str, variant_name: str) -> None:
+        """Remove all compiled animations of a variant."""
+        group_dir: Path = self.__directory / group
+        if not group_dir.is_dir():
+            return
+
+        stored_file: Path
+        for stored_file in group_dir.iterdir():
+            # the key is after the last '@', the variant name itself could contain one
+            if stored_file.suffix in (".npy", ".json") and stored_file.stem.rpartition("@")[0] == variant_name:
+                stored_file.unlink(missing_ok=True)
+
+
+# the compiled animations can be recreated from the variants at any time, so they are not stored persistently
+FRAME_STORE: Final[FrameStore] = FrameStore(CACHE_DIR / "compiled")
@@ -0,0 +1,174 @@
+"""
+This module caches the completely rendered frames of animations.
+So an animation that is played again with the same settings does not need to render its frames again.
+"""
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+from threading import Lock
+from typing import Final, NamedTuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+class RenderedFrames(NamedTuple):
+    # all frames in one contiguous array: number of frames x height x width x RGB
+    frames: NDArray[np.uint8]
+    # how long each frame is shown in seconds
+    hold_times: NDArray[np.float64]
+
+    @property
+    def nbytes(self) -> int:
+        return self.frames.nbytes + self.hold_times.nbytes
+
+
+class RenderedFramesBuilder:
+    """
+    Stack the frames one by one while they are rendered.
+    The frames are copied into the stack directly, so they are not kept twice in memory.
+    """
+    def __init__(self, width: int, height: int, capacity: int=16) -> None:
+        self.__shape: tuple[int, int, int] = (height, width, 3)
+
+        self.__frames: NDArray[np.uint8] = np.empty((max(1, capacity), *self.__shape), dtype=np.uint8)
+        self.__hold_times: NDArray[np.float64] = np.empty(max(1, capacity), dtype=np.float64)
+        self.__count: int = 0
+
+    def __len__(self) -> int:
+        return self.__count
+
+    def reserve(self, capacity: int) -> None:
+        """
+        Make room for the given number of frames at once, if it's known before all frames are rendered.
+        So the stack does not need to grow while the frames are appended.
+        """
+        if capacity <= len(self.__frames):
+            return
+
+        frames: NDArray[np.uint8] = np.empty((capacity, *self.__shape), dtype=np.uint8)
+        frames[:self.__count] = self.__frames[:self.__count]
+        self.__frames = frames
+
+        hold_times: NDArray[np.float64] = np.empty(capacity, dtype=np.float64)
+        hold_times[:self.__count] = self.__hold_times[:self.__count]
+        self.__hold_times = hold_times
+
+    def append(self, hold_time: float, frame: NDArray[np.uint8]) -> NDArray[np.uint8]:
+        """
+        @return: The frame in the stack.
+        @raise ValueError: If the frame does not match the size, it's not added then.
+        """
+        if frame.shape != self.__shape:
+            raise ValueError(f"The frame has the shape {frame.shape}, expected {self.__shape}.")
+
+        if self.__count == len(self.__frames):
+            self.reserve(2 * self.__count)
+
+        self.__frames[self.__count] = frame
+        self.__hold_times[self.__count] = hold_time
+        self.__count += 1
+
+        return self.__frames[self.__count - 1]
+
+    def build(self) -> RenderedFrames:
+        # only copy the stack if more room was reserved than needed
+        frames: NDArray[np.uint8] = self.__frames
+        hold_times: NDArray[np.float64] = self.__hold_times
+        if self.__count < len(frames):
+            frames = frames[:self.__count].copy()
+            hold_times = hold_times[:self.__count].copy()
+
+        return RenderedFrames(frames=frames, hold_times=hold_times)
+
+
+@dataclass(kw_only=True)
+class RenderCacheStatistics:
+    hits: int = 0
+    misses: int = 0
+    # number of entries that were removed to stay within the memory budget
+    evictions: int = 0
+
+
+class RenderCache:
+    """
+    A least recently used cache of rendered frames with a memory budget.
+    The cached frames are read-only, because they are shared by all runs of an animation.
+    """
+    def __init__(self, budget_bytes: int) -> None:
+        self.__lock: Lock = Lock()
+
+        self.__entries: OrderedDict[Hashable, RenderedFrames] = OrderedDict()
+        self.__size_bytes: int = 0
+        self.__budget_bytes: int = budget_bytes
+
+        self.__statistics: RenderCacheStatistics = RenderCacheStatistics()
+
+    @property
+    def budget_bytes(self) -> int:
+        return self.__budget_bytes
+
+    @budget_bytes.setter
+    def budget_bytes(self, budget_bytes: int) -> None:
+        with self.__lock:
+            self.__budget_bytes = budget_bytes
+            self.__evict()
+
+    @property
+    def size_bytes(self) -> int:
+        """The memory that is used by the cached frames."""
+        return self.__size_bytes
+
+    @property
+    def statistics(self) -> RenderCacheStatistics:
+        return self.__statistics
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def __evict(self) -> None:
+        # the lock must be held
+        while self.__entries and self.__size_bytes > self.__budget_bytes:
+            _key, rendered_frames = self.__entries.popitem(last=False)
+            self.__size_bytes -= rendered_frames.nbytes
+            self.__statistics.evictions += 1
+
+    def get(self, key: Hashable) -> RenderedFrames | None:
+        with self.__lock:
+            rendered_frames: RenderedFrames | None = self.__entries.get(key, None)
+            if rendered_frames is None:
+                self.__statistics.misses += 1
+                return None
+
+            self.__entries.move_to_end(key)
+            self.__statistics.hits += 1
+
+            return rendered_frames
+
+    def put(self, key: Hashable, rendered_frames: RenderedFrames) -> None:
+        # do not throw away everything for frames that do not fit anyway
+        if rendered_frames.nbytes > self.__budget_bytes:
+            return
+
+        rendered_frames.frames.flags.writeable = False
+        rendered_frames.hold_times.flags.writeable = False
+
+        with self.__lock:
+            replaced: RenderedFrames | None = self.__entries.pop(key, None)
+            if replaced is not None:
+                self.__size_bytes -= replaced.nbytes
+
+            self.__entries[key] = rendered_frames
+            self.__size_bytes += rendered_frames.nbytes
+
+            self.__evict()
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
+            self.__size_bytes = 0
+
+
+# the cache is shared by all animations of the process
+# its budget is set from the configuration by the animation controller
+RENDER_CACHE: Final[RenderCache] = RenderCache(budget_bytes=32 * 1024 * 1024)
@@ -0,0 +1,79 @@
+"""
+This module runs animations as tasks of one asyncio event loop, instead of one thread per animation.
+"""
+import asyncio
+from asyncio import AbstractEventLoop
+from concurrent.futures import ThreadPoolExecutor
+from threading import Thread, current_thread
+from typing import Callable, Coroutine, TypeVar
+
+R = TypeVar("R")
+
+
+class AnimationRuntime(Thread):
+    """
+    The thread of the event loop that drives the animations.
+    The animations are woken up by timers of the event loop only when their next frame is due.
+    Their frames are rendered by worker threads, so a slow render does not stall the other animations.
+    This saves the threads of the waiting animations, but not the thread switches: every frame is handed over to a
+    worker thread and back. The animations also remain Thread objects, they are just not started in this mode.
+    """
+    def __init__(self) -> None:
+        super().__init__(daemon=True, name=AnimationRuntime.__name__)
+
+        self.__loop: AbstractEventLoop = asyncio.new_event_loop()
+        # the threads are only started when they are needed
+        self.__executor: ThreadPoolExecutor = ThreadPoolExecutor(thread_name_prefix="AnimationRender")
+
+    @property
+    def loop(self) -> AbstractEventLoop:
+        return self.__loop
+
+    def run(self) -> None:
+        asyncio.set_event_loop(self.__loop)
+        try:
+            self.__loop.run_forever()
+        finally:
+            # cancel the remaining tasks
+            task: asyncio.Task
+            for task in asyncio.all_tasks(self.__loop):
+                task.cancel()
+            self.__loop.run_until_complete(asyncio.sleep(0))
+            self.__loop.close()
+
+            self.__executor.shutdown(wait=False, cancel_futures=True)
+
+    def call(self, func: Callable[[], R]) -> R:
+        """
+        Run the function in the event loop and wait for its result.
+        So it does not run concurrently to any animation.
+        """
+        if current_thread() is self:
+            return func()
+
+        async def wrapper() -> R:
+            return func()
+
+        return asyncio.run_coroutine_threadsafe(wrapper(), self.__loop).result()
+
+    def create_task(self, coroutine: Coroutine[None, None, None]) -> asyncio.Task:
+        """Start a task in the event loop. It must be called in the event loop (see call)."""
+        return self.__loop.create_task(coroutine)
+
+    def run_in_executor(self, func: Callable[..., R], *args) -> asyncio.Future[R]:
+        """
+        Run a function that could block in a worker thread. It must be called in the event loop.
+        @return: The future of the result, which can be awaited by a task.
+        """
+        return self.__loop.run_in_executor(self.__executor, func, *args)
+
+    def wait(self, task: asyncio.Task) -> None:
+        """Block until the task is done. Must not be called in the event loop."""
+        async def wait_task() -> None:
+            await asyncio.wait((task,))
+
+        asyncio.run_coroutine_threadsafe(wait_task(), self.__loop).result()
+
+    def stop(self) -> None:
+        self.__loop.call_soon_threadsafe(self.__loop.stop)
+        self.join()
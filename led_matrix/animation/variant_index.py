@@ -0,0 +1,235 @@
+"""
+This module keeps an index of the variant files of an animation directory on disk.
+So the directory does not need to be globbed and the variants don't need to be decoded to know their metadata.
+"""
+import json
+import os
+import stat
+from dataclasses import asdict, dataclass, field
+from fnmatch import fnmatchcase
+from logging import Logger
+from pathlib import Path
+from threading import Lock
+from typing import Any, Final
+
+from led_matrix.common.atomic_file import replace_file
+from led_matrix.common.log import LOG
+
+_log: Logger = LOG.create("VariantIndex")
+
+
+@dataclass(kw_only=True)
+class VariantMetadata:
+    frame_count: int
+    # the duration of one iteration in seconds
+    duration: float
+    # the size of the source, e.g. the image, if it is known
+    width: int | None = None
+    height: int | None = None
+
+
+@dataclass(kw_only=True)
+class _VariantIndexEntry:
+    path: str
+    mtime_ns: int
+    size: int
+    # gets filled when the variant was rendered
+    metadata: VariantMetadata | None = field(default=None)
+
+
+class VariantIndex:
+    """
+    The variants are identified by the stem of their file name.
+    On refresh only files that were added, removed or changed (by mtime and size) are updated,
+    the cached metadata of all other files is kept.
+    The directory is only scanned if its mtime has changed since the last scan, i.e. if files were added or removed.
+    """
+    # increase this if the format of the index file changes
+    VERSION: Final[int] = 2
+
+    def __init__(self, search_dir: Path, glob_str: str) -> None:
+        self.__search_dir: Path = search_dir.resolve()
+        self.__glob_str: str = glob_str
+        # the index is stored next to the directory, so it doesn't show up as a variant
+        self.__index_path: Path = self.__search_dir.with_name(f".{self.__search_dir.name}.index.json")
+
+        self.__lock: Lock = Lock()
+        # the mtime of the directory at the last scan, None if it was not scanned yet
+        self.__dir_mtime_ns: int | None = None
+        self.__entries: dict[str, _VariantIndexEntry] = self.__load()
+
+    @property
+    def search_dir(self) -> Path:
+        return self.__search_dir
+
+    @property
+    def variants(self) -> dict[str, Path]:
+        """The paths of the variants by their name, sorted by name."""
+        with self.__lock:
+            return {name: Path(entry.path) for name, entry in self.__entries.items()}
+
+    def __load(self) -> dict[str, _VariantIndexEntry]:
+        try:
+            index: dict[str, Any] = json.loads(self.__index_path.read_text(encoding="utf-8"))
+            if index.get("version") != VariantIndex.VERSION or index.get("glob") != self.__glob_str:
+                return {}
+
+            self.__dir_mtime_ns = index.get("dir_mtime_ns", None)
+
+            entries: dict[str, _VariantIndexEntry] = {}
+
+            name: str
+            entry: dict[str, Any]
+            for name, entry in index.get("variants", {}).items():
+                metadata: dict[str, Any] | None = entry.pop("metadata", None)
+                entries[name] = _VariantIndexEntry(**entry,
+                                                   metadata=VariantMetadata(**metadata) if metadata else None)
+
+            return entries
+        except (OSError, ValueError, TypeError):
+            # rebuild a missing or broken index on refresh
+            return {}
+
+    def __save(self) -> None:
+        # the lock must be held
+        index: dict[str, Any] = {
+            "version": VariantIndex.VERSION,
+            "glob": self.__glob_str,
+            "dir_mtime_ns": self.__dir_mtime_ns,
+            "variants": {name: asdict(entry) for name, entry in self.__entries.items()}
+        }
+
+        try:
+            replace_file(self.__index_path, lambda f: json.dump(index, f))
+        except OSError as e:
+            # the index gets rebuilt on the next start
+            _log.warning("Could not save the variant index '%s'.", self.__index_path,
+                         exc_info=e)
+
+    def __set_entries(self, entries: dict[str, _VariantIndexEntry]) -> None:
+        # the lock must be held
+        self.__entries = dict(sorted(entries.items(), key=lambda item: item[0].lower()))
+
+    @staticmethod
+    def __is_unchanged(known_entry: _VariantIndexEntry | None, entry: _VariantIndexEntry) -> bool:
+        return (
+            known_entry is not None and
+            (known_entry.path, known_entry.mtime_ns, known_entry.size) == (entry.path, entry.mtime_ns, entry.size)
+        )
+
+    def __get_dir_mtime_ns(self) -> int | None:
+        try:
+            return os.stat(self.__search_dir).st_mtime_ns
+        except OSError:
+            return None
+
+    def refresh(self, force: bool=False) -> None:
+        """
+        Update the index with the current content of the directory.
+        @param force: Scan the directory even if its mtime did not change, e.g. to detect files that were overwritten.
+        """
+        dir_mtime_ns: int | None = self.__get_dir_mtime_ns()
+        with self.__lock:
+            if not force and dir_mtime_ns is not None and dir_mtime_ns == self.__dir_mtime_ns:
+                return
+
+        found: dict[str, _VariantIndexEntry] = {}
+
+        try:
+            with os.scandir(self.__search_dir) as it:
+                dir_entry: os.DirEntry
+                for dir_entry in it:
+                    if not fnmatchcase(dir_entry.name, self.__glob_str) or not dir_entry.is_file():
+                        continue
+
+                    stat_result: os.stat_result = dir_entry.stat()
+                    found[Path(dir_entry.name).stem] = _VariantIndexEntry(path=dir_entry.path,
+                                                                          mtime_ns=stat_result.st_mtime_ns,
+                                                                          size=stat_result.st_size)
+        except OSError:
+            pass
+
+        with self.__lock:
+            changed: bool = found.keys() != self.__entries.keys()
+
+            name: str
+            entry: _VariantIndexEntry
+            for name, entry in found.items():
+                known_entry: _VariantIndexEntry | None = self.__entries.get(name, None)
+                if self.__is_unchanged(known_entry, entry):
+                    # keep the metadata of unchanged files
+                    entry.metadata = known_entry.metadata  # type: ignore
+                else:
+                    changed = True
+
+            self.__set_entries(found)
+
+            if dir_mtime_ns != self.__dir_mtime_ns:
+                self.__dir_mtime_ns = dir_mtime_ns
+                changed = True
+
+            if changed:
+                self.__save()
+
+    def refresh_file(self, path: Path) -> None:
+        """
+        Update only the entry of a single file of the directory, e.g. after it was added or removed.
+        The directory is not scanned for this, so the next refresh scans it once.
+        """
+        if path.resolve().parent != self.__search_dir:
+            return
+
+        file_path: str = str(self.__search_dir / path.name)
+        name: str = path.stem
+
+        entry: _VariantIndexEntry | None = None
+        if fnmatchcase(path.name, self.__glob_str):
+            try:
+                stat_result: os.stat_result = os.stat(file_path)
+                if stat.S_ISREG(stat_result.st_mode):
+                    entry = _VariantIndexEntry(path=file_path,
+                                               mtime_ns=stat_result.st_mtime_ns,
+                                               size=stat_result.st_size)
+            except OSError:
+                pass
+
+        with self.__lock:
+            known_entry: _VariantIndexEntry | None = self.__entries.get(name, None)
+
+            if entry is None:
+                # another file with the same name is not affected
+                if known_entry is None or known_entry.path != file_path:
+                    return
+
+                del self.__entries[name]
+            else:
+                if self.__is_unchanged(known_entry, entry):
+                    return
+
+                self.__set_entries(self.__entries | {name: entry})
+
+            self.__save()
+
+    def get_metadata(self, name: str) -> VariantMetadata | None:
+        with self.__lock:
+            entry: _VariantIndexEntry | None = self.__entries.get(name, None)
+            return entry.metadata if entry is not None else None
+
+    def set_metadata(self, name: str, path: Path, metadata: VariantMetadata) -> None:
+        """Store the metadata of a variant. It's ignored if the file has changed since the last refresh."""
+        try:
+            stat_result: os.stat_result = path.stat()
+        except OSError:
+            return
+
+        with self.__lock:
+            entry: _VariantIndexEntry | None = self.__entries.get(name, None)
+            if (
+                entry is None or
+                (entry.mtime_ns, entry.size) != (stat_result.st_mtime_ns, stat_result.st_size) or
+                entry.metadata == metadata
+            ):
+                return
+
+            entry.metadata = metadata
+            self.__save()
@@ -0,0 +1,203 @@
+import errno
+import os
+from dataclasses import dataclass, field
+from io import TextIOWrapper
+from logging import Logger
+from pathlib import Path
+from typing import Callable, Generator, cast
+
+import numpy as np
+from numpy.typing import NDArray
+
+from led_matrix.animation.abstract import AbstractAnimation, AnimationSettings
+from led_matrix.animation.variant_index import VariantMetadata
+from led_matrix.animations.blm import BlmParameter
+from led_matrix.common.frame import FrameQueue
+from led_matrix.common.frame_pool import FramePool
+
+
+@dataclass(kw_only=True)
+class _BlmFrame:
+    hold: int
+    text_frame: list[list[str]]
+    frame: NDArray[np.uint8] = field(init=False)
+    is_valid: bool = field(init=False, default=True)
+
+    def __post_init__(self):
+        try:
+            self.frame = np.array(self.text_frame, dtype=np.uint8)
+        except ValueError:
+            self.is_valid = False
+
+
+class BlmAnimation(AbstractAnimation, render_ahead=True):
+    def __init__(self, width: int, height: int,
+                 frame_queue: FrameQueue, frame_pool: FramePool, settings: AnimationSettings,
+                 logger: Logger,
+                 on_finish_callable: Callable[[], None]) -> None:
+        super().__init__(width, height, frame_queue, frame_pool, settings, logger, on_finish_callable)
+
+        if self._settings.variant is None:
+            raise RuntimeError("Started BLM animation without a variant.")
+
+        self.__path: Path = self._settings.variant.value
+
+        if not self.__path.is_file():
+            raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), self.__path)
+
+        parameter: BlmParameter = cast(BlmParameter, self._settings.parameter)
+        self.__foregound_color: tuple[int, int, int] = parameter.foregound_color.pil_tuple
+        self.__background_color: tuple[int, int, int] = parameter.background_color.pil_tuple
+        self.__padding_color: tuple[int, int, int] = parameter.padding_color.pil_tuple
+
+        # the file is only parsed during the first iteration, if the animation is not compiled or cached
+        self._set_frame_renderer(self.__render_frames)
+
+        self.__frame_generator: Generator[tuple[float, NDArray[np.uint8]], None, None] = self._iterate_rendered_frames()
+
+    def __get_frame_info(self) -> tuple[int, float]:
+        """
+        @return: The number of frames and the duration of one iteration in seconds.
+                 The frames are not rendered for this, if the variant was not rendered before only the file is parsed.
+        """
+        metadata: VariantMetadata | None = self._variant_metadata
+        if metadata is not None:
+            return (metadata.frame_count, metadata.duration)
+
+        blm_frames: list[_BlmFrame] = self.__load_frames()
+        return (len(blm_frames), sum(frame.hold for frame in blm_frames) / 1000)
+
+    def intrinsic_duration(self) -> float:
+        return self.__get_frame_info()[1]
+
+    def __str__(self) -> str:
+        frame_count: int
+        duration: float
+        (frame_count, duration) = self.__get_frame_info()
+
+        # pylint: disable=C0209
+        return "Path: {} file: {} frames: {} shape: {} duration: {}\n".format(
+            self.__path,
+            f"blm.{self.__path.stem}",
+            str(frame_count),
+            (
+                (self._height, self._width)
+                if frame_count > 0
+                else "no frames available"
+            ),
+            duration
+        )
+
+    def __load_frames(self) -> list[_BlmFrame]:
+        blm_frames: list[_BlmFrame] = []
+
+        f: TextIOWrapper
+        with self.__path.open(encoding='latin1') as f:
+            hold: int = 0
+            frame: list[list[str]] = []
+
+            line: str
+            for line in f:
+                line = line.strip()
+
+                if line.startswith('#'):
+                    continue
+
+                if line.startswith("@"):
+                    if len(frame) > 0:
+                        blm_frames.append(_BlmFrame(hold=hold,
+                                                    text_frame=frame))
+
+                    hold = int(line[1:])
+                    # reset frame
+                    frame = []
+                    continue
+
+                if len(line):
+                    frame.append(list(line))
+
+            if len(frame) > 0:
+                blm_frames.append(_BlmFrame(hold=hold,
+                                            text_frame=frame))
+
+        if len(blm_frames) == 0:
+            raise AttributeError
+
+        return blm_frames
+
+    def render_next_frame(self) -> bool:
+        next_frame: tuple[float, NDArray[np.uint8]] | None = next(self.__frame_generator, None)
+
+        if next_frame is not None:
+            # the speed defines how long the frame is shown
+            self._set_animation_speed(next_frame[0])
+            self._submit_frame_copy(next_frame[1])
+
+            # maybe there's still more to render
+            return True
+
+        if self.is_next_iteration():
+            # recreate frame generator if another iteration should be started
+            self.__frame_generator = self._iterate_rendered_frames()
+
+        # the current iteration has no frames left
+        return False
+
+    def __render_frames(self) -> Generator[tuple[float, NDArray[np.uint8]], None, None]:
+        """
+        Generator function to render all frames of the file.
+        Cropped to fit matrix size.
+        """
+        blm_frames: list[_BlmFrame] = self.__load_frames()
+        self._reserve_frames(len(blm_frames))
+
+        frame: _BlmFrame
+        for frame in blm_frames:
+            if self._source_size is None:
+                self._source_size = (frame.frame.shape[1], frame.frame.shape[0])
+
+            array: NDArray[np.uint8] = frame.frame
+            array = np.dstack((array, array, array))
+
+            # indices where to find the ones and the zeros in the frame
+            # needed to replace with a color
+            ones: NDArray[np.bool_] = array == 1
+            zeros: NDArray[np.bool_] = array == 0
+
+            np.putmask(array, ones, self.__foregound_color)
+            np.putmask(array, zeros, self.__background_color)
+
+            h: int
+            w: int
+            (h, w, _b) = array.shape
+
+            diff_h: int = h - self._height
+            diff_w: int = w - self._width
+
+            diff_h_top: int = abs(diff_h // 2)
+            diff_h_bottom: int = abs(diff_h) - diff_h_top
+
+            diff_w_left: int = abs(diff_w // 2)
+            diff_w_right: int = abs(diff_w) - diff_w_left
+
+            # print(h, w, b, diff_h, diff_w, diff_h_top, diff_h_bottom,
+            #      diff_w_left, diff_w_right)
+
+            # first crop array
+            if diff_h > 0:
+                array = array[diff_h_top:-diff_h_bottom, :, :]
+            if diff_w > 0:
+                array = array[:, diff_w_left:-diff_w_right, :]
+
+            # then pad it
+            pad: NDArray[np.uint8]
+            if diff_h < 0:
+                pad = np.full((self._height, self._width, 3), fill_value=self.__padding_color, dtype=np.uint8)
+                pad[diff_h_top:array.shape[0]+diff_h_top, :, :] = array
+                array = pad
+            if diff_w < 0:
+                pad = np.full((self._height, self._width, 3), fill_value=self.__padding_color, dtype=np.uint8)
+                pad[:, diff_w_left:array.shape[1]+diff_w_left, :] = array
+                array = pad
+
+            yield (frame.hold / 1000, array)
@@ -0,0 +1,328 @@
+import errno
+import os
+from configparser import ConfigParser
+from dataclasses import InitVar, dataclass, field
+from logging import Logger
+from pathlib import Path
+from typing import Callable, Generator, cast
+
+import numpy as np
+from numpy.typing import NDArray
+from PIL import Image as pil
+from PIL.Image import Image
+
+from led_matrix.animation.abstract import AbstractAnimation, AnimationSettings
+from led_matrix.animation.variant_index import VariantMetadata
+from led_matrix.animations.gameframe import GameframeParameter
+from led_matrix.common.frame import FrameQueue
+from led_matrix.common.frame_pool import FramePool
+
+
+@dataclass(kw_only=True)
+class _GameframeConfig:
+    hold: int = field(default=100, init=False)
+    loop: bool = field(default=True, init=False)
+    move_x: int = field(default=0, init=False)
+    move_y: int = field(default=0, init=False)
+    move_loop: bool = field(default=False, init=False)
+    pan_off: bool = field(default=False, init=False)
+    next_folder: Path | None = field(default=None, init=False)
+
+    gameframe_dir: InitVar[Path]
+
+    def __post_init__(self, gameframe_dir: Path) -> None:
+        config_file: Path = gameframe_dir / "config.ini"
+
+        if config_file.is_file():
+            parser: ConfigParser = ConfigParser()
+
+            try:
+                # first try utf-8 encoding
+                parser.read(str(config_file), encoding="utf-8")
+            except UnicodeDecodeError:
+                # after that try windows encoding
+                parser.read(str(config_file), encoding="cp1252")
+
+            self.hold = int(parser.get('animation', 'hold', fallback='100'))
+            self.loop = parser.getboolean('animation', 'loop', fallback=True)
+            self.move_x = int(parser.get('translate', 'moveX', fallback='0'))
+            self.move_y = int(parser.get('translate', 'moveY', fallback='0'))
+            self.move_loop = parser.getboolean('translate', 'loop', fallback=False)
+            self.pan_off = parser.getboolean('translate', 'panoff', fallback=False)
+
+            next_folder_name: str | None = parser.get('translate', 'nextFolder', fallback=None)
+            if next_folder_name is not None:
+                self.next_folder = Path(next_folder_name)
+
+
+class GameframeAnimation(AbstractAnimation, render_ahead=True):
+    def __init__(self, width: int, height: int,
+                 frame_queue: FrameQueue, frame_pool: FramePool, settings: AnimationSettings,
+                 logger: Logger,
+                 on_finish_callable: Callable[[], None]) -> None:
+        super().__init__(width, height, frame_queue, frame_pool, settings, logger, on_finish_callable)
+
+        if self._settings.variant is None:
+            raise RuntimeError("Started Gameframe animation without a variant.")
+
+        self.__gameframe_dir: Path = self._settings.variant.value
+
+        if not self.__gameframe_dir.is_dir():
+            raise NotADirectoryError(errno.ENOTDIR, os.strerror(errno.ENOTDIR), self.__gameframe_dir)
+        self.__name: str = f"gameframe.{self.__gameframe_dir.name}"
+
+        self.__background_color: tuple[int, int, int] = cast(GameframeParameter,
+                                                             self._settings.parameter).background_color.pil_tuple
+
+        self.__gameframe_config: _GameframeConfig = _GameframeConfig(gameframe_dir=self.__gameframe_dir)
+
+        # the global crop coordinates for the single images, if multiple images are placed in one
+        self.__global_crop_x: int = 0
+        self.__global_crop_y: int = 0
+        if self.__gameframe_config.move_x > 0:
+            self.__global_crop_x = abs(int((self._width - self.__gameframe_config.move_x) / 2))
+        if self.__gameframe_config.move_y > 0:
+            self.__global_crop_y = abs(int((self._height - self.__gameframe_config.move_y) / 2))
+
+        # the images are only loaded during the first iteration, if the animation is not compiled or cached
+        self._set_frame_renderer(self.__render_frames)
+
+        if not (self.__gameframe_config.loop or self.__gameframe_config.move_loop):
+            self._repeat = 0
+
+        self.__frame_generator: Generator[tuple[float, NDArray[np.uint8]], None, None] = self._iterate_rendered_frames()
+
+    def __frame_count(self) -> int:
+        # the frames are not rendered for this, if the variant was not rendered before only the image sizes are read
+        metadata: VariantMetadata | None = self._variant_metadata
+        if metadata is not None:
+            return metadata.frame_count
+
+        frame_shapes: list[tuple[int, int]] = []
+
+        bmp_file: Path
+        for bmp_file in self.__get_bmp_files():
+            image: Image
+            with pil.open(bmp_file) as image:
+                frame_shapes.append(self.__get_frame_shape(image))
+
+        return sum(1 for _ in self.__frame_windows(frame_shapes))
+
+    def intrinsic_duration(self) -> float:
+        metadata: VariantMetadata | None = self._variant_metadata
+        if metadata is not None:
+            return metadata.duration
+
+        return self.__frame_count() * self.__gameframe_config.hold / 1000
+
+    def __str__(self) -> str:
+        frame_count: int = self.__frame_count()
+
+        # pylint: disable=C0209
+        return (
+            "Path: {}\n"
+            "Name: {} frames: {} shape: {}\n"
+            "hold: {} loop: {} moveX: {} moveY: {} moveloop: {} panoff: {}\n".format(
+                self.__gameframe_dir,
+                self.__name,
+                str(frame_count),
+                (
+                    (self._height, self._width, 3)
+                    if frame_count > 0
+                    else "no frames available",
+                ),
+                self.__gameframe_config.hold,
+                self.__gameframe_config.loop,
+                self.__gameframe_config.move_x,
+                self.__gameframe_config.move_y,
+                self.__gameframe_config.move_loop,
+                self.__gameframe_config.pan_off
+            )
+        )
+
+    def __get_bmp_files(self) -> list[Path]:
+        return sorted(self.__gameframe_dir.glob("*.bmp"), key=lambda bmpfile: int(bmpfile.stem))
+
+    def __get_frame_shape(self, image: Image) -> tuple[int, int]:
+        """
+        @return: The (height, width) of the frame that is loaded from the image.
+        """
+        if self.__gameframe_config.move_x > 0 or self.__gameframe_config.move_y > 0:
+            return (image.height, image.width)
+
+        return (self._height, self._width)
+
+    def __load_frames(self) -> list[NDArray[np.uint8]]:
+        frames: list[NDArray[np.uint8]] = []
+
+        bmp_file: Path
+        for bmp_file in self.__get_bmp_files():
+            with open(str(bmp_file), 'rb') as f:
+                image: Image = pil.open(f)
+
+            if self._source_size is None:
+                self._source_size = image.size
+
+            background_img: Image
+            # if move_x or move_y are set, than multiple images are placed in one
+            if self.__gameframe_config.move_x > 0 or self.__gameframe_config.move_y > 0:
+                background_img = pil.new(mode='RGB', size=image.size, color=self.__background_color)
+                background_img.paste(image)
+            else:
+                # center (crop) image
+                background_img = pil.new(mode='RGB',
+                                         size=(self._width, self._height),
+                                         color=self.__background_color)
+
+                x: int = int((self._width - image.width) / 2)
+                y: int = int((self._height - image.height) / 2)
+
+                background_img.paste(image, (x, y))
+
+            frames.append(np.array(background_img))
+
+            # free memory
+            del image
+
+        if len(frames) == 0:
+            raise AttributeError
+
+        return frames
+
+    def __render_frames(self) -> Generator[tuple[float, NDArray[np.uint8]], None, None]:
+        """Generator function to render all frames of the gameframe directory"""
+        frame_list: list[NDArray[np.uint8]] = self.__load_frames()
+        hold: float = self.__gameframe_config.hold / 1000
+
+        i: int
+        x: int
+        y: int
+        for i, x, y in self.__frame_windows([frame.shape[:2] for frame in frame_list]):
+            frame: NDArray[np.uint8] = frame_list[i]
+
+            if self.__gameframe_config.pan_off:
+                h: int
+                w: int
+                if self.__gameframe_config.move_x != 0:
+                    (h, w, _b) = frame.shape
+                    frame = np.pad(frame,
+                                   ((0, 0), (w, w), (0, 0)),
+                                   'constant', constant_values=0)
+
+                if self.__gameframe_config.move_y != 0:
+                    (h, w, _b) = frame.shape
+                    frame = np.pad(frame,
+                                   ((h, h), (0, 0), (0, 0)),
+                                   'constant', constant_values=0)
+
+            yield (hold, frame[y:y+self._height, x:x+self._width, :])
+
+    def __frame_windows(self, frame_shapes: list[tuple[int, int]]) -> Generator[tuple[int, int, int], None, None]:
+        """
+        Generator function to iterate through the frames of one iteration.
+        Yields the index of the loaded frame and the (x, y) position of the display window in it.
+        Only the (height, width) of the loaded frames is needed, so the frames can be counted without loading them.
+        """
+        i: int = 0
+        end: int = len(frame_shapes)
+
+        x: int = self.__global_crop_x
+        y: int = self.__global_crop_y
+
+        delta_x: int = self._width
+        delta_y: int = self._height
+
+        if end:
+            while True:
+                h: int
+                w: int
+                (h, w) = frame_shapes[i]
+
+                # the frames are padded on both sides
+                if self.__gameframe_config.pan_off:
+                    if self.__gameframe_config.move_x != 0:
+                        w *= 3
+
+                    if self.__gameframe_config.move_y != 0:
+                        h *= 3
+
+                if self.__gameframe_config.move_x >= 0:
+                    cur_x = w - delta_x - x
+                else:
+                    cur_x = x
+
+                if self.__gameframe_config.move_y >= 0:
+                    cur_y = y
+                else:
+                    cur_y = h - delta_y - y
+
+                # the same as slicing the frame, which could be empty
+                if not range(h)[cur_y:cur_y+delta_y] or not range(w)[cur_x:cur_x+delta_x]:
+                    break
+
+                yield (i, cur_x, cur_y)
+                i += 1
+                x += abs(self.__gameframe_config.move_x)
+                y += abs(self.__gameframe_config.move_y)
+
+                if (
+                    (self.__gameframe_config.move_x > 0 and cur_x <= 0)
+                    or
+                    (self.__gameframe_config.move_x < 0 and cur_x >= (w - delta_x))
+                ):
+                    break
+                    # if self.__move_loop:
+                    #     x = 0
+
+                if (
+                    (self.__gameframe_config.move_y > 0 and (cur_y + delta_y) >= h)
+                    or
+                    (self.__gameframe_config.move_y < 0 and cur_y <= 0)
+                ):
+                    # if self.__move_loop:
+                    #     y = 0
+                    break
+
+                # if i == end:
+                #     if self.__loop or self.__move_loop:
+                #         i = 0
+                #     else:
+                #         break
+                if i == end:
+                    if (
+                        (self.__gameframe_config.loop or self.__gameframe_config.move_loop)
+                        and
+                        (
+                            (
+                                (self.__gameframe_config.move_x > 0 and cur_x > 0)
+                                or
+                                (self.__gameframe_config.move_x < 0 and cur_x < (w - delta_x))
+                            ) or
+                            (
+                                (self.__gameframe_config.move_y > 0 and (cur_y + delta_y) < h)
+                                or
+                                (self.__gameframe_config.move_y < 0 and cur_y > 0)
+                            )
+                        )
+                    ):
+                        i = 0
+                    else:
+                        break
+
+    def render_next_frame(self) -> bool:
+        next_frame: tuple[float, NDArray[np.uint8]] | None = next(self.__frame_generator, None)
+
+        if next_frame is not None:
+            # the speed defines how long the frame is shown
+            self._set_animation_speed(next_frame[0])
+            self._submit_frame_copy(next_frame[1])
+
+            # maybe there's still more to render
+            return True
+
+        if self.is_next_iteration():
+            # recreate frame generator if another iteration should be started
+            self.__frame_generator = self._iterate_rendered_frames()
+
+        # the current iteration has no frames left
+        return False
@@ -0,0 +1,142 @@
+from enum import Enum, auto
+from logging import Logger
+from pathlib import Path
+from threading import TIMEOUT_MAX
+from typing import Callable, Generator
+
+import numpy as np
+from numpy.typing import NDArray
+from PIL import Image as pil
+from PIL.Image import Image
+
+from led_matrix.animation.abstract import AbstractAnimation, AnimationSettings
+from led_matrix.common.color import Color
+from led_matrix.common.frame import FrameQueue
+from led_matrix.common.frame_pool import FramePool
+
+
+class _PictureType(Enum):
+    PNG = auto()
+    GIF = auto()
+
+
+class PictureAnimation(AbstractAnimation, render_ahead=True):
+    def __init__(self, width: int, height: int,
+                 frame_queue: FrameQueue, frame_pool: FramePool, settings: AnimationSettings,
+                 logger: Logger,
+                 on_finish_callable: Callable[[], None]) -> None:
+        super().__init__(width, height, frame_queue, frame_pool, settings, logger, on_finish_callable)
+
+        if self._settings.variant is None:
+            raise RuntimeError("Started Gameframe animation without a variant.")
+
+        self.__picture_path: Path = self._settings.variant.value
+
+        # the image is only opened during the first iteration, if the animation is not compiled or cached
+        self.__image: Image
+        self.__picture_type: _PictureType
+
+        if self.__picture_path.suffix == ".gif":
+            self.__picture_type = _PictureType.GIF
+
+            self._set_frame_renderer(self.__get_gif_frames)
+
+        elif self.__picture_path.suffix == ".png":
+            self.__picture_type = _PictureType.PNG
+
+            # showing a static image means we don't need to refresh anything
+            self._repeat = -1
+
+            self._set_frame_renderer(self.__get_png_frames)
+
+        else:
+            self._log.error(f"Only PNG and GIF images supported, not '{self.__picture_path.suffix}'.")
+            raise ValueError
+
+        self.__frame_generator: Generator[tuple[float, NDArray[np.uint8]], None, None] = self._iterate_rendered_frames()
+
+    def __get_animation_speed(self) -> float:
+        try:
+            return int(self.__image.info["duration"]) / 1000
+        except KeyError:
+            self._log.warning("GIF has no duration in info.")
+        except (TypeError, ValueError):
+            self._log.warning(f"Cannot convert info[duration]: {self.__image.info['duration']} to int.")
+
+        # default 15 fps
+        return 1/15
+
+    def __convert_any_to_rgb(self, image: Image) -> Image:
+        bands: tuple[str, ...] = image.getbands()
+
+        if bands == ('R', 'G', 'B', 'A'):
+            background = pil.new('RGB', image.size, Color(0, 0, 0).pil_tuple)
+            background.paste(image, mask=image.split()[3])
+            return background
+
+        if bands != ('R', 'G', 'B'):
+            return image.convert('RGB')
+
+        return image
+
+    def __resize_image(self, image: Image, size: tuple[int, int]) -> Image:
+        if image.size != size:
+            image.thumbnail(size=size)
+            frame: Image = pil.new("RGB", size=size)
+
+            img_w, img_h = image.size
+            bg_w, bg_h = frame.size
+            offset: tuple[int, int] = ((bg_w - img_w) // 2, (bg_h - img_h) // 2)
+
+            frame.paste(image, box=offset)
+
+            return frame
+
+        return image
+
+    def __get_png_frames(self) -> Generator[tuple[float, NDArray[np.uint8]], None, None]:
+        self.__image = pil.open(self.__picture_path)
+        self._source_size = self.__image.size
+        self.__image = self.__convert_any_to_rgb(self.__image)
+        self.__image = self.__resize_image(self.__image, (self._width, self._height))
+
+        # the static image is shown until the animation is stopped
+        yield (TIMEOUT_MAX, np.array(self.__image))
+
+    def __get_gif_frames(self) -> Generator[tuple[float, NDArray[np.uint8]], None, None]:
+        self.__image = pil.open(self.__picture_path)
+        self._source_size = self.__image.size
+        self._reserve_frames(getattr(self.__image, "n_frames", 1))
+
+        more_frames: bool = True
+        while more_frames:
+            frame: Image = pil.new("RGBA", self.__image.size)
+            frame.paste(self.__image)
+            frame = self.__convert_any_to_rgb(frame)
+            frame = self.__resize_image(frame, (self._width, self._height))
+
+            try:
+                self.__image.seek(self.__image.tell() + 1)
+            except EOFError:
+                more_frames = False
+                self.__image.seek(0)
+
+            yield (self.__get_animation_speed(), np.array(frame))
+
+    def render_next_frame(self) -> bool:
+        next_frame: tuple[float, NDArray[np.uint8]] | None = next(self.__frame_generator, None)
+
+        if next_frame is not None:
+            # the speed defines how long the frame is shown
+            self._set_animation_speed(next_frame[0])
+            self._submit_frame_copy(next_frame[1])
+
+            # maybe there's still more to render
+            return True
+
+        if self.is_next_iteration():
+            # recreate frame generator if another iteration should be started
+            self.__frame_generator = self._iterate_rendered_frames()
+
+        # the current iteration has no frames left
+        return False
@@ -0,0 +1,28 @@
+"""
+This module replaces files at once, so readers never see a partially written file.
+"""
+from pathlib import Path
+from typing import IO, Any, Callable
+from uuid import uuid4
+
+
+def replace_file(path: Path, write: Callable[[IO[Any]], None], binary: bool=False) -> None:
+    """
+    Write the file to a temporary path next to it and replace the old file with it.
+    Only open() and the methods of Path are used, because they handle the storage of Alpine Linux diskless setups.
+    @param write: Writes the content to the opened temporary file.
+    @param binary: True if the file is opened in binary mode, otherwise it's opened as UTF-8 text.
+    @raise OSError: If the file could not be written. The temporary file is removed in this case.
+    """
+    tmp_path: Path = path.with_name(f".{path.name}.{uuid4().hex}.tmp")
+
+    try:
+        # the mode must be passed positionally, because the patched open() of Alpine Linux only checks that
+        f: IO[Any]
+        with (open(tmp_path, "wb") if binary else open(tmp_path, "w", encoding="utf-8")) as f:
+            write(f)
+
+        tmp_path.replace(path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
@@ -0,0 +1,197 @@
+import time
+from collections import deque
+from threading import Lock
+from typing import Callable, NamedTuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from led_matrix.common.threading import InterruptibleQueue
+
+
+class FrameEnvelope(NamedTuple):
+    """A frame with the information when it should be presented."""
+    frame: NDArray[np.uint8]
+    # identifies the producer of the frame, e.g. the animation
+    source_id: str
+    # the time (of time.monotonic_ns) at which the frame should be presented
+    presentation_time_ns: int
+    # how long the frame should be presented
+    # None if it is valid until the next frame arrives
+    duration_ns: int | None = None
+    # the ring of the producer if it renders ahead, the frame must be taken from it before it is presented
+    ring: "FrameRing | None" = None
+
+    def is_late(self, now_ns: int) -> bool:
+        """True if the time of the frame is over, so it must not be presented anymore."""
+        if self.duration_ns is None:
+            return False
+
+        return now_ns >= self.presentation_time_ns + self.duration_ns
+
+
+class FrameRing:
+    """
+    The frames of one producer that were rendered ahead and are not taken by the display side yet.
+    Its capacity limits how far the producer can render ahead, so a display that falls behind slows it down.
+    """
+    def __init__(self, capacity: int) -> None:
+        self.__capacity: int = capacity
+        self.__lock: Lock = Lock()
+
+        # the oldest frame first
+        self.__envelopes: deque[FrameEnvelope] = deque()
+
+    @property
+    def capacity(self) -> int:
+        return self.__capacity
+
+    def __len__(self) -> int:
+        return len(self.__envelopes)
+
+    def push(self, envelope: FrameEnvelope) -> None:
+        with self.__lock:
+            self.__envelopes.append(envelope)
+
+    def take(self, envelope: FrameEnvelope) -> bool:
+        """
+        Remove the frame from the ring, once the display side takes it.
+        @return: False if the frame was discarded by the producer, so it must not be presented.
+        """
+        with self.__lock:
+            # the frames are taken in order, so this is usually the first one
+            i: int
+            pending: FrameEnvelope
+            for i, pending in enumerate(self.__envelopes):
+                if pending is envelope:
+                    del self.__envelopes[i]
+                    return True
+
+        return False
+
+    def discard(self) -> None:
+        """Discard all frames that were not taken yet, e.g. when the producer gets paused."""
+        with self.__lock:
+            self.__envelopes.clear()
+
+    def full_until_ns(self) -> int | None:
+        """
+        @return: None if there is room for another frame.
+                 Otherwise the presentation time of the oldest frame, around then it gets taken.
+        """
+        with self.__lock:
+            if len(self.__envelopes) < self.__capacity:
+                return None
+
+            return self.__envelopes[0].presentation_time_ns
+
+
+class FrameQueue(InterruptibleQueue[FrameEnvelope]):
+    """
+    The frames that wait to be presented.
+    Only a limited number of frames is kept per source. If a source puts more, its oldest frame is dropped.
+    """
+    def __init__(self, max_frames_per_source: int, release_frame: Callable[[NDArray[np.uint8]], None]) -> None:
+        super().__init__()
+
+        self.__max_frames_per_source: int = max_frames_per_source
+        # returns the buffers of the frames that are not presented, e.g. to the frame pool
+        self.__release_frame: Callable[[NDArray[np.uint8]], None] = release_frame
+
+        # the number of frames that were dropped, because a newer frame of the same source was put
+        self.__dropped: int = 0
+
+    @property
+    def dropped(self) -> int:
+        return self.__dropped
+
+    def __release(self, envelope: FrameEnvelope) -> None:
+        """Release a frame that is not presented."""
+        # a frame that was rendered ahead must also leave the ring of its source
+        if envelope.ring is not None:
+            envelope.ring.take(envelope)
+
+        self.__release_frame(envelope.frame)
+
+    def discard(self, source_id: str) -> None:
+        """Discard the queued frames of one source, e.g. when it stops. The frames of other sources stay queued."""
+        with self.mutex:
+            envelopes: list[FrameEnvelope] = [envelope for envelope in self.queue if envelope.source_id == source_id]
+            if not envelopes:
+                return
+
+            self.queue = deque(envelope for envelope in self.queue if envelope.source_id != source_id)
+            # the discarded frames are not processed anymore
+            self.unfinished_tasks -= len(envelopes)
+            if self.unfinished_tasks == 0:
+                self.all_tasks_done.notify_all()
+            self.not_full.notify_all()
+
+        envelope: FrameEnvelope
+        for envelope in envelopes:
+            self.__release(envelope)
+
+    def clear(self) -> None:
+        """Discard all queued frames, e.g. when the application stops or reloads."""
+        with self.mutex:
+            envelopes: list[FrameEnvelope] = list(self.queue)
+            self.queue.clear()
+            self.unfinished_tasks = 0
+            self.all_tasks_done.notify_all()
+
+        envelope: FrameEnvelope
+        for envelope in envelopes:
+            self.__release(envelope)
+
+    def get_due_or_interrupt(self) -> FrameEnvelope | None:
+        """
+        Remove and return the frame that is due first, once its presentation time is reached.
+        Frames that are put while waiting are considered, too. So a frame of another source can be presented in between.
+        Block until a frame is due or until interrupt() is called. None is returned on interruption.
+        """
+        with self.not_empty:
+            while not self._consume_interrupt():
+                if not self._qsize():
+                    self.not_empty.wait()
+                    continue
+
+                # the frames of different sources are not ordered by their presentation time
+                index: int
+                envelope: FrameEnvelope
+                index, envelope = min(enumerate(self.queue), key=lambda item: item[1].presentation_time_ns)
+
+                delay_ns: int = envelope.presentation_time_ns - time.monotonic_ns()
+                if delay_ns <= 0:
+                    del self.queue[index]
+                    self.not_full.notify()
+                    return envelope
+
+                # a new frame or an interruption wakes up earlier
+                self.not_empty.wait(delay_ns / 1e9)
+
+        return None
+
+    def _put(self, item: FrameEnvelope) -> None:
+        # this is called with the lock of the queue held
+        first_index: int | None = None
+        count: int = 0
+
+        i: int
+        queued: FrameEnvelope
+        for i, queued in enumerate(self.queue):
+            if queued.source_id == item.source_id:
+                if first_index is None:
+                    first_index = i
+                count += 1
+
+        if first_index is not None and count >= self.__max_frames_per_source:
+            # the frames of a source are queued in order, so the first one is the oldest
+            superseded: FrameEnvelope = self.queue[first_index]
+            del self.queue[first_index]
+            # the superseded frame is not processed anymore
+            self.unfinished_tasks -= 1
+            self.__dropped += 1
+
+            self.__release(superseded)
+
+        super()._put(item)
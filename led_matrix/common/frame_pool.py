@@ -0,0 +1,72 @@
+from logging import Logger
+from threading import Lock
+
+import numpy as np
+from numpy.typing import NDArray
+
+from led_matrix.common.log import LOG
+
+_log: Logger = LOG.create("FramePool")
+
+
+class FramePool:
+    """
+    Preallocated frame buffers that are reused instead of allocating a new array for every frame.
+    A leased buffer must be released once it is not needed anymore, e.g. after it was presented on the display.
+    """
+    def __init__(self, width: int, height: int, size: int=4) -> None:
+        self.__shape: tuple[int, int, int] = (height, width, 3)
+        self.__lock: Lock = Lock()
+
+        self.__free: list[NDArray[np.uint8]] = [np.zeros(self.__shape, dtype=np.uint8) for _ in range(size)]
+        # the leased buffers by their id
+        # they are referenced here, so their ids can't be reused by other arrays
+        self.__leased: dict[int, NDArray[np.uint8]] = {}
+        # how often the shared buffers must still be released by their id
+        self.__shared: dict[int, int] = {}
+
+        # a warning is logged when the pool grows to this number of buffers, then the limit is doubled
+        # a few more buffers than preallocated are normal, e.g. while an animation is replaced
+        self.__warn_allocated: int = 2 * max(1, size)
+
+    @property
+    def allocated(self) -> int:
+        """The number of buffers that were allocated by the pool."""
+        with self.__lock:
+            return len(self.__free) + len(self.__leased)
+
+    def lease(self, users: int=1) -> NDArray[np.uint8]:
+        """
+        Get a free buffer. Its content is undefined. A new one is allocated if all buffers are in use.
+        @param users: The number of users that share the buffer. Each of them must release it.
+        """
+        with self.__lock:
+            frame: NDArray[np.uint8]
+            if self.__free:
+                frame = self.__free.pop()
+            else:
+                frame = np.zeros(self.__shape, dtype=np.uint8)
+
+                allocated: int = len(self.__leased) + 1
+                if allocated >= self.__warn_allocated:
+                    _log.warning("The frame pool grew to %d buffers, so frames are leased faster than released.",
+                                 allocated)
+                    self.__warn_allocated *= 2
+
+            self.__leased[id(frame)] = frame
+            if users > 1:
+                self.__shared[id(frame)] = users
+
+        return frame
+
+    def release(self, frame: NDArray[np.uint8]) -> None:
+        """Return a leased buffer to the pool. Frames that were not leased from the pool are ignored."""
+        with self.__lock:
+            # a shared buffer is free once all users released it
+            remaining: int = self.__shared.pop(id(frame), 1) - 1
+            if remaining > 0:
+                self.__shared[id(frame)] = remaining
+                return
+
+            if self.__leased.pop(id(frame), None) is not None:
+                self.__free.append(frame)
@@ -1,4 +1,20 @@
-from threading import Event
+import os
+from queue import Queue
+from threading import Condition, Event, RLock, get_native_id
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+def lower_thread_priority() -> None:
+    """
+    Give the calling thread the lowest scheduling priority, so it only runs if nothing else needs the CPU.
+    This only works on Linux, where each thread has its own nice value. Otherwise the priority is not changed.
+    """
+    try:
+        os.setpriority(os.PRIO_PROCESS, get_native_id(), 19)
+    except (AttributeError, OSError):
+        pass
 
 
 class EventWithUnsetSignal(Event):
@@ -30,3 +46,109 @@ class EventWithUnsetSignal(Event):
                 self._cond.wait_for(lambda: not self._flag, timeout=timeout)  # type: ignore
                 signaled = self._flag
             return signaled
+
+
+class Mailbox(Generic[T]):
+    """
+    A slot that holds only the latest value.
+    A new value replaces the one that was not taken yet, so the consumer always gets the newest value.
+    """
+    def __init__(self) -> None:
+        self.__condition: Condition = Condition()
+
+        self.__value: T | None = None
+        self.__has_value: bool = False
+
+        # number of values that were replaced before they were taken
+        self.__dropped: int = 0
+
+    @property
+    def dropped(self) -> int:
+        return self.__dropped
+
+    def put(self, value: T) -> T | None:
+        """Store the value. The replaced value (if any) is returned."""
+        with self.__condition:
+            replaced: T | None = None
+            if self.__has_value:
+                replaced = self.__value
+                self.__dropped += 1
+
+            self.__value = value
+            self.__has_value = True
+
+            self.__condition.notify_all()
+
+        return replaced
+
+    def get(self, timeout: float | None=None) -> T | None:
+        """
+        Take the value. If there is none, block until one is put or until the optional timeout occurs.
+        None is returned on timeout.
+        """
+        with self.__condition:
+            if not self.__condition.wait_for(lambda: self.__has_value, timeout=timeout):
+                return None
+
+            value: T | None = self.__value
+            self.__value = None
+            self.__has_value = False
+
+        return value
+
+    def get_nowait(self) -> T | None:
+        """Take the value without blocking. None is returned if there is no value."""
+        return self.get(timeout=0)
+
+    def clear(self) -> T | None:
+        """Remove the value (if any) and return it."""
+        return self.get_nowait()
+
+
+class InterruptibleQueue(Queue[T]):
+    """
+    A queue whose blocking get can be interrupted, e.g. to quit.
+    The lock of the queue is reentrant, so interrupt() can also be called from a signal handler.
+    """
+    def __init__(self, maxsize: int=0) -> None:
+        super().__init__(maxsize=maxsize)
+
+        # replace the lock of the parent class
+        self.mutex = RLock()  # type: ignore
+        self.not_empty = Condition(self.mutex)
+        self.not_full = Condition(self.mutex)
+        self.all_tasks_done = Condition(self.mutex)
+
+        self.__interrupted: bool = False
+
+    def interrupt(self) -> None:
+        """Wake up a blocking get_or_interrupt call. If there is none, the next call returns immediately."""
+        with self.not_empty:
+            self.__interrupted = True
+            self.not_empty.notify_all()
+
+    def _consume_interrupt(self) -> bool:
+        """
+        Check if interrupt() was called and reset it. The lock must be held.
+        @return: True if the waiting method should return on interruption.
+        """
+        interrupted: bool = self.__interrupted
+        self.__interrupted = False
+        return interrupted
+
+    def get_or_interrupt(self) -> T | None:
+        """
+        Remove and return an item from the queue. Block until an item is available or until interrupt() is called.
+        None is returned on interruption.
+        """
+        with self.not_empty:
+            while not self._qsize() and not self.__interrupted:
+                self.not_empty.wait()
+
+            if self._consume_interrupt():
+                return None
+
+            item: T = self._get()
+            self.not_full.notify()
+
+            return item
@@ -43,6 +43,10 @@ class Configuration(Settings):
             self.default_animation = saved_settings.default_animation
             self.apa102 = saved_settings.apa102
             self.computer = saved_settings.computer
+            self.headless = saved_settings.headless
+            self.shm = saved_settings.shm
+            self.composite = saved_settings.composite
+            self.recorder = saved_settings.recorder
             self.scheduled_animations = saved_settings.scheduled_animations
 
             self.__log.info("Successfully loaded configuration")
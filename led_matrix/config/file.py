@@ -9,18 +9,28 @@ from python_ini.ini_file import IniFile
 from python_ini.ini_writer import IniWriter
 
 from led_matrix.animation import DUMMY_ANIMATION_NAME
-from led_matrix.config.meta import (_APA102Meta, _ComputerMeta,
-                                    _DefaultAnimationMeta, _MainSettingsMeta,
-                                    _ScheduledAnimationsMeta)
-from led_matrix.config.settings import (APA102, Computer, DefaultAnimation,
-                                        MainSettings, ScheduledAnimations,
-                                        Settings)
+from led_matrix.config.meta import (_APA102Meta, _CompositeMeta, _ComputerMeta,
+                                    _DefaultAnimationMeta, _HeadlessMeta,
+                                    _MainSettingsMeta, _RecorderMeta,
+                                    _ScheduledAnimationsMeta, _ShmMeta)
+from led_matrix.config.settings import (APA102, Composite, Computer,
+                                        DefaultAnimation, Headless,
+                                        MainSettings, Recorder,
+                                        ScheduledAnimations, Settings, Shm)
 from led_matrix.config.types import (ColorTemp, Hardware, LEDColorType,
                                      LEDOrientation, LEDOrigin, LEDWireMode)
 
 V = TypeVar("V", str, int, bool)
 
 
+def _format_spi_devices(spi_devices: tuple[tuple[int, int], ...]) -> str:
+    return ", ".join(f"{bus}.{device}" for bus, device in spi_devices)
+
+
+def _format_hardware_list(hardware_list: tuple[Hardware, ...]) -> str:
+    return ", ".join(hardware.value for hardware in hardware_list)
+
+
 class _ConfigReader:
     VALUE_NOT_FOUND: Final[object] = object()
 
@@ -89,6 +99,18 @@ class _ConfigReader:
             display_height: int = self.__get_value(_MainSettingsMeta.DISPLAY_HEIGHT,
                                                    target_type=int,
                                                    default_value=MainSettings.display_height)
+            display_refresh_rate: int = self.__get_value(_MainSettingsMeta.DISPLAY_REFRESH_RATE,
+                                                         target_type=int,
+                                                         default_value=MainSettings.display_refresh_rate)
+            animation_event_loop: bool = self.__get_value(_MainSettingsMeta.ANIMATION_EVENT_LOOP,
+                                                          target_type=bool,
+                                                          default_value=MainSettings.animation_event_loop)
+            render_cache_size: int = self.__get_value(_MainSettingsMeta.RENDER_CACHE_SIZE,
+                                                      target_type=int,
+                                                      default_value=MainSettings.render_cache_size)
+            render_ahead_frames: int = self.__get_value(_MainSettingsMeta.RENDER_AHEAD_FRAMES,
+                                                        target_type=int,
+                                                        default_value=MainSettings.render_ahead_frames)
             day_brightness: int = self.__get_value(_MainSettingsMeta.DAY_BRIGHTNESS,
                                                    target_type=int,
                                                    default_value=MainSettings.day_brightness)
@@ -119,6 +141,10 @@ class _ConfigReader:
         return MainSettings(hardware=hardware,
                             display_width=display_width,
                             display_height=display_height,
+                            display_refresh_rate=display_refresh_rate,
+                            animation_event_loop=animation_event_loop,
+                            render_cache_size=render_cache_size,
+                            render_ahead_frames=render_ahead_frames,
                             day_brightness=day_brightness,
                             night_brightness=night_brightness,
                             day_color_temp=day_color_temp,
@@ -162,11 +188,33 @@ class _ConfigReader:
             origin: LEDOrigin = LEDOrigin(self.__get_value(_APA102Meta.ORIGIN,
                                                            target_type=int,
                                                            default_value=APA102.origin.value))
+            spi_devices: tuple[tuple[int, int], ...] = self.__parse_spi_devices(
+                self.__get_value(_APA102Meta.SPI_DEVICES,
+                                 target_type=str,
+                                 default_value=_format_spi_devices(APA102.spi_devices))
+            )
 
         return APA102(color_type=color_type,
                       wire_mode=wire_mode,
                       orientation=orientation,
-                      origin=origin)
+                      origin=origin,
+                      spi_devices=spi_devices)
+
+    def __parse_spi_devices(self, value: str) -> tuple[tuple[int, int], ...]:
+        # the format is 'bus.device, bus.device, ...'
+        spi_devices: list[tuple[int, int]] = []
+
+        spi_device: str
+        for spi_device in value.split(","):
+            try:
+                bus, device = spi_device.strip().split(".")
+                spi_devices.append((int(bus), int(device)))
+            except ValueError as e:
+                self.__log.error("The SPI device '%s' in section '%s' is invalid.",
+                                 spi_device, _APA102Meta.SECTION_NAME)
+                raise e
+
+        return tuple(spi_devices)
 
 
     def __read_computer(self) -> Computer:
@@ -181,6 +229,56 @@ class _ConfigReader:
         return Computer(margin=margin,
                         led_size=led_size)
 
+    def __read_headless(self) -> Headless:
+        with self.__section(_HeadlessMeta.SECTION_NAME):
+            checksum: bool = self.__get_value(_HeadlessMeta.CHECKSUM,
+                                              target_type=bool,
+                                              default_value=Headless.checksum)
+
+        return Headless(checksum=checksum)
+
+    def __read_shm(self) -> Shm:
+        with self.__section(_ShmMeta.SECTION_NAME):
+            name: str = self.__get_value(_ShmMeta.NAME,
+                                         target_type=str,
+                                         default_value=Shm.name)
+            slots: int = self.__get_value(_ShmMeta.SLOTS,
+                                          target_type=int,
+                                          default_value=Shm.slots)
+
+        return Shm(name=name,
+                   slots=slots)
+
+    def __read_composite(self) -> Composite:
+        with self.__section(_CompositeMeta.SECTION_NAME):
+            displays_str: str = self.__get_value(_CompositeMeta.DISPLAYS,
+                                                 target_type=str,
+                                                 default_value=_format_hardware_list(Composite.displays))
+
+        # the format is 'HARDWARE, HARDWARE, ...'
+        displays: tuple[Hardware, ...] = tuple(Hardware(display.strip().upper())
+                                               for display in displays_str.split(","))
+        if Hardware.COMPOSITE in displays:
+            raise ValueError("A composite display cannot contain another composite display.")
+
+        return Composite(displays=displays)
+
+    def __read_recorder(self) -> Recorder:
+        with self.__section(_RecorderMeta.SECTION_NAME):
+            directory: Path = Path(self.__get_value(_RecorderMeta.DIRECTORY,
+                                                    target_type=str,
+                                                    default_value=str(Recorder.directory)))
+            compression: bool = self.__get_value(_RecorderMeta.COMPRESSION,
+                                                 target_type=bool,
+                                                 default_value=Recorder.compression)
+            keyframe_interval: int = self.__get_value(_RecorderMeta.KEYFRAME_INTERVAL,
+                                                      target_type=int,
+                                                      default_value=Recorder.keyframe_interval)
+
+        return Recorder(directory=directory,
+                        compression=compression,
+                        keyframe_interval=keyframe_interval)
+
     def __read_scheduled_animations(self) -> ScheduledAnimations:
         with self.__section(_ScheduledAnimationsMeta.SECTION_NAME):
             schedule_table: str = self.__get_value(_ScheduledAnimationsMeta.SCHEDULE_TABLE,
@@ -195,6 +293,10 @@ class _ConfigReader:
             default_animation: DefaultAnimation = self.__read_default_animation()
             apa102: APA102 = self.__read_apa102()
             computer: Computer = self.__read_computer()
+            headless: Headless = self.__read_headless()
+            shm: Shm = self.__read_shm()
+            composite: Composite = self.__read_composite()
+            recorder: Recorder = self.__read_recorder()
             scheduled_animations: ScheduledAnimations = self.__read_scheduled_animations()
         except ValueError as e:
             self.__log.error(e)
@@ -204,6 +306,10 @@ class _ConfigReader:
                         default_animation=default_animation,
                         apa102=apa102,
                         computer=computer,
+                        headless=headless,
+                        shm=shm,
+                        composite=composite,
+                        recorder=recorder,
                         scheduled_animations=scheduled_animations)
 
 class _ConfigWriter:
@@ -223,11 +329,19 @@ class _ConfigWriter:
     def __write_main(self, main_config: MainSettings) -> None:
         self.__w.section(name=_MainSettingsMeta.SECTION_NAME)
         self.__w.comment("The display defines where the animations should be showed.")
-        self.__w.comment("There are two possible values here:")
+        self.__w.comment("There are six possible values here:")
         self.__w.comment("    - 'APA102'   [Default]")
         self.__w.comment("      The actual LED hardware addressed via SPI.")
         self.__w.comment("    - 'COMPUTER'")
         self.__w.comment("      This is for developing on a PC. It opens a virtual LED matrix via 'pygame'.")
+        self.__w.comment("    - 'HEADLESS'")
+        self.__w.comment("      The frames are not shown anywhere, only counted. This is for benchmarking.")
+        self.__w.comment("    - 'SHM'")
+        self.__w.comment("      The frames are published in a shared memory file for other processes.")
+        self.__w.comment("    - 'COMPOSITE'")
+        self.__w.comment("      The frames are shown on all displays of the [COMPOSITE] section at the same time.")
+        self.__w.comment("    - 'RECORDER'")
+        self.__w.comment("      The frames are recorded to a file for replaying them later.")
         self.__w.key(name="Hardware", varg=main_config.hardware.value)
 
         self.__w.comment()
@@ -235,6 +349,30 @@ class _ConfigWriter:
         self.__w.key(name=_MainSettingsMeta.DISPLAY_WITH, varg=main_config.display_width)
         self.__w.key(name=_MainSettingsMeta.DISPLAY_HEIGHT, varg=main_config.display_height)
 
+        self.__w.comment()
+        self.__w.comment("The maximum number of frames per second that are sent to the display [Default: 60]")
+        self.__w.comment("Newer frames replace older ones that were not displayed yet.")
+        self.__w.comment("Use '0' to send the frames as fast as they come.")
+        self.__w.comment("The 'HEADLESS' display always gets the frames as fast as they come.")
+        self.__w.key(name=_MainSettingsMeta.DISPLAY_REFRESH_RATE, varg=main_config.display_refresh_rate)
+
+        self.__w.comment()
+        self.__w.comment("Run all animations in one event loop instead of one thread per animation [Default: false]")
+        self.__w.comment("This reduces the number of threads that wait for their next frame.")
+        self.__w.comment("The frames are still rendered by worker threads, so a slow animation does not stall others.")
+        self.__w.comment("Every frame is handed over to a worker thread and back, so there is no saving per frame.")
+        self.__w.key(name=_MainSettingsMeta.ANIMATION_EVENT_LOOP, varg=main_config.animation_event_loop)
+
+        self.__w.comment()
+        self.__w.comment("Memory in MiB for keeping rendered animations to replay them [Default: 32]")
+        self.__w.comment("Use '0' to disable it.")
+        self.__w.key(name=_MainSettingsMeta.RENDER_CACHE_SIZE, varg=main_config.render_cache_size)
+
+        self.__w.comment()
+        self.__w.comment("Number of frames an animation can render before they are shown [Default: 3]")
+        self.__w.comment("This evens out a slow frame. Use '0' to render every frame just in time.")
+        self.__w.key(name=_MainSettingsMeta.RENDER_AHEAD_FRAMES, varg=main_config.render_ahead_frames)
+
         self.__w.comment()
         self.__w.comment("Set the brightness in percent [Default: 85]")
         self.__w.comment("Possible values: 0 < = x <= 100")
@@ -329,6 +467,14 @@ class _ConfigWriter:
         self.__w.comment("    - '4': bottom right")
         self.__w.key(name=_APA102Meta.ORIGIN, varg=apa102_config.origin.value)
 
+        self.__w.comment()
+        self.__w.comment("The SPI devices the LEDs are connected to [Default: '0.1'].")
+        self.__w.comment("Each device is written as 'bus.device', e.g. '0.1' for '/dev/spidev0.1'.")
+        self.__w.comment("Multiple devices are separated by commas, e.g. '0.0, 1.0'.")
+        self.__w.comment("The LED chain is then split line by line into equal parts, one per device in that order.")
+        self.__w.comment("All parts are sent at the same time.")
+        self.__w.key(name=_APA102Meta.SPI_DEVICES, varg=_format_spi_devices(apa102_config.spi_devices))
+
     def __write_computer(self, computer_config: Computer) -> None:
         self.__w.section(name=_ComputerMeta.SECTION_NAME)
         self.__w.comment("This section contains variables for the computer display.")
@@ -339,6 +485,47 @@ class _ConfigWriter:
         self.__w.comment("Size of the square in pixels that represents a (virtual) LED on the matrix.")
         self.__w.key(name=_ComputerMeta.LED_SIZE, varg=computer_config.led_size)
 
+    def __write_headless(self, headless_config: Headless) -> None:
+        self.__w.section(name=_HeadlessMeta.SECTION_NAME)
+        self.__w.comment("This section contains variables for the headless display.")
+        self.__w.comment("The 'DisplayRefreshRate' does not apply, so the counters measure the frame pipeline.")
+        self.__w.comment("Calculate a checksum of each shown frame [Default: False].")
+        self.__w.key(name=_HeadlessMeta.CHECKSUM, varg=headless_config.checksum)
+
+    def __write_shm(self, shm_config: Shm) -> None:
+        self.__w.section(name=_ShmMeta.SECTION_NAME)
+        self.__w.comment("This section contains variables for the shared memory display.")
+        self.__w.comment("Name of the file in '/dev/shm' that contains the frames [Default: 'led-matrix'].")
+        self.__w.key(name=_ShmMeta.NAME, varg=shm_config.name)
+
+        self.__w.comment()
+        self.__w.comment("Number of frames that are kept in the file [Default: 4].")
+        self.__w.key(name=_ShmMeta.SLOTS, varg=shm_config.slots)
+
+    def __write_composite(self, composite_config: Composite) -> None:
+        self.__w.section(name=_CompositeMeta.SECTION_NAME)
+        self.__w.comment("This section contains variables for the composite display.")
+        self.__w.comment("The displays that show the frames, separated by commas [Default: 'APA102, COMPUTER'].")
+        self.__w.comment("Possible values are the ones of the 'Hardware' setting in [MAIN], except 'COMPOSITE'.")
+        self.__w.comment("A display that is too slow skips frames, without slowing down the others.")
+        self.__w.key(name=_CompositeMeta.DISPLAYS, varg=_format_hardware_list(composite_config.displays))
+
+    def __write_recorder(self, recorder_config: Recorder) -> None:
+        self.__w.section(name=_RecorderMeta.SECTION_NAME)
+        self.__w.comment("This section contains variables for the recorder display.")
+        self.__w.comment("The directory where the recordings are saved. Each start creates a new file.")
+        self.__w.key(name=_RecorderMeta.DIRECTORY, varg=str(recorder_config.directory))
+
+        self.__w.comment()
+        self.__w.comment("Compress the frames with zlib [Default: True].")
+        self.__w.comment("Most frames are stored as the difference to the previous frame then.")
+        self.__w.key(name=_RecorderMeta.COMPRESSION, varg=recorder_config.compression)
+
+        self.__w.comment()
+        self.__w.comment("Number of frames after which a complete frame is stored again [Default: 60].")
+        self.__w.comment("Only respected when compression is enabled. Smaller values allow faster seeking.")
+        self.__w.key(name=_RecorderMeta.KEYFRAME_INTERVAL, varg=recorder_config.keyframe_interval)
+
     def __write_scheduled_animations(self, scheduled_config: ScheduledAnimations) -> None:
         self.__w.section(name=_ScheduledAnimationsMeta.SECTION_NAME)
         self.__w.comment("This parameter contains the schedule table for animations.")
@@ -364,6 +551,26 @@ class _ConfigWriter:
         self.__w.comment()
         self.__write_computer(computer_config=config.computer)
 
+        self.__w.comment()
+        self.__w.comment()
+        self.__w.comment()
+        self.__write_headless(headless_config=config.headless)
+
+        self.__w.comment()
+        self.__w.comment()
+        self.__w.comment()
+        self.__write_shm(shm_config=config.shm)
+
+        self.__w.comment()
+        self.__w.comment()
+        self.__w.comment()
+        self.__write_composite(composite_config=config.composite)
+
+        self.__w.comment()
+        self.__w.comment()
+        self.__w.comment()
+        self.__write_recorder(recorder_config=config.recorder)
+
         self.__w.comment()
         self.__w.comment()
         self.__w.comment()
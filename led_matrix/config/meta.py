@@ -12,6 +12,11 @@ class _MainSettingsMeta(_Meta):
 
     DISPLAY_WITH: Final[str] = "DisplayWidth"
     DISPLAY_HEIGHT: Final[str] = "DisplayHeight"
+    DISPLAY_REFRESH_RATE: Final[str] = "DisplayRefreshRate"
+
+    ANIMATION_EVENT_LOOP: Final[str] = "AnimationEventLoop"
+    RENDER_CACHE_SIZE: Final[str] = "RenderCacheSize"
+    RENDER_AHEAD_FRAMES: Final[str] = "RenderAheadFrames"
 
     DAY_BRIGHTNESS: Final[str] = "DayBrightness"
     NIGHT_BRIGHTNESS: Final[str] = "NightBrightness"
@@ -46,6 +51,7 @@ class _APA102Meta(_Meta):
     WIRE_MODE: Final[str] = "WireMode"
     ORIENTATION: Final[str] = "Orientation"
     ORIGIN: Final[str] = "Origin"
+    SPI_DEVICES: Final[str] = "SPIDevices"
 
 
 class _ComputerMeta(_Meta):
@@ -55,6 +61,33 @@ class _ComputerMeta(_Meta):
     LED_SIZE: Final[str] = "LEDSize"
 
 
+class _HeadlessMeta(_Meta):
+    SECTION_NAME = "HEADLESS"
+
+    CHECKSUM: Final[str] = "Checksum"
+
+
+class _ShmMeta(_Meta):
+    SECTION_NAME = "SHM"
+
+    NAME: Final[str] = "Name"
+    SLOTS: Final[str] = "Slots"
+
+
+class _CompositeMeta(_Meta):
+    SECTION_NAME = "COMPOSITE"
+
+    DISPLAYS: Final[str] = "Displays"
+
+
+class _RecorderMeta(_Meta):
+    SECTION_NAME = "RECORDER"
+
+    DIRECTORY: Final[str] = "Directory"
+    COMPRESSION: Final[str] = "Compression"
+    KEYFRAME_INTERVAL: Final[str] = "KeyframeInterval"
+
+
 class _ScheduledAnimationsMeta(_Meta):
     SECTION_NAME = "SCHEDULEDANIMATIONS"
 
@@ -1,6 +1,8 @@
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from ipaddress import IPv4Address, IPv6Address
+from pathlib import Path
+from tempfile import gettempdir
 
 import tzlocal
 from astral import LocationInfo
@@ -18,6 +20,14 @@ class MainSettings:
 
     display_width: int = 15
     display_height: int = 12
+    # frames per second that are sent to the display at most
+    display_refresh_rate: int = 60
+    # run all animations in one asyncio event loop instead of one thread per animation
+    animation_event_loop: bool = False
+    # memory budget in MiB for the rendered frames of animations that are kept for replaying them
+    render_cache_size: int = 32
+    # number of frames an animation may render before they are due, so a slow frame does not cause a stutter
+    render_ahead_frames: int = 3
 
     day_brightness: int = 85
     night_brightness: int = -1
@@ -117,6 +127,8 @@ class APA102:
     wire_mode: LEDWireMode = LEDWireMode.ZIG_ZAG
     orientation: LEDOrientation = LEDOrientation.HORIZONTALLY
     origin: LEDOrigin = LEDOrigin.TOP_LEFT
+    # (bus, device) pairs of the SPI devices, the LED chain is split across them in this order
+    spi_devices: tuple[tuple[int, int], ...] = ((0, 1),)
 
 
 @dataclass(kw_only=True)
@@ -125,6 +137,29 @@ class Computer:
     led_size: int = 30
 
 
+@dataclass(kw_only=True)
+class Headless:
+    checksum: bool = False
+
+
+@dataclass(kw_only=True)
+class Shm:
+    name: str = "led-matrix"
+    slots: int = 4
+
+
+@dataclass(kw_only=True)
+class Composite:
+    displays: tuple[Hardware, ...] = (Hardware.APA102, Hardware.COMPUTER)
+
+
+@dataclass(kw_only=True)
+class Recorder:
+    directory: Path = Path(gettempdir()) / "led-matrix-recordings"
+    compression: bool = True
+    keyframe_interval: int = 60
+
+
 @dataclass(kw_only=True)
 class ScheduledAnimations:
     schedule_table_json_str: str = "[]"
@@ -136,4 +171,8 @@ class Settings:
     default_animation: DefaultAnimation = field(default_factory=DefaultAnimation)
     apa102: APA102 = field(default_factory=APA102)
     computer: Computer = field(default_factory=Computer)
+    headless: Headless = field(default_factory=Headless)
+    shm: Shm = field(default_factory=Shm)
+    composite: Composite = field(default_factory=Composite)
+    recorder: Recorder = field(default_factory=Recorder)
     scheduled_animations: ScheduledAnimations = field(default_factory=ScheduledAnimations)
@@ -4,6 +4,10 @@ from enum import Enum
 class Hardware(Enum):
     APA102 = "APA102"
     COMPUTER = "COMPUTER"
+    HEADLESS = "HEADLESS"
+    SHM = "SHM"
+    COMPOSITE = "COMPOSITE"
+    RECORDER = "RECORDER"
 
 
 class LEDColorType(Enum):
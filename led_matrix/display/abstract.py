@@ -2,7 +2,7 @@
 This module is the abstract representation of a pixel matrix display.
 """
 from abc import ABC, abstractmethod
-from typing import final
+from typing import Final, final
 
 import numpy as np
 from numpy.typing import NDArray
@@ -10,17 +10,55 @@ from numpy.typing import NDArray
 from led_matrix.config.settings import Settings
 from led_matrix.config.types import ColorTemp
 
+# index of the red, green and blue channel in the last axis of a frame
+_COLOR_CHANNELS: Final[NDArray[np.int_]] = np.arange(3)
+
 
 class AbstractDisplay(ABC):
     def __init__(self, config: Settings) -> None:
         self.__config: Settings = config
 
+        # the front buffer is the displayed one, incoming frames are copied into the back buffer
         self.__buffer: NDArray[np.uint8] = np.zeros(
             (config.main.display_height, config.main.display_width, 3),  # 3 for red, green, blue
             dtype=np.uint8
         )
+        self.__back_buffer: NDArray[np.uint8] = np.zeros_like(self.__buffer)
+        # preallocated result of the comparison of both buffers
+        self.__diff_mask: NDArray[np.bool_] = np.zeros(self.__buffer.shape, dtype=np.bool_)
 
         self.__color_temp: ColorTemp = ColorTemp.K_6000
+        self.__color_temp_lut: NDArray[np.uint8] = self.__build_color_temp_lut(self.__color_temp)
+
+        # set if the next frame must be shown, even if its content did not change
+        self.__redraw_requested: bool = False
+
+        # frame counters
+        self.__frames_received: int = 0
+        self.__frames_changed: int = 0
+
+    @staticmethod
+    def __build_color_temp_lut(color_temp: ColorTemp) -> NDArray[np.uint8]:
+        # one row per color channel that maps each of the 256 possible values to the color temperature value
+        return np.ceil(
+            np.arange(256, dtype=np.float64) * np.array(color_temp.value)[:, np.newaxis]
+        ).astype(np.uint8)
+
+    @staticmethod
+    def _apply_color_lut(color_lut: NDArray[np.uint8], frame: NDArray[np.uint8],
+                         out: NDArray[np.uint8] | None=None) -> NDArray[np.uint8]:
+        """
+        Map every color value of the frame through the 3x256 lookup table of its color channel.
+        @param out: The buffer for the result, so no new frame is allocated. It must have the shape of the frame.
+        """
+        if out is None:
+            return color_lut[_COLOR_CHANNELS, frame]
+
+        channel: int
+        for channel in _COLOR_CHANNELS.tolist():
+            np.take(color_lut[channel], frame[..., channel], out=out[..., channel], mode="clip")
+
+        return out
 
     @property
     def frame_buffer(self) -> NDArray[np.uint8]:
@@ -30,20 +68,21 @@ class AbstractDisplay(ABC):
     @final
     def update_frame_buffer(self, value: NDArray[np.uint8]) -> bool:
         if self.__buffer.shape == value.shape:
-            # check if the color temperature should be changed
-            if self.__color_temp != ColorTemp.K_6000:
-                # iterate over the last axis (2) which contains the color values
-                i: tuple[int, ...]
-                for i in np.ndindex(value.shape[:2]):
-                    # apply the color temperature
-                    value[i] = np.ceil(value[i] * self.__color_temp.value).astype(np.uint8)
+            self.__frames_received += 1
+
+            # the frame is copied, so the producer can reuse its array
+            np.copyto(self.__back_buffer, value)
 
             # stop here if the buffer does not change
-            if np.array_equal(self.__buffer, value):
+            # the color temperature is not part of the buffer, so a changed one must be checked separately
+            np.not_equal(self.__back_buffer, self.__buffer, out=self.__diff_mask)
+            if not self.__diff_mask.any() and not self.__redraw_requested:
                 return False
 
             # apply the new value
-            self.__buffer = value
+            self.__buffer, self.__back_buffer = self.__back_buffer, self.__buffer
+            self.__redraw_requested = False
+            self.__frames_changed += 1
             # and return True, because it has changed
             return True
 
@@ -51,12 +90,34 @@ class AbstractDisplay(ABC):
         return False
 
     def clear_buffer(self) -> None:
-        self.__buffer = np.zeros_like(self.__buffer)
+        self.__buffer.fill(0)
+
+    @property
+    def frames_received(self) -> int:
+        """The number of frames that were passed to update_frame_buffer()."""
+        return self.__frames_received
+
+    @property
+    def frames_changed(self) -> int:
+        """The number of received frames that changed the buffer."""
+        return self.__frames_changed
 
     @property
     def _config(self) -> Settings:
         return self.__config
 
+    @property
+    def _color_temp_lut(self) -> NDArray[np.uint8]:
+        """The 3x256 lookup table that applies the current color temperature."""
+        return self.__color_temp_lut
+
+    def _request_redraw(self) -> None:
+        """The next frame gets shown, even if it equals the current one."""
+        self.__redraw_requested = True
+
+    def _color_temp_lut_changed(self) -> None:
+        """Displays that derive their own lookup tables from the color temperature one must override this."""
+
     @abstractmethod
     def show(self, gamma: bool=False) -> None:
         """Display the contents of buffer on display. Gamma correction can be
@@ -69,6 +130,9 @@ class AbstractDisplay(ABC):
         self.clear_buffer()
         self.show()
 
+    def close(self) -> None:
+        """Release the resources of the display. It is not used anymore afterwards."""
+
     @abstractmethod
     def set_brightness(self, brightness: int) -> None:
         """Set the brightness 0 to 100 value"""
@@ -76,4 +140,11 @@ class AbstractDisplay(ABC):
 
     @final
     def set_color_temp(self, color_temp: ColorTemp) -> None:
+        if color_temp == self.__color_temp:
+            return
+
         self.__color_temp = color_temp
+        self.__color_temp_lut = self.__build_color_temp_lut(color_temp)
+        self._color_temp_lut_changed()
+
+        self._request_redraw()
@@ -6,13 +6,19 @@ import sys
 
 if sys.platform == "linux":
     import math
-    from collections.abc import Iterable
+    from logging import Logger
+    from pathlib import Path
+    from threading import Condition, Lock, Thread
     from typing import Final
 
     import numpy as np
     from numpy.typing import NDArray
     from spidev import SpiDev
 
+    from led_matrix import CACHE_DIR
+    from led_matrix.common.alpine import LBU_PATH
+    from led_matrix.common.atomic_file import replace_file
+    from led_matrix.common.log import LOG
     from led_matrix.config.settings import Settings
     from led_matrix.config.types import (LEDColorType, LEDOrientation,
                                          LEDOrigin, LEDWireMode)
@@ -23,16 +29,195 @@ if sys.platform == "linux":
     MAX_BRIGHTNESS: Final[int] = 31
     DEFAULT_GAMMA: Final[float] = 2.22
 
+    # must be increased whenever the creation of the LED index maps changes, so older cache files are not used anymore
+    INDEX_CACHE_VERSION: Final[int] = 1
+    # the LED index maps of the last used layouts are stored here
+    INDEX_CACHE_DIR: Path
+    if LBU_PATH is not None:
+        # on Alpine Linux save the cache on the persistent storage
+        INDEX_CACHE_DIR = LBU_PATH / "led-matrix" / "cache"
+    else:
+        INDEX_CACHE_DIR = CACHE_DIR
 
-    class Apa102(AbstractDisplay):
-        def __init__(self, config: Settings) -> None:
-            super().__init__(config=config)
+    _log: Logger = LOG.create("APA102")
+
+
+    class _SpiTransfer(Thread):
+        """
+        Sends the transmit buffers to the SPI bus.
+        Two buffers are used: the back buffer can be filled while the front buffer is still on the bus.
+        """
+        def __init__(self, bus: int, device: int, buffer_size: int) -> None:
+            super().__init__(daemon=True)
 
-            # init SPI interface
             self.__spi: SpiDev = SpiDev()
-            self.__spi.open(0, 1)
+            self.__spi.open(bus, device)
             self.__spi.max_speed_hz = SPI_MAX_SPEED_HZ
 
+            self.__buffers: Final[tuple[bytearray, bytearray]] = (bytearray(buffer_size), bytearray(buffer_size))
+            self.__back_buffer_index: int = 0
+
+            self.__condition: Condition = Condition()
+            # the buffer that should be sent next
+            self.__pending_buffer: bytearray | None = None
+            self.__is_sending: bool = False
+            self.__is_closed: bool = False
+            # only the first of consecutive transfer errors is logged
+            self.__has_failed: bool = False
+
+            self.start()
+
+        @property
+        def buffers(self) -> tuple[bytearray, bytearray]:
+            return self.__buffers
+
+        @property
+        def back_buffer_index(self) -> int:
+            """The index of the buffer that is currently not on the bus and can be filled."""
+            return self.__back_buffer_index
+
+        def __is_idle(self) -> bool:
+            return self.__pending_buffer is None and not self.__is_sending
+
+        def wait_idle(self) -> None:
+            """Block until the last submitted buffer is sent."""
+            with self.__condition:
+                self.__condition.wait_for(self.__is_idle)
+
+        def submit(self) -> None:
+            """Send the back buffer. The other buffer becomes the new back buffer."""
+            with self.__condition:
+                # the new back buffer must not be on the bus anymore
+                self.__condition.wait_for(self.__is_idle)
+
+                self.__pending_buffer = self.__buffers[self.__back_buffer_index]
+                self.__back_buffer_index ^= 1
+
+                self.__condition.notify_all()
+
+        def close(self) -> None:
+            with self.__condition:
+                self.__is_closed = True
+                self.__condition.notify_all()
+
+            self.join()
+            self.__spi.close()
+
+        def run(self) -> None:
+            while True:
+                with self.__condition:
+                    self.__condition.wait_for(lambda: self.__pending_buffer is not None or self.__is_closed)
+                    if self.__is_closed:
+                        return
+
+                    buffer: memoryview = memoryview(self.__pending_buffer)  # type: ignore
+                    self.__pending_buffer = None
+                    self.__is_sending = True
+
+                try:
+                    # writebytes2 splits the buffer into transfers that fit into the spidev buffer by itself
+                    self.__spi.writebytes2(buffer)
+                    self.__has_failed = False
+                except OSError as e:
+                    # the frame is lost, but the next one is tried again
+                    if not self.__has_failed:
+                        _log.error("Failed to send the frame to the SPI bus.",
+                                   exc_info=e)
+                    self.__has_failed = True
+                finally:
+                    # otherwise the display would wait for this transfer forever
+                    with self.__condition:
+                        self.__is_sending = False
+                        self.__condition.notify_all()
+
+
+    class _Apa102Shard:
+        """
+        A consecutive part of the LED chain that is connected to its own SPI device.
+        It is sent by its own writer thread.
+        """
+        def __init__(self, bus: int, device: int,
+                     wire_color_indices: NDArray[np.int_], wire_lut_offsets: NDArray[np.uint16]) -> None:
+            num_of_leds: int = len(wire_color_indices)
+
+            # setup apa102 protocol stuff
+            start_frame_size: Final[int] = 4
+            led_frames_size: Final[int] = num_of_leds * 4
+            # end frame is >= (n/2) bits of 1, where n is the number of LEDs
+            end_frame_size: Final[int] = (num_of_leds + 15) // (2 * 8)
+
+            # init SPI interface
+            # its buffers are sent to the LEDs: start frame + LED frames + end frame
+            self.__spi_transfer: _SpiTransfer = _SpiTransfer(bus=bus, device=device,
+                                                             buffer_size=(start_frame_size +
+                                                                          led_frames_size +
+                                                                          end_frame_size))
+
+            # the start frame stays zero, so only the LED frames and the end frame must be set once
+            self.__led_frames: Final[list[NDArray[np.uint8]]] = []
+            tx_buffer: bytearray
+            for tx_buffer in self.__spi_transfer.buffers:
+                tx_buffer[start_frame_size + led_frames_size:] = b"\xff" * end_frame_size
+
+                # one row per LED in wire order: brightness byte + 3 color bytes
+                led_frames: NDArray[np.uint8] = np.frombuffer(
+                    tx_buffer,
+                    dtype=np.uint8,
+                    count=led_frames_size,
+                    offset=start_frame_size
+                ).reshape(num_of_leds, 4)
+                # default full brightness (all 8 bits set)
+                led_frames[:, 0] = 0b11111111
+
+                self.__led_frames.append(led_frames)
+
+            # the start byte of the LED frames and the one that is currently written in each buffer
+            # the buffers are updated when they are filled, because the other one could be on the bus
+            self.__start_byte: int = 0b11111111
+            self.__buffer_start_bytes: Final[list[int]] = [self.__start_byte] * len(self.__led_frames)
+
+            self.__wire_color_indices: Final[NDArray[np.int_]] = wire_color_indices
+            self.__wire_lut_offsets: Final[NDArray[np.uint16]] = wire_lut_offsets
+            # preallocated buffer for the lookup table indices of the current frame
+            self.__wire_lut_indices: Final[NDArray[np.uint16]] = np.zeros_like(wire_lut_offsets)
+
+        def set_start_byte(self, start_byte: int) -> None:
+            """The start byte is written with the next fill()."""
+            self.__start_byte = start_byte
+
+        def fill(self, frame_buffer: NDArray[np.uint8], color_lut: NDArray[np.uint8]) -> None:
+            """
+            Write the LEDs of this shard to the back buffer.
+            Both arrays must be flattened.
+            """
+            back_buffer_index: int = self.__spi_transfer.back_buffer_index
+            if self.__buffer_start_bytes[back_buffer_index] != self.__start_byte:
+                self.__led_frames[back_buffer_index][:, 0] = self.__start_byte
+                self.__buffer_start_bytes[back_buffer_index] = self.__start_byte
+
+            # gather the color values in wire order and look them up in the flattened table of their channel
+            np.take(frame_buffer, self.__wire_color_indices,
+                    out=self.__wire_lut_indices, mode="clip")
+            np.add(self.__wire_lut_indices, self.__wire_lut_offsets,
+                   out=self.__wire_lut_indices)
+            np.take(color_lut, self.__wire_lut_indices,
+                    out=self.__led_frames[back_buffer_index][:, 1:], mode="clip")
+
+        def wait_idle(self) -> None:
+            self.__spi_transfer.wait_idle()
+
+        def submit(self) -> None:
+            self.__spi_transfer.submit()
+
+        def close(self) -> None:
+            self.__spi_transfer.wait_idle()
+            self.__spi_transfer.close()
+
+
+    class Apa102(AbstractDisplay):
+        def __init__(self, config: Settings) -> None:
+            super().__init__(config=config)
+
             # setup hardware and wiring related parameters
             self.__width: int = config.main.display_width
             self.__height: int = config.main.display_height
@@ -41,18 +226,8 @@ if sys.platform == "linux":
             self.__origin: LEDOrigin = config.apa102.origin
             self.__orientation: LEDOrientation = config.apa102.orientation
 
-            # setup apa102 protocol stuff
-            self.__start_frame: Final[list[int]] = [0] * 4
-            # end frame is >= (n/2) bits of 1, where n is the number of LEDs
-            self.__end_frame: Final[list[int]] = [0xff] * ((config.main.num_of_pixels + 15) // (2 * 8))
             # each frame starts with 111 and 5 bits that set the brightness
             self.__led_frame_empty_start_byte: Final[int] = 0b11100000
-            self.__led_frame_start_array: NDArray[np.uint8] = np.full(
-                shape=(self.__height, self.__width, 1),
-                # default full brightness (all 8 bits set)
-                fill_value=0b11111111,
-                dtype=np.uint8
-            )
 
             # setup datastructures for fast lookup of led
             # led index for given coordinate
@@ -61,32 +236,154 @@ if sys.platform == "linux":
             (
                 self.__pixel_coord_to_led_index,
                 self.__virtual_to_physical_byte_indices
-            ) = self.__create_pixel_to_led_index_datastructures()
+            ) = self.__load_pixel_to_led_index_datastructures()
+
+            # for each color byte of the LED frames: the index in the flattened frame buffer
+            color_byte_indices: NDArray[np.int_] = self.__virtual_to_physical_byte_indices.reshape(-1, 4)[:, 1:]
+            wire_color_indices: NDArray[np.int_] = (color_byte_indices // 4) * 3 + (color_byte_indices % 4 - 1)
+            # and the offset of its color channel in the flattened lookup tables
+            wire_lut_offsets: NDArray[np.uint16] = ((color_byte_indices % 4 - 1) * 256).astype(np.uint16)
+
+            # the LED chain is split into consecutive lines, one part per SPI device
+            spi_devices: tuple[tuple[int, int], ...] = config.apa102.spi_devices
+            line_length: int = (self.__width if self.__orientation == LEDOrientation.HORIZONTALLY
+                                else self.__height)
+            num_of_lines: int = config.main.num_of_pixels // line_length
+            if len(spi_devices) > num_of_lines:
+                raise RuntimeError(f"Cannot split {num_of_lines} LED lines across {len(spi_devices)} SPI devices.")
+
+            self.__shards: Final[list[_Apa102Shard]] = []
+            shard_lines: NDArray[np.int_]
+            bus: int
+            device: int
+            for shard_lines, (bus, device) in zip(np.array_split(np.arange(num_of_lines), len(spi_devices)),
+                                                  spi_devices):
+                first_led: int = int(shard_lines[0]) * line_length
+                last_led: int = (int(shard_lines[-1]) + 1) * line_length
+
+                self.__shards.append(_Apa102Shard(bus=bus, device=device,
+                                                  wire_color_indices=wire_color_indices[first_led:last_led],
+                                                  wire_lut_offsets=wire_lut_offsets[first_led:last_led]))
 
             # brightness offset
             self.__brightness_ceiling_offset: float = 0.
 
+            # brightness and color temperature are changed from other threads than the one that shows the frames
+            # so they are only applied at the start of the next show()
+            self.__pending_settings_lock: Lock = Lock()
+            # the start byte of the LED frames and the brightness offset
+            self.__pending_brightness: tuple[int, float] | None = None
+            self.__color_luts_outdated: bool = False
+
             # create gamma correction values
-            self.__gamma8 = self.__get_gamma8_array(DEFAULT_GAMMA)
+            self.__gamma8: NDArray[np.uint8] = self.__get_gamma8_array(DEFAULT_GAMMA)
+
+            # lookup tables that combine color temperature, brightness offset and (optional) gamma correction
+            self.__color_lut: NDArray[np.uint8]
+            self.__color_lut_gamma: NDArray[np.uint8]
+            self.__build_color_luts()
 
             self.show()
 
         @staticmethod
         def __get_gamma8_array(gamma) -> NDArray[np.uint8]:
-            gamma8: NDArray[np.uint8] = np.zeros(256, dtype=np.uint8)
+            return (255 * ((np.arange(256) / 255) ** gamma) + 0.5).astype(np.uint8)
 
-            i: np.uint8
-            for i in np.arange(256, dtype=np.uint8):
-                gamma8[i] = (255 * ((i/255) ** gamma) + 0.5).astype(np.uint8)
+        def __build_color_luts(self) -> None:
+            values: NDArray[np.int_] = np.arange(256)
 
-            return gamma8
+            # if there is a brightness offset,
+            # lower the color values proportionately
+            brightness8: NDArray[np.uint8] = (
+                # current value   -
+                values - \
+                #       (one brightness step of the current value   * brightness offset in percent    )
+                np.ceil(((values / (MAX_BRIGHTNESS + 1)) * self.__brightness_ceiling_offset))
+            ).astype(np.uint8)
+
+            # the order is: color temperature -> gamma correction -> brightness offset
+            self.__color_lut = brightness8[self._color_temp_lut]
+            self.__color_lut_gamma = brightness8[self.__gamma8[self._color_temp_lut]]
+
+        def _color_temp_lut_changed(self) -> None:
+            with self.__pending_settings_lock:
+                self.__color_luts_outdated = True
+
+        def __apply_pending_settings(self) -> None:
+            with self.__pending_settings_lock:
+                pending_brightness: tuple[int, float] | None = self.__pending_brightness
+                color_luts_outdated: bool = self.__color_luts_outdated
+
+                self.__pending_brightness = None
+                self.__color_luts_outdated = False
+
+            if pending_brightness is not None:
+                start_byte: int
+                (start_byte, self.__brightness_ceiling_offset) = pending_brightness
+
+                shard: _Apa102Shard
+                for shard in self.__shards:
+                    shard.set_start_byte(start_byte)
+
+            # the brightness offset is part of the lookup tables
+            if pending_brightness is not None or color_luts_outdated:
+                self.__build_color_luts()
+
+        def __get_index_layout(self) -> tuple[str, ...]:
+            # the index maps only depend on the layout of the matrix
+            return (str(self.__width), str(self.__height), self.__color_type.name,
+                    self.__wire_mode.name, self.__origin.name, self.__orientation.name)
+
+        def __get_index_cache_file(self) -> Path:
+            return INDEX_CACHE_DIR / f"apa102_{'_'.join(self.__get_index_layout())}.npz"
+
+        def __load_pixel_to_led_index_datastructures(self) -> tuple[NDArray[np.int_], NDArray[np.int_]]:
+            cache_file: Path = self.__get_index_cache_file()
+            layout: tuple[str, ...] = self.__get_index_layout()
+
+            try:
+                with np.load(cache_file) as cache:
+                    # the cache files of older versions have no version
+                    version: int = int(cache["version"]) if "version" in cache else 0
+                    cached_layout: tuple[str, ...] = tuple(cache["layout"].tolist()) if "layout" in cache else ()
+                    pixel_coord_to_led_index: NDArray[np.int_] = cache["pixel_coord_to_led_index"]
+                    virtual_to_physical_byte_indices: NDArray[np.int_] = cache["virtual_to_physical_byte_indices"]
+
+                if (
+                    version == INDEX_CACHE_VERSION and
+                    cached_layout == layout and
+                    pixel_coord_to_led_index.shape == (self.__height, self.__width) and
+                    virtual_to_physical_byte_indices.shape == (self.__height, self.__width, 4)
+                ):
+                    return pixel_coord_to_led_index, virtual_to_physical_byte_indices
+
+                _log.info("The LED index cache file '%s' is outdated.", cache_file)
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError, KeyError) as e:
+                _log.warning("Failed to load the LED index cache file '%s'.", cache_file, exc_info=e)
+
+            # (re-)create the cache file
+            (
+                pixel_coord_to_led_index,
+                virtual_to_physical_byte_indices
+            ) = self.__create_pixel_to_led_index_datastructures()
 
-        def __create_pixel_to_led_index_datastructures(self) -> tuple[NDArray[np.int_], NDArray[np.int_]]:
-            pixel_coord_to_led_index: NDArray[np.int_] = np.zeros((self.__height, self.__width),
-                                                                  dtype=np.int_)
-            virtual_to_physical_byte_indices: NDArray[np.int_] = np.zeros((self.__height, self.__width, 4),
-                                                                          dtype=np.int_)
+            try:
+                INDEX_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                replace_file(cache_file,
+                             lambda f: np.savez(f,
+                                                version=np.array(INDEX_CACHE_VERSION),
+                                                layout=np.array(layout),
+                                                pixel_coord_to_led_index=pixel_coord_to_led_index,
+                                                virtual_to_physical_byte_indices=virtual_to_physical_byte_indices),
+                             binary=True)
+            except OSError as e:
+                _log.warning("Failed to write the LED index cache file '%s'.", cache_file, exc_info=e)
+
+            return pixel_coord_to_led_index, virtual_to_physical_byte_indices
 
+        def __create_pixel_to_led_index_datastructures(self) -> tuple[NDArray[np.int_], NDArray[np.int_]]:
             outer: int
             inner: int
             outer, inner = (
@@ -95,9 +392,9 @@ if sys.platform == "linux":
                 else
                     (self.__width, self.__height)
             )
-            current_outer_count: int = 0
-            outer_range: Iterable[int] = range(outer)
 
+            # the matrix line of each line of the LED chain
+            outer_indices: NDArray[np.int_] = np.arange(outer)
             if (
                 (self.__orientation == LEDOrientation.HORIZONTALLY and
                     self.__origin in (LEDOrigin.BOTTOM_LEFT, LEDOrigin.BOTTOM_RIGHT))
@@ -105,54 +402,48 @@ if sys.platform == "linux":
                 (self.__orientation == LEDOrientation.VERTICALLY and
                     self.__origin in (LEDOrigin.TOP_RIGHT, LEDOrigin.BOTTOM_RIGHT))
             ):
-                outer_range = reversed(outer_range)
-
-            i: int
-            for i in outer_range:
-                current_inner_count: int = 0
-
-                j: int
-                for j in range(inner):
-                    mod: int = (0 if self.__orientation == LEDOrientation.HORIZONTALLY and
-                                    ((self.__origin == LEDOrigin.BOTTOM_LEFT and
-                                        outer % 2 == 0) or
-                                    (self.__origin == LEDOrigin.BOTTOM_RIGHT and
-                                        outer % 2 == 1) or
-                                    self.__origin == LEDOrigin.TOP_RIGHT)
-                                or
-                                    self.__orientation == LEDOrientation.VERTICALLY and
-                                    ((self.__origin == LEDOrigin.TOP_RIGHT and
-                                        outer % 2 == 0) or
-                                    (self.__origin == LEDOrigin.BOTTOM_RIGHT and
-                                        outer % 2 == 1) or
-                                    self.__origin == LEDOrigin.BOTTOM_LEFT)
-                                else 1)
-
-                    if (
-                        (self.__wire_mode == LEDWireMode.ZIG_ZAG and i % 2 == mod)
+                outer_indices = outer_indices[::-1]
+
+            mod: int = (0 if self.__orientation == LEDOrientation.HORIZONTALLY and
+                            ((self.__origin == LEDOrigin.BOTTOM_LEFT and
+                                outer % 2 == 0) or
+                            (self.__origin == LEDOrigin.BOTTOM_RIGHT and
+                                outer % 2 == 1) or
+                            self.__origin == LEDOrigin.TOP_RIGHT)
                         or
-                        (self.__wire_mode == LEDWireMode.LINE_BY_LINE and (
-                                (self.__orientation == LEDOrientation.HORIZONTALLY and
-                                    self.__origin in (LEDOrigin.BOTTOM_RIGHT, LEDOrigin.TOP_RIGHT))
-                                or
-                                (self.__orientation == LEDOrientation.VERTICALLY and
-                                    self.__origin in (LEDOrigin.BOTTOM_LEFT, LEDOrigin.BOTTOM_RIGHT))
-                            )
-                        )
-                    ):
-                        j = (inner - 1) - current_inner_count
-
-                    led_index: int = j + current_outer_count * inner
-                    coordinate: tuple[int, int] = (
-                        (i, current_inner_count) if
-                            self.__orientation == LEDOrientation.HORIZONTALLY
-                        else
-                            (current_inner_count, i)
-                    )
-                    pixel_coord_to_led_index[coordinate] = led_index
-
-                    current_inner_count += 1
-                current_outer_count += 1
+                            self.__orientation == LEDOrientation.VERTICALLY and
+                            ((self.__origin == LEDOrigin.TOP_RIGHT and
+                                outer % 2 == 0) or
+                            (self.__origin == LEDOrigin.BOTTOM_RIGHT and
+                                outer % 2 == 1) or
+                            self.__origin == LEDOrigin.BOTTOM_LEFT)
+                        else 1)
+
+            # the lines of the LED chain that run in the opposite direction of the matrix lines
+            reversed_lines: NDArray[np.bool_]
+            if self.__wire_mode == LEDWireMode.ZIG_ZAG:
+                reversed_lines = outer_indices % 2 == mod
+            else:
+                reversed_lines = np.full(outer, (
+                    (self.__orientation == LEDOrientation.HORIZONTALLY and
+                        self.__origin in (LEDOrigin.BOTTOM_RIGHT, LEDOrigin.TOP_RIGHT))
+                    or
+                    (self.__orientation == LEDOrientation.VERTICALLY and
+                        self.__origin in (LEDOrigin.BOTTOM_LEFT, LEDOrigin.BOTTOM_RIGHT))
+                ))
+
+            # led index for each line of the LED chain and each position in the matrix line
+            inner_indices: NDArray[np.int_] = np.arange(inner)
+            led_indices: NDArray[np.int_] = (
+                np.where(reversed_lines[:, np.newaxis], (inner - 1) - inner_indices, inner_indices) +
+                np.arange(outer)[:, np.newaxis] * inner
+            )
+
+            # sort the lines of the LED chain by their matrix line
+            pixel_coord_to_led_index: NDArray[np.int_] = np.empty((outer, inner), dtype=np.int_)
+            pixel_coord_to_led_index[outer_indices] = led_indices
+            if self.__orientation == LEDOrientation.VERTICALLY:
+                pixel_coord_to_led_index = np.ascontiguousarray(pixel_coord_to_led_index.T)
 
             red: int
             green: int
@@ -171,31 +462,13 @@ if sys.platform == "linux":
             else:
                 red, green, blue = 2, 3, 1
 
-            pixel_index: int
-            for pixel_index in range(self._config.main.num_of_pixels):
-                # for each pixel in buffer
-                # calulate byte indices of pixel
-                pixel_index_spread: int = pixel_index * 4  # room for byte led,r,g,b
-                pixel_bytes_indices: list[int] = [
-                    pixel_index_spread,
-                    pixel_index_spread + red,
-                    pixel_index_spread + green,
-                    pixel_index_spread + blue
-                ]
-
-                # get coordinate of ith pixel
-                pixel_row: int = pixel_index // self.__width
-                pixel_col: int = pixel_index - pixel_row * self.__width
-
-                # get led index of led at pixel coordinate
-                led_index: int = pixel_coord_to_led_index[(pixel_row, pixel_col)]
-
-                # get coordinate of ith led
-                led_row: int = led_index // self.__width
-                led_col: int = led_index - led_row * self.__width
-
-                # set the transformation matrix accordingly
-                virtual_to_physical_byte_indices[(led_row, led_col)] = pixel_bytes_indices
+            # for each pixel in buffer: the byte indices of the pixel (room for byte led,r,g,b)
+            # are placed at the led of the pixel coordinate
+            virtual_to_physical_byte_indices: NDArray[np.int_] = np.empty((self.__height, self.__width, 4),
+                                                                          dtype=np.int_)
+            virtual_to_physical_byte_indices.reshape(-1, 4)[pixel_coord_to_led_index.reshape(-1)] = (
+                np.arange(self._config.main.num_of_pixels)[:, np.newaxis] * 4 + np.array([0, red, green, blue])
+            )
 
             return pixel_coord_to_led_index, virtual_to_physical_byte_indices
 
@@ -221,30 +494,6 @@ if sys.platform == "linux":
 
             return ret
 
-        def __build_apa102_frame(self, frame_buffer: NDArray[np.uint8]) -> NDArray[np.uint8]:
-            # if there is a brightness offset,
-            # lower the color values proportionately
-            led_frame_with_brightness: NDArray[np.uint8]
-            if self.__brightness_ceiling_offset > 0:
-                led_frame_with_brightness = (
-                    # current value   -
-                    frame_buffer - \
-                    #       (one brightness step of the current value   * brightness offset in percent    )
-                    np.ceil(((frame_buffer / (MAX_BRIGHTNESS + 1)) * self.__brightness_ceiling_offset))
-                ).astype(np.uint8)
-            else:
-                led_frame_with_brightness: NDArray[np.uint8] = frame_buffer
-
-            return np.concatenate((self.__led_frame_start_array, led_frame_with_brightness), axis=2)
-
-        def __correct_gamma(self, rw_buffer: NDArray[np.uint8]) -> None:
-            x: tuple[NDArray[np.uint8], ...]
-            for x in np.nditer(rw_buffer,
-                               op_flags=[['readwrite']],
-                               flags=['external_loop', 'buffered'],
-                               order='F'):
-                x[...] = self.__gamma8[x]  # type: ignore
-
         def set_brightness(self, brightness: int) -> None:
             # set the brightness level for the LEDs
             logarithmic_percentage: float = (math.pow(10, (brightness / 100)) - 1) / 9
@@ -253,29 +502,36 @@ if sys.platform == "linux":
             # this value is used for the in the start byte of the LED array
             led_brightness: int = math.ceil(abs_brightness)
 
-            # this value represents the offset that is lost due to ceiling the brightness value
-            # 1 < self.__brightness_ceiling_offset <= 0
-            self.__brightness_ceiling_offset = led_brightness - abs_brightness
+            with self.__pending_settings_lock:
+                self.__pending_brightness = (
+                    # set LED frame start byte according to the brightness
+                    (led_brightness & ~self.__led_frame_empty_start_byte) | self.__led_frame_empty_start_byte,
+                    # this value represents the offset that is lost due to ceiling the brightness value
+                    # 1 < self.__brightness_ceiling_offset <= 0
+                    led_brightness - abs_brightness
+                )
 
-            # set LED frame start byte according to the brightness
-            self.__led_frame_start_array.fill(
-                (led_brightness & ~self.__led_frame_empty_start_byte) | self.__led_frame_empty_start_byte
-            )
+            # the brightness is applied with the next frame, so it must be shown even if it did not change
+            self._request_redraw()
 
         def show(self, gamma: bool=False) -> None:
-            buffer: NDArray[np.uint8]
-            if gamma:
-                buffer = np.copy(self.frame_buffer)
-                self.__correct_gamma(buffer)
-            else:
-                buffer = self.frame_buffer
+            self.__apply_pending_settings()
 
-            apa102_led_frames: NDArray[np.uint8] = self.__build_apa102_frame(buffer)
-            reindexed_frames: NDArray[np.uint8] = apa102_led_frames.take(self.__virtual_to_physical_byte_indices)
+            color_lut: NDArray[np.uint8] = self.__color_lut_gamma if gamma else self.__color_lut
 
-            to_send: list[int] = (
-                self.__start_frame +
-                reindexed_frames.flatten().tolist() +
-                self.__end_frame
-            )
-            self.__spi.writebytes(to_send)
+            frame_buffer: NDArray[np.uint8] = self.frame_buffer.reshape(-1)
+
+            shard: _Apa102Shard
+            for shard in self.__shards:
+                shard.fill(frame_buffer, color_lut.reshape(-1))
+
+            # release all parts of the frame together, so that no shard shows a newer frame than the others
+            for shard in self.__shards:
+                shard.wait_idle()
+            for shard in self.__shards:
+                shard.submit()
+
+        def close(self) -> None:
+            shard: _Apa102Shard
+            for shard in self.__shards:
+                shard.close()
@@ -0,0 +1,70 @@
+"""
+This module implements a display that shows the frames on several other displays at the same time.
+"""
+import numpy as np
+from numpy.typing import NDArray
+
+from led_matrix.common.frame_pool import FramePool
+from led_matrix.config.settings import Settings
+from led_matrix.config.types import Hardware
+from led_matrix.display.abstract import AbstractDisplay
+from led_matrix.display.output import DisplayOutput
+from led_matrix.display.registry import get_display_class
+
+
+class Composite(AbstractDisplay):
+    def __init__(self, config: Settings) -> None:
+        super().__init__(config=config)
+
+        displays: tuple[Hardware, ...] = config.composite.displays
+        if not displays:
+            raise RuntimeError("A composite display needs at least one display.")
+        if Hardware.COMPOSITE in displays:
+            raise RuntimeError("A composite display cannot contain another composite display.")
+
+        # the hardware of a display can only be driven once, e.g. an APA102 matrix on its SPI device
+        duplicates: list[str] = sorted({hardware.name for hardware in displays if displays.count(hardware) > 1})
+        if duplicates:
+            raise RuntimeError(f"A composite display can contain each display only once, not: {', '.join(duplicates)}")
+
+        # each display gets its own output thread, so a slow one only drops its own frames
+        self.__outputs: list[tuple[AbstractDisplay, DisplayOutput]] = []
+        # the color corrected frames are shared by all displays
+        # a buffer is reused once every display has presented it
+        self.__frame_pool: FramePool = FramePool(width=config.main.display_width,
+                                                 height=config.main.display_height,
+                                                 size=2 * len(displays))
+
+        hardware: Hardware
+        for hardware in displays:
+            display: AbstractDisplay = get_display_class(hardware)(config=config)
+
+            # the frames are already presented at the refresh rate, so the outputs do not need to limit it again
+            output: DisplayOutput = DisplayOutput(display=display, refresh_rate=0, frame_pool=self.__frame_pool)
+            output.start()
+
+            self.__outputs.append((display, output))
+
+    def show(self, gamma: bool=False) -> None:
+        # the color temperature is applied once here, the displays keep the neutral one
+        frame: NDArray[np.uint8] = self._apply_color_lut(self._color_temp_lut, self.frame_buffer,
+                                                         out=self.__frame_pool.lease(users=len(self.__outputs)))
+
+        output: DisplayOutput
+        for _, output in self.__outputs:
+            output.submit(frame, gamma=gamma)
+
+    def set_brightness(self, brightness: int) -> None:
+        display: AbstractDisplay
+        for display, _ in self.__outputs:
+            display.set_brightness(brightness)
+
+        self._request_redraw()
+
+    def close(self) -> None:
+        display: AbstractDisplay
+        output: DisplayOutput
+        for display, output in self.__outputs:
+            output.stop()
+            display.clear()
+            display.close()
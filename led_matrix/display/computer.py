@@ -1,18 +1,16 @@
-import queue
-from queue import Queue
 from threading import Thread
 from typing import Final
 
 import numpy as np
 import pygame
 from numpy.typing import NDArray
-from pygame import Vector2
 from pygame.color import Color
 from pygame.event import Event
 from pygame.rect import Rect
 from pygame.surface import Surface
 from pygame.time import Clock
 
+from led_matrix.common.threading import Mailbox
 from led_matrix.config.settings import Settings
 from led_matrix.display.abstract import AbstractDisplay
 from led_matrix.main import MainController
@@ -28,8 +26,11 @@ class _PygameDisplayThread(Thread):
         self.__margin: int = margin
         self.__size: int = size
 
-        self.__display_queue: Queue[NDArray[np.uint8]] = Queue()
+        # only the latest frame is kept, frames that arrive faster than they are drawn get dropped
+        self.__display_mailbox: Mailbox[NDArray[np.uint8]] = Mailbox()
         self.__last_frame: NDArray[np.uint8] | None = None
+        # set if the last frame must be drawn again, e.g. on brightness change
+        self.__redraw_last_frame: bool = False
 
         self.__brightness: float = 100.
 
@@ -50,6 +51,20 @@ class _PygameDisplayThread(Thread):
         # clock to handle fps
         self.__clock: Clock = Clock()
 
+        # preallocated buffers for the computation of the image
+        # all are in the (x, y) order of pygame
+        self.__led_colors: NDArray[np.float32] = np.zeros((width, height, 3), dtype=np.float32)
+        self.__led_pixels: NDArray[np.float32] = np.zeros((width * height, size, size, 3), dtype=np.float32)
+        # the LED colors that are currently on the surface, to redraw only the changed LEDs
+        self.__drawn_led_colors: NDArray[np.float32] = np.zeros_like(self.__led_colors)
+        self.__changed_led_channels: NDArray[np.bool_] = np.zeros((width, height, 3), dtype=np.bool_)
+        self.__changed_leds: NDArray[np.bool_] = np.zeros((width, height), dtype=np.bool_)
+        # set if all LEDs must be redrawn, e.g. on brightness change
+        self.__full_redraw: bool = True
+        # the intensity of each pixel of a simulated LED
+        # gets initialized after pygame
+        self.__led_mask: NDArray[np.float32]
+
     def __get_led_surface(self, led_color: Color) -> Surface | None:
         if (led_color.r, led_color.g, led_color.b) == (0, 0, 0):
             # do not simulate a black (off) LED
@@ -86,50 +101,91 @@ class _PygameDisplayThread(Thread):
 
         return led_surface
 
-    def __draw_frame(self, surface: Surface, frame: NDArray[np.uint8]) -> None:
-        surface.fill(color=Color(0, 0, 0))
-
-        # lock brightness value
-        frame_brightness: float = self.__brightness
+    def __create_led_mask(self) -> NDArray[np.float32]:
+        # the simulated LED scales linearly with its color (up to saturation)
+        # so it is rendered once with a reference value to get the intensity of each of its pixels
+        reference_value: int = 200
+        led_surface: Surface | None = self.__get_led_surface(
+            led_color=Color(reference_value, reference_value, reference_value)
+        )
 
-        it: np.nditer = np.nditer([frame[..., 0],
-                                   frame[..., 1],
-                                   frame[..., 2]], flags=['multi_index'])
-        while not it.finished:
-            color: Color = Color(int(it[0] * frame_brightness),
-                                 int(it[1] * frame_brightness),
-                                 int(it[2] * frame_brightness))
+        # blend it on black like it is done on the main surface
+        led_on_black: Surface = Surface((self.__size, self.__size))
+        led_on_black.fill(color=Color(0, 0, 0))
+        led_on_black.blit(led_surface, dest=(0, 0))  # type: ignore
 
-            # get the LED surface
-            led_surface: Surface | None = self.__get_led_surface(led_color=color)
+        return (pygame.surfarray.array3d(led_on_black)[..., 0] / reference_value).astype(np.float32)
 
-            # None means the LED is off
-            if led_surface is not None:
-                row: int
-                column: int
-                (row, column) = it.multi_index
-
-                # the position of the LED on the main surface
-                led_pos: Vector2 = Vector2(x=(self.__margin + self.__size) * column + self.__margin,
-                                           y=(self.__margin + self.__size) * row + self.__margin)
-
-                # add the LED surface to the main one
-                surface.blit(led_surface, dest=led_pos)
+    def __draw_frame(self, surface: Surface, frame: NDArray[np.uint8]) -> list[Rect]:
+        """Draw the LEDs that have changed. Returns the areas of the surface that must be updated."""
+        # lock brightness value
+        frame_brightness: float = self.__brightness
 
-            it.iternext()
+        np.multiply(frame.transpose(1, 0, 2), frame_brightness, out=self.__led_colors, casting="unsafe")
+        # truncate like the int() conversion of single colors
+        np.trunc(self.__led_colors, out=self.__led_colors)
+        # and like the division into the smoothness steps of the LED surface
+        np.floor_divide(self.__led_colors, self.__circular_smoothness_steps, out=self.__led_colors)
+        np.multiply(self.__led_colors, self.__circular_smoothness_steps, out=self.__led_colors)
+
+        # find the LEDs that differ from the drawn ones
+        if self.__full_redraw:
+            self.__changed_leds.fill(True)
+        else:
+            np.not_equal(self.__led_colors, self.__drawn_led_colors, out=self.__changed_led_channels)
+            np.any(self.__changed_led_channels, axis=2, out=self.__changed_leds)
+
+        changed_x: NDArray[np.int_]
+        changed_y: NDArray[np.int_]
+        changed_x, changed_y = np.nonzero(self.__changed_leds)
+        if len(changed_x) == 0:
+            return []
+
+        # color x mask for every changed LED at once
+        led_pixels: NDArray[np.float32] = self.__led_pixels[:len(changed_x)]
+        np.multiply(self.__led_colors[changed_x, changed_y][:, np.newaxis, np.newaxis, :],
+                    self.__led_mask[np.newaxis, :, :, np.newaxis],
+                    out=led_pixels)
+        np.minimum(led_pixels, 255, out=led_pixels)
+
+        # view on the LED cells of the surface: (column, x in cell, row, y in cell, color)
+        # the cells start after the first margin and are followed by their own margin, which stays black
+        cell_pitch: int = self.__size + self.__margin
+        surface_pixels: NDArray[np.uint8] = pygame.surfarray.pixels3d(surface)
+        led_cells: NDArray[np.uint8] = surface_pixels[self.__margin:, self.__margin:].reshape(
+            self.__width, cell_pitch, self.__height, cell_pitch, 3
+        )[:, :self.__size, :, :self.__size]
+        led_cells[changed_x, :, changed_y, :] = led_pixels
+        # unlock the surface
+        del led_cells, surface_pixels
+
+        np.copyto(self.__drawn_led_colors, self.__led_colors)
+
+        if self.__full_redraw:
+            self.__full_redraw = False
+            return [surface.get_rect()]
+
+        return [Rect(self.__margin + x * cell_pitch, self.__margin + y * cell_pitch, self.__size, self.__size)
+                for x, y in zip(changed_x.tolist(), changed_y.tolist())]
+
+    @property
+    def dropped_frames(self) -> int:
+        """The number of frames that were replaced by a newer one before they were drawn."""
+        return self.__display_mailbox.dropped
 
     def display_frame(self, frame: NDArray[np.uint8]) -> None:
-        # queue the frame
-        self.__display_queue.put(frame)
+        # replace a frame that was not drawn yet
+        self.__display_mailbox.put(frame)
 
     def set_brightness(self, brightness: int) -> None:
         # expecting float brightness 0 .. 1.0
         self.__brightness = brightness / 100
+        # all LEDs change with the brightness
+        self.__full_redraw = True
 
-        # re-add the last frame to the display queue on brightness change
-        # this triggers an immediate redraw of the frame
-        if self.__last_frame is not None:
-            self.__display_queue.put(self.__last_frame)
+        # redraw the last frame on brightness change
+        # it is not put into the mailbox again, because that would replace a newer frame
+        self.__redraw_last_frame = True
 
     def run(self) -> None:
         # pygame must be initialized in the thread that updates the display
@@ -137,8 +193,17 @@ class _PygameDisplayThread(Thread):
         surface: Surface = pygame.display.set_mode(self.__window_size)
         pygame.display.set_caption(f"LED-Matrix {self.__width}x{self.__height}")
 
+        self.__led_mask = self.__create_led_mask()
+
+        # the margins are never drawn again
+        surface.fill(color=Color(0, 0, 0))
+        pygame.display.update()
+
         # start the main loop
         while True:
+            # the areas of the window that changed
+            update_rects: list[Rect] = []
+
             try:
                 event: Event
                 for event in pygame.event.get():
@@ -147,25 +212,29 @@ class _PygameDisplayThread(Thread):
                         # stop everything
                         MainController.quit()
                         return
+                    if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                        # the window must be redrawn completely
+                        update_rects.append(surface.get_rect())
             except pygame.error:
                 # this error is normally thrown if we are already shutting down...
                 return
 
-            try:
+            frame: NDArray[np.uint8] | None = self.__display_mailbox.get_nowait()
+            if self.__redraw_last_frame:
+                self.__redraw_last_frame = False
+                if frame is None:
+                    frame = self.__last_frame
+
+            if frame is not None:
                 # preserve the last frame to be able to redraw it
                 # needed on brightness change
-                self.__last_frame = self.__display_queue.get(block=False)
-            except queue.Empty:
-                # just continue here
-                pass
-            else:
-                self.__draw_frame(surface=surface,
-                                  frame=self.__last_frame)
+                self.__last_frame = frame
+                update_rects.extend(self.__draw_frame(surface=surface,
+                                                      frame=frame))
 
-                self.__display_queue.task_done()
-
-            # draw the game screen
-            pygame.display.update()
+            # draw the changed areas of the game screen
+            if update_rects:
+                pygame.display.update(update_rects)
 
             # limit the FPS by sleeping for the remainder of the frame time
             self.__clock.tick(_PygameDisplayThread.MAX_FPS)
@@ -187,5 +256,10 @@ class Computer(AbstractDisplay):
         # forward brightness to pygame thread
         self.__pygame_thread.set_brightness(brightness)
 
+    @property
+    def dropped_frames(self) -> int:
+        """The number of frames that were not drawn, because a newer one arrived in the meantime."""
+        return self.__pygame_thread.dropped_frames
+
     def show(self, gamma: bool=False) -> None:
-        self.__pygame_thread.display_frame(frame=self.frame_buffer)
+        self.__pygame_thread.display_frame(frame=self._apply_color_lut(self._color_temp_lut, self.frame_buffer))
@@ -0,0 +1,95 @@
+"""
+This module implements a display that shows the frames nowhere.
+It is used for benchmarking without any display hardware.
+"""
+import time
+import zlib
+from logging import Logger
+from typing import Final
+
+import numpy as np
+from numpy.typing import NDArray
+
+from led_matrix.common.log import LOG
+from led_matrix.config.settings import Settings
+from led_matrix.display.abstract import AbstractDisplay
+
+
+class Headless(AbstractDisplay):
+    # upper bounds of the present interval histogram buckets in milliseconds
+    # the last bucket counts all longer intervals
+    HISTOGRAM_BUCKETS_MS: Final[NDArray[np.float64]] = np.array([1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024],
+                                                                dtype=np.float64)
+
+    def __init__(self, config: Settings) -> None:
+        super().__init__(config=config)
+
+        self.__log: Logger = LOG.create(Headless.__name__)
+
+        self.__checksum_enabled: bool = config.headless.checksum
+        self.__checksum: int | None = None
+
+        self.__frames_shown: int = 0
+        self.__first_show_time: float | None = None
+        self.__last_show_time: float | None = None
+        self.__present_interval_histogram: NDArray[np.int_] = np.zeros(len(Headless.HISTOGRAM_BUCKETS_MS) + 1,
+                                                                       dtype=np.int_)
+
+    @property
+    def frames_shown(self) -> int:
+        return self.__frames_shown
+
+    @property
+    def checksum(self) -> int | None:
+        """CRC32 of the last shown frame buffer. None if checksums are disabled."""
+        return self.__checksum
+
+    @property
+    def present_interval_histogram(self) -> NDArray[np.int_]:
+        """Number of intervals between two shown frames per bucket of HISTOGRAM_BUCKETS_MS."""
+        return self.__present_interval_histogram
+
+    @property
+    def frames_per_second(self) -> float:
+        """The average rate of the shown frames."""
+        if (
+            self.__first_show_time is None or
+            self.__last_show_time is None or
+            self.__last_show_time == self.__first_show_time
+        ):
+            return 0.
+
+        return (self.__frames_shown - 1) / (self.__last_show_time - self.__first_show_time)
+
+    def show(self, gamma: bool=False) -> None:
+        now: float = time.perf_counter()
+
+        if self.__last_show_time is not None:
+            interval_ms: float = (now - self.__last_show_time) * 1000
+            self.__present_interval_histogram[np.searchsorted(Headless.HISTOGRAM_BUCKETS_MS, interval_ms)] += 1
+        else:
+            self.__first_show_time = now
+        self.__last_show_time = now
+
+        self.__frames_shown += 1
+
+        if self.__checksum_enabled:
+            self.__checksum = zlib.crc32(self.frame_buffer)
+
+    def set_brightness(self, brightness: int) -> None:
+        # there is nothing to dim
+        pass
+
+    def close(self) -> None:
+        self.__log.info("Received %d frames, %d changed, %d shown (%.2f fps)",
+                        self.frames_received,
+                        self.frames_changed,
+                        self.__frames_shown,
+                        self.frames_per_second)
+
+        bucket_names: list[str] = [f"<={int(bound)}ms" for bound in Headless.HISTOGRAM_BUCKETS_MS]
+        bucket_names.append(f">{int(Headless.HISTOGRAM_BUCKETS_MS[-1])}ms")
+        self.__log.info("Present intervals: %s",
+                        ", ".join(f"{name}: {count}"
+                                  for name, count in zip(bucket_names, self.__present_interval_histogram)
+                                  if count))
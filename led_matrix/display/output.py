@@ -0,0 +1,218 @@
+"""
+This module sends the frames to the display in its own thread.
+"""
+import time
+from dataclasses import dataclass
+from logging import Logger
+from threading import Event, Thread
+from typing import Callable, Final
+
+import numpy as np
+from numpy.typing import NDArray
+
+from led_matrix.common.frame_pool import FramePool
+from led_matrix.common.log import LOG
+from led_matrix.common.threading import Mailbox
+from led_matrix.display.abstract import AbstractDisplay
+
+
+@dataclass(kw_only=True)
+class PresentStatistics:
+    """The statistics of the presented frames since the last report."""
+    presented: int = 0
+    dropped: int = 0
+    # time between the submission of a frame and the end of its presentation in seconds
+    last_latency: float = 0.
+    max_latency: float = 0.
+    total_latency: float = 0.
+    # time of copying the frames into the buffer of the display in seconds
+    max_update_time: float = 0.
+    total_update_time: float = 0.
+    # the frames that changed the buffer, only they are shown
+    shown: int = 0
+    # time of showing the frames on the display in seconds, e.g. the SPI transfer
+    max_show_time: float = 0.
+    total_show_time: float = 0.
+
+    @property
+    def mean_latency(self) -> float:
+        if self.presented == 0:
+            return 0.
+
+        return self.total_latency / self.presented
+
+    @property
+    def mean_update_time(self) -> float:
+        if self.presented == 0:
+            return 0.
+
+        return self.total_update_time / self.presented
+
+    @property
+    def mean_show_time(self) -> float:
+        if self.shown == 0:
+            return 0.
+
+        return self.total_show_time / self.shown
+
+
+class DisplayOutput(Thread):
+    """
+    Presents the newest submitted frame at a fixed refresh rate.
+    Frames that are replaced before they could be presented are dropped.
+    """
+    # interval in seconds in which the statistics are logged
+    REPORT_INTERVAL: Final[float] = 60.
+
+    def __init__(self, display: AbstractDisplay, refresh_rate: int,
+                 frame_pool: FramePool | None=None,
+                 on_first_frame_presented: Callable[[], None] | None=None) -> None:
+        super().__init__(daemon=True)
+
+        if refresh_rate < 0:
+            raise ValueError(f"The display refresh rate must not be negative, not '{refresh_rate}'.")
+
+        self.__log: Logger = LOG.create(DisplayOutput.__name__)
+
+        self.__display: AbstractDisplay = display
+        # the frames are returned to this pool after they were presented or dropped
+        self.__frame_pool: FramePool | None = frame_pool
+        # a refresh rate of zero means no limit
+        self.__frame_interval: float = 1 / refresh_rate if refresh_rate > 0 else 0.
+
+        # the frame, the time it was submitted and if gamma correction is applied
+        # None wakes up the thread on stop
+        self.__mailbox: Mailbox[tuple[NDArray[np.uint8], float, bool] | None] = Mailbox()
+        self.__stop_event: Event = Event()
+        self.__first_frame_presented: Event = Event()
+        self.__on_first_frame_presented: Callable[[], None] | None = on_first_frame_presented
+
+        self.__statistics: PresentStatistics = PresentStatistics()
+        self.__last_report: float = time.monotonic()
+        self.__dropped_before_report: int = 0
+        # frames that were taken, but replaced by a newer one while waiting for the refresh
+        self.__superseded: int = 0
+
+    @property
+    def statistics(self) -> PresentStatistics:
+        """The statistics since the last report."""
+        self.__statistics.dropped = self.__mailbox.dropped - self.__dropped_before_report + self.__superseded
+        return self.__statistics
+
+    def submit(self, frame: NDArray[np.uint8], gamma: bool=True) -> None:
+        """
+        Hand over a frame. It replaces an older frame that was not presented yet.
+        @param gamma: True if the display should apply gamma correction to the frame.
+        """
+        replaced: tuple[NDArray[np.uint8], float, bool] | None = self.__mailbox.put((frame, time.monotonic(), gamma))
+        if replaced is not None:
+            self.__release(replaced[0])
+
+    @property
+    def first_frame_presented(self) -> bool:
+        return self.__first_frame_presented.is_set()
+
+    def stop(self) -> None:
+        """Stop presenting frames. Blocks until the current frame is presented."""
+        self.__stop_event.set()
+        # wake up the thread if it waits for a frame
+        replaced: tuple[NDArray[np.uint8], float, bool] | None = self.__mailbox.put(None)
+        if replaced is not None:
+            self.__release(replaced[0])
+
+        if self.is_alive():
+            self.join()
+
+        # return a frame that was not presented anymore
+        remaining: tuple[NDArray[np.uint8], float, bool] | None = self.__mailbox.clear()
+        if remaining is not None:
+            self.__release(remaining[0])
+
+    def __release(self, frame: NDArray[np.uint8]) -> None:
+        if self.__frame_pool is not None:
+            self.__frame_pool.release(frame)
+
+    def __present(self, frame: NDArray[np.uint8], submit_time: float, gamma: bool) -> None:
+        # the time of the display itself is measured apart from the time the frame waited
+        update_start: float = time.monotonic()
+        changed: bool = self.__display.update_frame_buffer(frame)
+        update_end: float = time.monotonic()
+        # the display has its own copy of the frame
+        self.__release(frame)
+
+        update_time: float = update_end - update_start
+        self.__statistics.max_update_time = max(self.__statistics.max_update_time, update_time)
+        self.__statistics.total_update_time += update_time
+
+        # only show the frame if it has changed
+        if changed:
+            self.__display.show(gamma=gamma)
+
+            show_time: float = time.monotonic() - update_end
+            self.__statistics.shown += 1
+            self.__statistics.max_show_time = max(self.__statistics.max_show_time, show_time)
+            self.__statistics.total_show_time += show_time
+
+        latency: float = time.monotonic() - submit_time
+
+        self.__statistics.presented += 1
+        self.__statistics.last_latency = latency
+        self.__statistics.max_latency = max(self.__statistics.max_latency, latency)
+        self.__statistics.total_latency += latency
+
+        if not self.__first_frame_presented.is_set():
+            self.__first_frame_presented.set()
+            if self.__on_first_frame_presented is not None:
+                self.__on_first_frame_presented()
+
+    def __report(self) -> None:
+        now: float = time.monotonic()
+        if now - self.__last_report < DisplayOutput.REPORT_INTERVAL:
+            return
+
+        statistics: PresentStatistics = self.statistics
+        self.__log.debug("Presented %d frames (%d dropped, %d shown), latency: mean %.2f ms, max %.2f ms, "
+                         "update: mean %.2f ms, max %.2f ms, show: mean %.2f ms, max %.2f ms",
+                         statistics.presented,
+                         statistics.dropped,
+                         statistics.shown,
+                         statistics.mean_latency * 1000,
+                         statistics.max_latency * 1000,
+                         statistics.mean_update_time * 1000,
+                         statistics.max_update_time * 1000,
+                         statistics.mean_show_time * 1000,
+                         statistics.max_show_time * 1000)
+
+        # start a new report period
+        self.__statistics = PresentStatistics()
+        self.__dropped_before_report = self.__mailbox.dropped
+        self.__superseded = 0
+        self.__last_report = now
+
+    def run(self) -> None:
+        next_present: float = time.monotonic()
+
+        while not self.__stop_event.is_set():
+            # sleep until a frame is submitted or the thread is stopped
+            frame: tuple[NDArray[np.uint8], float, bool] | None = self.__mailbox.get()
+            if frame is None:
+                continue
+
+            # do not present faster than the refresh rate
+            self.__stop_event.wait(max(0., next_present - time.monotonic()))
+            if self.__stop_event.is_set():
+                self.__release(frame[0])
+                break
+
+            # a newer frame could be submitted in the meantime
+            newer_frame: tuple[NDArray[np.uint8], float, bool] | None = self.__mailbox.get_nowait()
+            if newer_frame is not None:
+                self.__release(frame[0])
+                frame = newer_frame
+                self.__superseded += 1
+
+            present_start: float = time.monotonic()
+            self.__present(*frame)
+            self.__report()
+
+            next_present = max(next_present, present_start) + self.__frame_interval
@@ -0,0 +1,235 @@
+"""
+This module implements a display that records the frames to a file.
+The recordings can be read with the RecordingReader class.
+
+File layout (little endian):
+    file header (16 bytes):
+        magic b'LEDMREC\\0', version (u16), width (u16), height (u16), reserved (u16)
+    records:
+        presentation timestamp in ns since the epoch (u64), payload size (u32), kind (u8), brightness (u8),
+        reserved (u16), payload
+
+The payload depends on the kind of the record (see RecordKind).
+"""
+import mmap
+import struct
+import time
+import zlib
+from collections.abc import Iterator
+from datetime import datetime
+from enum import IntEnum
+from io import BufferedWriter
+from pathlib import Path
+from typing import Final, NamedTuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from led_matrix.config.settings import Settings
+from led_matrix.display.abstract import AbstractDisplay
+
+RECORDING_MAGIC: Final[bytes] = b"LEDMREC\0"
+RECORDING_VERSION: Final[int] = 1
+RECORDING_SUFFIX: Final[str] = ".ledrec"
+
+_FILE_HEADER: Final[struct.Struct] = struct.Struct("<8sHHHH")
+_RECORD_HEADER: Final[struct.Struct] = struct.Struct("<QIBBH")
+
+
+class RecordKind(IntEnum):
+    # the frame as raw RGB bytes
+    RAW = 0
+    # the zlib compressed raw RGB bytes
+    KEYFRAME = 1
+    # the zlib compressed XOR of the raw RGB bytes with the ones of the previous frame
+    DELTA = 2
+
+
+class Recorder(AbstractDisplay):
+    def __init__(self, config: Settings) -> None:
+        super().__init__(config=config)
+
+        self.__compression: bool = config.recorder.compression
+        self.__keyframe_interval: int = max(1, config.recorder.keyframe_interval)
+        self.__brightness: int = 100
+
+        # each start creates a new recording
+        config.recorder.directory.mkdir(parents=True, exist_ok=True)
+        self.__file_path: Path = (
+            config.recorder.directory / f"{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}{RECORDING_SUFFIX}"
+        )
+        self.__file: BufferedWriter = open(self.__file_path, "xb")  # pylint: disable=R1732
+        self.__file.write(_FILE_HEADER.pack(RECORDING_MAGIC, RECORDING_VERSION,
+                                            config.main.display_width, config.main.display_height, 0))
+
+        self.__frame_count: int = 0
+        # preallocated buffer for the frame with the applied color temperature
+        self.__frame: NDArray[np.uint8] = np.zeros_like(self.frame_buffer)
+        # the previous frame and a buffer for the difference to it, needed for delta compression
+        self.__previous_frame: NDArray[np.uint8] = np.zeros_like(self.frame_buffer)
+        self.__delta: NDArray[np.uint8] = np.zeros_like(self.frame_buffer)
+
+    @property
+    def file_path(self) -> Path:
+        return self.__file_path
+
+    def show(self, gamma: bool=False) -> None:
+        frame: NDArray[np.uint8] = self._apply_color_lut(self._color_temp_lut, self.frame_buffer, out=self.__frame)
+
+        kind: RecordKind
+        payload: bytes | NDArray[np.uint8]
+        if not self.__compression:
+            kind = RecordKind.RAW
+            payload = frame
+        elif self.__frame_count % self.__keyframe_interval == 0:
+            kind = RecordKind.KEYFRAME
+            payload = zlib.compress(frame)
+        else:
+            kind = RecordKind.DELTA
+            # unchanged pixels become zeros, which compress very well
+            np.bitwise_xor(frame, self.__previous_frame, out=self.__delta)
+            payload = zlib.compress(self.__delta)
+
+        self.__file.write(_RECORD_HEADER.pack(time.time_ns(), memoryview(payload).nbytes,
+                                              kind, self.__brightness, 0))
+        self.__file.write(payload)
+
+        # the current frame becomes the previous one, its old buffer is reused for the next frame
+        self.__frame, self.__previous_frame = self.__previous_frame, self.__frame
+        self.__frame_count += 1
+
+    def set_brightness(self, brightness: int) -> None:
+        # it is stored with every frame
+        self.__brightness = brightness
+
+        self._request_redraw()
+
+    def close(self) -> None:
+        self.__file.close()
+
+
+class RecordedFrame(NamedTuple):
+    frame: NDArray[np.uint8]
+    timestamp_ns: int
+    brightness: int
+
+
+class RecordingReader:
+    """
+    Reads a recording of the Recorder display.
+    The file is memory mapped and indexed once, so any frame can be accessed directly.
+    """
+    def __init__(self, file_path: Path) -> None:
+        with open(file_path, "rb") as f:
+            self.__mmap: mmap.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic: bytes
+        version: int
+        magic, version, self.__width, self.__height, _ = _FILE_HEADER.unpack_from(self.__mmap)
+        if magic != RECORDING_MAGIC or version != RECORDING_VERSION:
+            self.__mmap.close()
+            raise ValueError(f"'{file_path}' is not a LED-Matrix recording.")
+
+        # index all records
+        offsets: list[int] = []
+        sizes: list[int] = []
+        timestamps: list[int] = []
+        kinds: list[int] = []
+        brightnesses: list[int] = []
+
+        offset: int = _FILE_HEADER.size
+        # an incomplete last record (e.g. after a crash) is ignored
+        while offset + _RECORD_HEADER.size <= len(self.__mmap):
+            timestamp_ns: int
+            payload_size: int
+            kind: int
+            brightness: int
+            timestamp_ns, payload_size, kind, brightness, _ = _RECORD_HEADER.unpack_from(self.__mmap, offset)
+            if offset + _RECORD_HEADER.size + payload_size > len(self.__mmap):
+                break
+
+            offsets.append(offset + _RECORD_HEADER.size)
+            sizes.append(payload_size)
+            timestamps.append(timestamp_ns)
+            kinds.append(kind)
+            brightnesses.append(brightness)
+
+            offset += _RECORD_HEADER.size + payload_size
+
+        self.__payload_offsets: NDArray[np.int64] = np.array(offsets, dtype=np.int64)
+        self.__payload_ends: NDArray[np.int64] = self.__payload_offsets + np.array(sizes, dtype=np.int64)
+        self.__timestamps: NDArray[np.int64] = np.array(timestamps, dtype=np.int64)
+        self.__kinds: NDArray[np.uint8] = np.array(kinds, dtype=np.uint8)
+        self.__brightnesses: NDArray[np.uint8] = np.array(brightnesses, dtype=np.uint8)
+
+        # the last decoded frame speeds up reading the frames in order
+        self.__last_index: int | None = None
+        self.__last_frame: NDArray[np.uint8] = np.zeros((self.__height, self.__width, 3), dtype=np.uint8)
+
+    @property
+    def width(self) -> int:
+        return self.__width
+
+    @property
+    def height(self) -> int:
+        return self.__height
+
+    @property
+    def timestamps(self) -> NDArray[np.int64]:
+        """The presentation timestamps of all frames in ns since the epoch."""
+        return self.__timestamps
+
+    def __len__(self) -> int:
+        return len(self.__payload_offsets)
+
+    def __iter__(self) -> Iterator[RecordedFrame]:
+        i: int
+        for i in range(len(self)):
+            yield self[i]
+
+    def __payload(self, index: int) -> memoryview:
+        return memoryview(self.__mmap)[self.__payload_offsets[index]:self.__payload_ends[index]]
+
+    def __decode(self, index: int) -> None:
+        kind: RecordKind = RecordKind(self.__kinds[index])
+        payload: memoryview = self.__payload(index)
+
+        if kind == RecordKind.RAW:
+            self.__last_frame[...] = np.frombuffer(payload, dtype=np.uint8).reshape(self.__last_frame.shape)
+            payload.release()
+        else:
+            data: bytes = zlib.decompress(payload)
+            payload.release()
+
+            if kind == RecordKind.KEYFRAME:
+                self.__last_frame[...] = np.frombuffer(data, dtype=np.uint8).reshape(self.__last_frame.shape)
+            else:
+                # the previous frame must be decoded already
+                np.bitwise_xor(self.__last_frame,
+                               np.frombuffer(data, dtype=np.uint8).reshape(self.__last_frame.shape),
+                               out=self.__last_frame)
+
+        self.__last_index = index
+
+    def __getitem__(self, index: int) -> RecordedFrame:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("recording index out of range")
+
+        if index != self.__last_index:
+            # go back to the last frame that can be decoded on its own or that follows the last decoded one
+            start: int = index
+            while self.__kinds[start] == RecordKind.DELTA and start - 1 != self.__last_index and start > 0:
+                start -= 1
+
+            i: int
+            for i in range(start, index + 1):
+                self.__decode(i)
+
+        return RecordedFrame(frame=self.__last_frame.copy(),
+                             timestamp_ns=int(self.__timestamps[index]),
+                             brightness=int(self.__brightnesses[index]))
+
+    def close(self) -> None:
+        self.__mmap.close()
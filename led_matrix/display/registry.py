@@ -0,0 +1,50 @@
+"""
+This module maps the display hardware to the modules that implement it.
+Only the module of the selected hardware is imported, so the dependencies of the other displays are not needed.
+"""
+import importlib
+from threading import Lock
+from typing import Final, cast
+
+from led_matrix.config.types import Hardware
+from led_matrix.display.abstract import AbstractDisplay
+
+# the display classes as "module:Class"
+DISPLAY_BACKENDS: Final[dict[Hardware, str]] = {
+    Hardware.APA102: "led_matrix.display.apa102:Apa102",
+    Hardware.COMPUTER: "led_matrix.display.computer:Computer",
+    Hardware.HEADLESS: "led_matrix.display.headless:Headless",
+    Hardware.SHM: "led_matrix.display.shm:Shm",
+    Hardware.COMPOSITE: "led_matrix.display.composite:Composite",
+    Hardware.RECORDER: "led_matrix.display.recorder:Recorder"
+}
+
+# the already imported display classes, so a reload does not need to resolve them again
+_display_classes: dict[Hardware, type[AbstractDisplay]] = {}
+_display_classes_lock: Lock = Lock()
+
+
+def get_display_class(hardware: Hardware) -> type[AbstractDisplay]:
+    """
+    Import the module of the display hardware on the first call.
+    @return: The display class of the hardware.
+    """
+    with _display_classes_lock:
+        display_class: type[AbstractDisplay] | None = _display_classes.get(hardware, None)
+        if display_class is not None:
+            return display_class
+
+        try:
+            module_name, class_name = DISPLAY_BACKENDS[hardware].split(":", 1)
+        except KeyError as e:
+            raise RuntimeError(f"Display hardware '{hardware.name}' not known.") from e
+
+        try:
+            # some displays are only defined on supported platforms
+            display_class = cast(type[AbstractDisplay], getattr(importlib.import_module(module_name), class_name))
+        except (ImportError, AttributeError) as e:
+            raise RuntimeError(f"Display hardware '{hardware.name}' is not available: {e}") from e
+
+        _display_classes[hardware] = display_class
+
+        return display_class
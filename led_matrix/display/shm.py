@@ -0,0 +1,275 @@
+"""
+This module implements a display that publishes the frames in a shared memory file.
+Other processes can read them with the ShmFrameReader class.
+
+File layout (little endian):
+    file header (64 bytes):
+        magic b'LEDMSHM\\0', version, width, height, number of slots, slot size,
+        number of written frames, brightness
+    slots (slot size bytes each):
+        sequence number, timestamp in ns since the epoch, frame data (height x width x RGB)
+
+The frame with the number n (starting at zero) is written to slot n % number of slots.
+Its sequence number is 2n + 1 while it is written and 2n + 2 afterwards.
+
+The slots are a sequence lock, the writer never waits for readers. A reader of frame n must:
+    1. read the sequence number of the slot, it must be 2n + 2
+    2. copy the frame data and the timestamp
+    3. read the sequence number again, it must not have changed
+Otherwise the slot was overwritten meanwhile and the copy must be discarded. Then read the latest frame again.
+The writer issues memory barriers between its steps and so must the reader, otherwise a CPU with weak memory ordering
+(e.g. ARM) may reorder the accesses. The number of written frames is updated after the slot is complete.
+
+The file is removed when the display is closed. A new file is created on every start of the display.
+"""
+# the following works only on linux
+import sys
+
+if sys.platform == "linux":
+    import mmap
+    import os
+    import time
+    from pathlib import Path
+    from threading import Lock
+    from typing import Final, NamedTuple
+
+    import numpy as np
+    from numpy.typing import NDArray
+
+    from led_matrix.config.settings import Settings
+    from led_matrix.display.abstract import AbstractDisplay
+
+
+    SHM_DIR: Final[Path] = Path("/") / "dev" / "shm"
+
+    SHM_MAGIC: Final[bytes] = b"LEDMSHM\0"
+    SHM_VERSION: Final[int] = 1
+
+    FILE_HEADER_SIZE: Final[int] = 64
+    _FILE_HEADER_DTYPE: Final[np.dtype] = np.dtype([
+        ("magic", "S8"),
+        ("version", "<u4"),
+        ("width", "<u4"),
+        ("height", "<u4"),
+        ("slots", "<u4"),
+        ("slot_size", "<u8"),
+        ("frame_count", "<u8"),
+        ("brightness", "<u4"),
+    ])
+
+    SLOT_HEADER_SIZE: Final[int] = 16
+    _SLOT_HEADER_DTYPE: Final[np.dtype] = np.dtype([
+        ("sequence", "<u8"),
+        ("timestamp_ns", "<u8"),
+    ])
+
+
+    def _slot_size(width: int, height: int) -> int:
+        # keep the slot headers 8 byte aligned
+        return SLOT_HEADER_SIZE + (height * width * 3 + 7) // 8 * 8
+
+
+    class _MemoryBarrier:
+        """
+        Python and numpy have no memory barrier, but releasing and acquiring a lock acts as one.
+        The memory accesses before the call are visible to other CPUs before the ones after it.
+        An instance must only be used by one thread.
+        """
+        def __init__(self) -> None:
+            self.__lock: Lock = Lock()
+            self.__lock.acquire()  # pylint: disable=R1732
+
+        def __call__(self) -> None:
+            self.__lock.release()
+            self.__lock.acquire()  # pylint: disable=R1732
+
+
+    class _ShmFile:
+        """The memory mapped shared memory file with numpy views on its headers and frames."""
+        def __init__(self, path: Path, writable: bool,
+                     width: int=0, height: int=0, slots: int=0) -> None:
+            if writable:
+                # never resize a file that is mapped by readers, they would crash on access
+                # they keep their (now unlinked) file and can detect the new one with 'is_replaced'
+                # os.unlink is used, because on Alpine Linux the pathlib write operations are committed with 'lbu'
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass
+
+            fd: int = os.open(path, (os.O_RDWR | os.O_CREAT | os.O_EXCL) if writable else os.O_RDONLY, 0o644)
+            try:
+                if writable:
+                    os.ftruncate(fd, FILE_HEADER_SIZE + slots * _slot_size(width, height))
+                self.inode: int = os.fstat(fd).st_ino
+
+                self.__mmap: mmap.mmap = mmap.mmap(fd, 0,
+                                                   access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ)
+            finally:
+                # the mapping stays valid without the file descriptor
+                os.close(fd)
+
+            self.header: np.ndarray = np.ndarray((), dtype=_FILE_HEADER_DTYPE, buffer=self.__mmap)
+
+            if writable:
+                self.header["magic"] = SHM_MAGIC
+                self.header["version"] = SHM_VERSION
+                self.header["width"] = width
+                self.header["height"] = height
+                self.header["slots"] = slots
+                self.header["slot_size"] = _slot_size(width, height)
+                self.header["frame_count"] = 0
+            elif self.header["magic"] != SHM_MAGIC or self.header["version"] != SHM_VERSION:
+                self.__mmap.close()
+                raise ValueError(f"'{path}' is not a LED-Matrix shared memory file.")
+
+            width = int(self.header["width"])
+            height = int(self.header["height"])
+            slot_size: int = int(self.header["slot_size"])
+
+            self.slot_headers: list[np.ndarray] = []
+            self.frames: list[NDArray[np.uint8]] = []
+            slot: int
+            for slot in range(int(self.header["slots"])):
+                offset: int = FILE_HEADER_SIZE + slot * slot_size
+                self.slot_headers.append(np.ndarray((), dtype=_SLOT_HEADER_DTYPE,
+                                                    buffer=self.__mmap, offset=offset))
+                self.frames.append(np.ndarray((height, width, 3), dtype=np.uint8,
+                                              buffer=self.__mmap, offset=offset + SLOT_HEADER_SIZE))
+
+        def close(self) -> None:
+            # the views must be released before the mapping can be closed
+            del self.header
+            self.slot_headers.clear()
+            self.frames.clear()
+
+            self.__mmap.close()
+
+
+    class ShmFrame(NamedTuple):
+        frame: NDArray[np.uint8]
+        frame_number: int
+        timestamp_ns: int
+        brightness: int
+
+
+    class ShmFrameReader:
+        """Reads the frames that are published by the Shm display from other processes."""
+        def __init__(self, name: str="led-matrix") -> None:
+            self.__path: Path = SHM_DIR / name
+            self.__file: _ShmFile = _ShmFile(self.__path, writable=False)
+            self.__memory_barrier: _MemoryBarrier = _MemoryBarrier()
+
+        @property
+        def is_replaced(self) -> bool:
+            """
+            True if the display created a new file, e.g. after a reload, or if it was closed.
+            Then a new reader must be created to get new frames.
+            """
+            try:
+                return self.__path.stat().st_ino != self.__file.inode
+            except FileNotFoundError:
+                return True
+
+        @property
+        def frame_count(self) -> int:
+            """The number of published frames. Poll this to detect new frames."""
+            return int(self.__file.header["frame_count"])
+
+        def read(self, frame_number: int | None=None) -> ShmFrame | None:
+            """
+            Read a frame into a new array. By default the latest one.
+            Returns None if there is no such frame (anymore).
+            """
+            return self.read_into(np.empty(self.__file.frames[0].shape, dtype=np.uint8), frame_number)
+
+        def read_into(self, out: NDArray[np.uint8], frame_number: int | None=None) -> ShmFrame | None:
+            """
+            Read a frame into a preallocated array, so polling readers do not allocate a new one for every frame.
+            By default the latest one is read.
+            Returns None if there is no such frame (anymore) or if it was overwritten while it was read.
+            In the latter case the content of the array is undefined, just read the latest frame again.
+            @param out: The array must have the shape (height, width, 3) and the type uint8.
+            """
+            latest: int = self.frame_count - 1
+            if frame_number is None:
+                frame_number = latest
+            if frame_number < 0 or frame_number > latest or latest - frame_number >= len(self.__file.frames):
+                return None
+
+            slot: int = frame_number % len(self.__file.frames)
+            slot_header: np.ndarray = self.__file.slot_headers[slot]
+
+            # the slot is not overwritten while it is copied, if the sequence number does not change
+            self.__memory_barrier()
+            sequence: int = int(slot_header["sequence"])
+            if sequence != 2 * frame_number + 2:
+                return None
+
+            self.__memory_barrier()
+            np.copyto(out, self.__file.frames[slot])
+            timestamp_ns: int = int(slot_header["timestamp_ns"])
+
+            self.__memory_barrier()
+            if int(slot_header["sequence"]) != sequence:
+                return None
+
+            return ShmFrame(frame=out,
+                            frame_number=frame_number,
+                            timestamp_ns=timestamp_ns,
+                            brightness=int(self.__file.header["brightness"]))
+
+        def close(self) -> None:
+            self.__file.close()
+
+
+    class Shm(AbstractDisplay):
+        def __init__(self, config: Settings) -> None:
+            super().__init__(config=config)
+
+            if config.shm.slots <= 0:
+                raise ValueError(f"The number of shared memory slots must be greater than zero, "
+                                 f"not '{config.shm.slots}'.")
+
+            self.__path: Path = SHM_DIR / config.shm.name
+            self.__file: _ShmFile = _ShmFile(self.__path, writable=True,
+                                             width=config.main.display_width,
+                                             height=config.main.display_height,
+                                             slots=config.shm.slots)
+            self.__frame_count: int = 0
+            # the frames are written by the thread of the display output
+            self.__memory_barrier: _MemoryBarrier = _MemoryBarrier()
+
+            self.set_brightness(100)
+
+        def show(self, gamma: bool=False) -> None:
+            slot: int = self.__frame_count % len(self.__file.frames)
+            slot_header: np.ndarray = self.__file.slot_headers[slot]
+
+            # an odd sequence number marks the slot as being written
+            slot_header["sequence"] = 2 * self.__frame_count + 1
+            self.__memory_barrier()
+            self._apply_color_lut(self._color_temp_lut, self.frame_buffer, out=self.__file.frames[slot])
+            slot_header["timestamp_ns"] = time.time_ns()
+            self.__memory_barrier()
+            slot_header["sequence"] = 2 * self.__frame_count + 2
+
+            # the frame is only announced once its slot is complete
+            self.__memory_barrier()
+            self.__frame_count += 1
+            self.__file.header["frame_count"] = self.__frame_count
+
+        def set_brightness(self, brightness: int) -> None:
+            # the readers apply the brightness themselves
+            self.__file.header["brightness"] = brightness
+
+        def close(self) -> None:
+            self.__file.close()
+
+            # remove the file, so it does not stay in the shared memory and the readers know the display is stopped
+            # but not if it already belongs to a new display, e.g. after a reload
+            try:
+                if os.stat(self.__path).st_ino == self.__file.inode:
+                    os.unlink(self.__path)
+            except FileNotFoundError:
+                pass
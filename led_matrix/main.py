@@ -1,29 +1,31 @@
+import os
 import signal
+import time
 from datetime import datetime
-from importlib import resources
 from logging import Logger
 from pathlib import Path
 from queue import Queue
 from threading import Event, Lock, Thread
 
-import numpy as np
 import pytz
 from apscheduler.job import Job
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.date import DateTrigger
-from numpy.typing import NDArray
-from simple_plugin_loader import Loader
 
 from led_matrix.animation.abstract import (AbstractAnimationController,
                                            AnimationSettings)
 from led_matrix.animation.controller import MainAnimationController
+from led_matrix.common.frame import FrameEnvelope, FrameQueue
+from led_matrix.common.frame_pool import FramePool
 from led_matrix.common.log import LOG
 from led_matrix.common.schedule import ScheduleEntry
 from led_matrix.common.threading import EventWithUnsetSignal
 from led_matrix.config import Configuration
-from led_matrix.config.types import ColorTemp
+from led_matrix.config.types import ColorTemp, Hardware
 from led_matrix.display.abstract import AbstractDisplay
+from led_matrix.display.output import DisplayOutput
+from led_matrix.display.registry import get_display_class
 from led_matrix.server.http_server import HttpServer
 from led_matrix.server.tpm2_net import Tpm2NetServer
 
@@ -52,17 +54,34 @@ class MainController:
         self.__config_file_path: Path = config_file_path
         self.__config: Configuration = Configuration(config_file_path=self.__config_file_path)
 
+        # the number of frames that were dropped, because they arrived after their presentation time
+        self.__late_frames: int = 0
+        # the animations reuse the frame buffers of this pool
+        # the frames that are rendered ahead need buffers of their own
+        self.__frame_pool: FramePool = FramePool(width=self.__config.main.display_width,
+                                                 height=self.__config.main.display_height,
+                                                 size=4 + max(0, self.__config.main.render_ahead_frames))
         # this is the queue that holds the frames to display
-        self.__frame_queue: Queue[NDArray[np.uint8]] = Queue(maxsize=1)
+        # the main loop waits on it, so the quit signal must interrupt it
+        self.__frame_queue: FrameQueue = self.__create_frame_queue()
 
         # create the display object
         self.__display: AbstractDisplay = self.__initialize_display()
+        # the thread that sends the frames to the display
+        # gets started in mainloop method
+        self.__display_output: DisplayOutput = DisplayOutput(
+            display=self.__display,
+            refresh_rate=self.__get_display_refresh_rate(),
+            frame_pool=self.__frame_pool,
+            on_first_frame_presented=self.__on_first_frame_presented
+        )
 
         # animation controller
         # gets initialized in mainloop method
         self.__animation_controller: MainAnimationController = MainAnimationController(
             config=self.config,
-            display_frame_queue=self.__frame_queue
+            display_frame_queue=self.__frame_queue,
+            frame_pool=self.__frame_pool
         )
 
         # the animation scheduler
@@ -132,22 +151,24 @@ class MainController:
 
         return scheduler
 
+    def __create_frame_queue(self) -> FrameQueue:
+        # a source with more frames than it renders ahead is faster than the display, so its oldest frame is dropped
+        return FrameQueue(max_frames_per_source=max(0, self.__config.main.render_ahead_frames) + 1,
+                          release_frame=lambda frame: self.__frame_pool.release(frame))
+
+    def __get_display_refresh_rate(self) -> int:
+        # the headless display benchmarks the frame pipeline, so the refresh rate must not limit it
+        if self.__config.main.hardware == Hardware.HEADLESS:
+            return 0
+
+        return self.__config.main.display_refresh_rate
+
     def __initialize_display(self) -> AbstractDisplay:
         _log.info("Initialize display")
 
-        with resources.as_file(resources.files("led_matrix.display")) as displays_dir:
-            # load display plugins
-            display_loader: Loader = Loader()
-            display_loader.load_plugins(str(displays_dir.resolve()), plugin_base_class=AbstractDisplay)
-
-        # create it
-        try:
-            display: AbstractDisplay = display_loader.plugins[self.__config.main.hardware.name.casefold()](
-                config=self.__config
-            )
-            display.clear()
-        except KeyError as e:
-            raise RuntimeError(f"Display hardware '{self.__config.main.hardware.name}' not known.") from e
+        # only the module of the configured hardware gets imported
+        display: AbstractDisplay = get_display_class(self.__config.main.hardware)(config=self.__config)
+        display.clear()
 
         return display
 
@@ -203,12 +224,14 @@ class MainController:
 
     @classmethod
     def quit(cls) -> None:
-        cls.__quit()
+        # exit like on Ctrl+C, so the signal handler of the running controller wakes up its main loop
+        os.kill(os.getpid(), signal.SIGINT)
 
-    @classmethod
-    def __quit(cls, *_) -> None:
+    def __quit(self, *_) -> None:
         _log.info("Exit request received. Start cleaning up...")
         MainController.__quit_signal.set()
+        # wake up the main loop
+        self.__frame_queue.interrupt()
 
     @property
     def config(self) -> Configuration:
@@ -218,19 +241,31 @@ class MainController:
         return self.__config
 
     @property
-    def frame_queue(self) -> Queue[NDArray[np.uint8]]:
+    def frame_queue(self) -> Queue[FrameEnvelope]:
         """
         Access to the frame queue.
         Needed by the animation classes.
         """
         return self.__frame_queue
 
+    @property
+    def late_frames(self) -> int:
+        """
+        The number of frames that were dropped, because they could not be presented in time.
+        """
+        return self.__late_frames
+
     def __reload(self, *_) -> None:
         _log.info("Reloading application")
 
         # set the reload and quit signal to exit mainloop
         MainController.__reload_signal.set()
         MainController.__quit_signal.set()
+        self.__frame_queue.interrupt()
+
+    def __on_first_frame_presented(self) -> None:
+        # after the first frame is displayed, the reload is finished
+        MainController.__reload_signal.clear()
 
     def reload(self) -> None:
         """
@@ -458,26 +493,32 @@ class MainController:
         # start the server interfaces
         self.__start_servers()
 
-        first_loop: bool = True
+        # start the display output
+        self.__display_output.start()
+
         # run until '__quit' method was called
         while not MainController.__quit_signal.is_set():
-            # check if there is a frame that needs to be displayed
-            if self.__frame_queue.qsize() != 0:
-                # get frame
-                frame_changed: bool = self.__display.update_frame_buffer(self.__frame_queue.get())
+            # wait until a frame needs to be displayed
+            # the queue wakes up for newer frames, so it never sleeps on a frame that was rendered ahead
+            envelope: FrameEnvelope | None = self.__frame_queue.get_due_or_interrupt()
+            if envelope is None:
+                # interrupted by the quit signal
+                continue
+
+            if envelope.ring is not None and not envelope.ring.take(envelope):
+                # the frame was rendered ahead, but the animation discarded it, e.g. because it was paused
+                self.__frame_pool.release(envelope.frame)
                 self.__frame_queue.task_done()
+                continue
 
-                # if it has changed, display it
-                if frame_changed:
-                    self.__display.show(gamma=True)
-
-                # after the first frame is displayed, clear the reload signal
-                if first_loop:
-                    MainController.__reload_signal.clear()
-                    first_loop = False
+            if envelope.is_late(time.monotonic_ns()):
+                # a newer frame is due already, so the producer keeps its speed
+                self.__late_frames += 1
+                self.__frame_pool.release(envelope.frame)
             else:
-                # to limit CPU usage do not go faster than 60 "fps" on empty queue
-                MainController.__quit_signal.wait(1/60)
+                # hand the frame over to the display output, it gets displayed on the next refresh
+                self.__display_output.submit(envelope.frame)
+            self.__frame_queue.task_done()
 
         # first stop the server interfaces
         self.__stop_servers()
@@ -487,7 +528,14 @@ class MainController:
         self.__animation_scheduler.shutdown(wait=False)
         # stop the animation controller (including any currently running animation)
         self.__animation_controller.stop()
+        # return the frames that were not presented anymore, e.g. of paused animations
+        self.__frame_queue.clear()
+        self.__display_output.stop()
+        _log.debug("Dropped %d late frames and %d superseded frames",
+                   self.__late_frames,
+                   self.__frame_queue.dropped)
         self.__display.clear()
+        self.__display.close()
 
         if MainController.__reload_signal.is_set():
             _log.info("Reloading application")
@@ -495,15 +543,27 @@ class MainController:
             # reload settings
             self.__config = Configuration(config_file_path=self.__config_file_path)
 
+            # the display size could have changed
+            self.__frame_pool = FramePool(width=self.__config.main.display_width,
+                                          height=self.__config.main.display_height,
+                                          size=4 + max(0, self.__config.main.render_ahead_frames))
+            # the number of frames that are rendered ahead could have changed
+            self.__frame_queue = self.__create_frame_queue()
+
             # recreate the controller
             self.__animation_controller = MainAnimationController(config=self.config,
-                                                                  display_frame_queue=self.frame_queue)
+                                                                  display_frame_queue=self.frame_queue,
+                                                                  frame_pool=self.__frame_pool)
 
             # recreate the scheduler
             self.__animation_scheduler = self.__create_scheduler()
 
             # re-initialize the display
             self.__display = self.__initialize_display()
+            self.__display_output = DisplayOutput(display=self.__display,
+                                                  refresh_rate=self.__get_display_refresh_rate(),
+                                                  frame_pool=self.__frame_pool,
+                                                  on_first_frame_presented=self.__on_first_frame_presented)
             self.apply_day_night()
 
             # clear quit signal
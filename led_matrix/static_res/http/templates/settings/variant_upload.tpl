@@ -21,13 +21,27 @@
                             <thead class="thead-light">
                                 <tr>
                                     <th scope="col">Current Variants</th>
+                                    <th scope="col">Frames</th>
+                                    <th scope="col">Size</th>
                                     <th scope="col">Delete</th>
                                 </tr>
                             </thead>
                             <tbody>
                                 % for variant in animation_controller.variant_enum:
+                                    % metadata = animation_controller.variant_metadata(variant)
                                     <tr>
                                         <td>{{variant.name.title()}}</td>
+                                        % if metadata is None:
+                                            <td>-</td>
+                                            <td>-</td>
+                                        % else:
+                                            % if metadata.frame_count > 1:
+                                                <td>{{metadata.frame_count}} ({{"%.1f" % metadata.duration}} s)</td>
+                                            % else:
+                                                <td>{{metadata.frame_count}}</td>
+                                            % end
+                                            <td>{{"-" if metadata.width is None else f"{metadata.width}x{metadata.height}"}}</td>
+                                        % end
                                         <td>
                                             <a class="btn btn-danger" href="/settings/variant_upload/{{animation_name}}/delete/{{variant.name}}">
                                                 <span class="icon bi-trash-fill"></span>
@@ -0,0 +1,155 @@
+"""
+Compare the bytes that the APA102 display sends with the ones of the original implementation.
+The expected LED frames were recorded with the per-pixel implementation that existed before the lookup tables.
+"""
+import sys
+import types
+from pathlib import Path
+from typing import Any, Final
+
+import numpy as np
+import pytest
+from numpy.typing import NDArray
+
+from led_matrix.config.settings import APA102, MainSettings, Settings
+from led_matrix.config.types import (ColorTemp, LEDColorType, LEDOrientation,
+                                     LEDOrigin, LEDWireMode)
+
+pytestmark = pytest.mark.skipif(sys.platform != "linux", reason="The APA102 display is only available on Linux.")
+
+
+class _FakeSpiDev:
+    """Keeps the last transfer of each SPI device instead of sending it."""
+    sent: dict[tuple[int, int], bytes] = {}
+
+    def __init__(self) -> None:
+        self.__device: tuple[int, int] = (0, 0)
+        self.max_speed_hz: int = 0
+
+    def open(self, bus: int, device: int) -> None:
+        self.__device = (bus, device)
+
+    def writebytes2(self, data: Any) -> None:
+        _FakeSpiDev.sent[self.__device] = bytes(data)
+
+    def close(self) -> None:
+        pass
+
+
+try:
+    import spidev  # pylint: disable=W0611
+except ImportError:
+    # the display module imports it, but it is replaced by the fake anyway
+    sys.modules["spidev"] = types.ModuleType("spidev")
+    sys.modules["spidev"].SpiDev = _FakeSpiDev  # type: ignore
+
+# pylint: disable=C0413
+from led_matrix.display import apa102  # noqa: E402
+
+_WIDTH: Final[int] = 3
+_HEIGHT: Final[int] = 2
+# every color value is different
+_FRAME: Final[NDArray[np.uint8]] = (
+    np.arange(_HEIGHT * _WIDTH * 3).reshape(_HEIGHT, _WIDTH, 3) * 12 + 5
+).astype(np.uint8)
+
+_LAYOUTS: Final[list[tuple[tuple[LEDOrientation, LEDOrigin, LEDWireMode, LEDColorType], str]]] = [
+    ((LEDOrientation.HORIZONTALLY, LEDOrigin.TOP_LEFT, LEDWireMode.LINE_BY_LINE, LEDColorType.RGB),
+     "ff05111dff293541ff4d5965ff717d89ff95a1adffb9c5d1"),
+    ((LEDOrientation.HORIZONTALLY, LEDOrigin.TOP_LEFT, LEDWireMode.ZIG_ZAG, LEDColorType.RBG),
+     "ff051d11ff294135ff4d6559ffb9d1c5ff95ada1ff71897d"),
+    ((LEDOrientation.HORIZONTALLY, LEDOrigin.TOP_RIGHT, LEDWireMode.LINE_BY_LINE, LEDColorType.GRB),
+     "ff594d65ff352941ff11051dffc5b9d1ffa195adff7d7189"),
+    ((LEDOrientation.HORIZONTALLY, LEDOrigin.TOP_RIGHT, LEDWireMode.ZIG_ZAG, LEDColorType.GBR),
+     "ff654d59ff412935ff1d0511ff89717dffad95a1ffd1b9c5"),
+    ((LEDOrientation.HORIZONTALLY, LEDOrigin.BOTTOM_LEFT, LEDWireMode.LINE_BY_LINE, LEDColorType.BGR),
+     "ff897d71ffada195ffd1c5b9ff1d1105ff413529ff65594d"),
+    ((LEDOrientation.HORIZONTALLY, LEDOrigin.BOTTOM_LEFT, LEDWireMode.ZIG_ZAG, LEDColorType.BRG),
+     "ff7d8971ffa1ad95ffc5d1b9ff59654dff354129ff111d05"),
+    ((LEDOrientation.HORIZONTALLY, LEDOrigin.BOTTOM_RIGHT, LEDWireMode.LINE_BY_LINE, LEDColorType.RGB),
+     "ffb9c5d1ff95a1adff717d89ff4d5965ff293541ff05111d"),
+    ((LEDOrientation.HORIZONTALLY, LEDOrigin.BOTTOM_RIGHT, LEDWireMode.ZIG_ZAG, LEDColorType.RBG),
+     "ffb9d1c5ff95ada1ff71897dff051d11ff294135ff4d6559"),
+    ((LEDOrientation.VERTICALLY, LEDOrigin.TOP_LEFT, LEDWireMode.LINE_BY_LINE, LEDColorType.GRB),
+     "ff11051dff7d7189ff352941ffa195adff594d65ffc5b9d1"),
+    ((LEDOrientation.VERTICALLY, LEDOrigin.TOP_LEFT, LEDWireMode.ZIG_ZAG, LEDColorType.GBR),
+     "ff1d0511ff89717dffad95a1ff412935ff654d59ffd1b9c5"),
+    ((LEDOrientation.VERTICALLY, LEDOrigin.TOP_RIGHT, LEDWireMode.LINE_BY_LINE, LEDColorType.BGR),
+     "ff65594dffd1c5b9ff413529ffada195ff1d1105ff897d71"),
+    ((LEDOrientation.VERTICALLY, LEDOrigin.TOP_RIGHT, LEDWireMode.ZIG_ZAG, LEDColorType.BRG),
+     "ff59654dffc5d1b9ffa1ad95ff354129ff111d05ff7d8971"),
+    ((LEDOrientation.VERTICALLY, LEDOrigin.BOTTOM_LEFT, LEDWireMode.LINE_BY_LINE, LEDColorType.RGB),
+     "ff717d89ff05111dff95a1adff293541ffb9c5d1ff4d5965"),
+    ((LEDOrientation.VERTICALLY, LEDOrigin.BOTTOM_LEFT, LEDWireMode.ZIG_ZAG, LEDColorType.RBG),
+     "ff71897dff051d11ff294135ff95ada1ffb9d1c5ff4d6559"),
+    ((LEDOrientation.VERTICALLY, LEDOrigin.BOTTOM_RIGHT, LEDWireMode.LINE_BY_LINE, LEDColorType.GRB),
+     "ffc5b9d1ff594d65ffa195adff352941ff7d7189ff11051d"),
+    ((LEDOrientation.VERTICALLY, LEDOrigin.BOTTOM_RIGHT, LEDWireMode.ZIG_ZAG, LEDColorType.GBR),
+     "ffd1b9c5ff654d59ff412935ffad95a1ff89717dff1d0511"),
+]
+
+# with the default layout
+_COLOR_CORRECTIONS: Final[list[tuple[tuple[int, ColorTemp, bool], str]]] = [
+    ((50, ColorTemp.K_3200, False), "e8191004e8383228e857534be8b4b7b5e8959692e876746f"),
+    ((50, ColorTemp.K_3200, True), "e8010000e8090603e8181511e8797d7ae84f504be8302e29"),
+    ((10, ColorTemp.K_6000, True), "e1010000e10b0703e1201811e1a38f7ce16b5b4ce13f3329"),
+    ((100, ColorTemp.K_2600, False), "ff110e05ff252929ff39454dff7699b9ff627d95ff4d6171"),
+]
+
+
+@pytest.fixture(autouse=True)
+def fake_spi(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(apa102, "SpiDev", _FakeSpiDev)
+    monkeypatch.setattr(apa102, "INDEX_CACHE_DIR", tmp_path)
+    _FakeSpiDev.sent.clear()
+
+
+def _show(display: "apa102.Apa102", gamma: bool=False) -> None:
+    display.update_frame_buffer(_FRAME)
+    display.show(gamma=gamma)
+    # waits until the frame is sent
+    display.close()
+
+
+@pytest.mark.parametrize(("layout", "expected"), _LAYOUTS)
+def test_index_maps(layout: tuple[LEDOrientation, LEDOrigin, LEDWireMode, LEDColorType], expected: str) -> None:
+    orientation, origin, wire_mode, color_type = layout
+    config: Settings = Settings(main=MainSettings(display_width=_WIDTH, display_height=_HEIGHT),
+                                apa102=APA102(color_type=color_type, wire_mode=wire_mode,
+                                              orientation=orientation, origin=origin))
+
+    # the second display loads the index maps from the cache
+    for _ in range(2):
+        _show(apa102.Apa102(config))
+
+        sent: bytes = _FakeSpiDev.sent[(0, 1)]
+        assert sent[:4] == b"\x00" * 4
+        assert sent[4:-1].hex() == expected
+        assert sent[-1:] == b"\xff"
+
+
+def test_split_across_spi_devices() -> None:
+    main: MainSettings = MainSettings(display_width=_WIDTH, display_height=_HEIGHT)
+    _show(apa102.Apa102(Settings(main=main)))
+    single: bytes = _FakeSpiDev.sent[(0, 1)]
+
+    _show(apa102.Apa102(Settings(main=main, apa102=APA102(spi_devices=((0, 0), (1, 0))))))
+    first: bytes = _FakeSpiDev.sent[(0, 0)]
+    second: bytes = _FakeSpiDev.sent[(1, 0)]
+
+    # one line per device, each part has its own start and end frame
+    assert first[:4] == second[:4] == b"\x00" * 4
+    assert first[4:-1] + second[4:-1] == single[4:-1]
+    assert first[-1:] == second[-1:] == b"\xff"
+
+
+@pytest.mark.parametrize(("correction", "expected"), _COLOR_CORRECTIONS)
+def test_color_lut(correction: tuple[int, ColorTemp, bool], expected: str) -> None:
+    brightness, color_temp, gamma = correction
+    display: apa102.Apa102 = apa102.Apa102(Settings(main=MainSettings(display_width=_WIDTH,
+                                                                      display_height=_HEIGHT)))
+    display.set_brightness(brightness)
+    display.set_color_temp(color_temp)
+    _show(display, gamma=gamma)
+
+    assert _FakeSpiDev.sent[(0, 1)][4:-1].hex() == expected
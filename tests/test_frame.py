@@ -0,0 +1,81 @@
+"""
+Queue the frames of several sources for the display side.
+"""
+import time
+
+import numpy as np
+from numpy.typing import NDArray
+
+from led_matrix.common.frame import FrameEnvelope, FrameQueue, FrameRing
+
+
+class _Released:
+    """Collects the frames that the queue releases."""
+    def __init__(self) -> None:
+        self.frames: list[NDArray[np.uint8]] = []
+
+    def __call__(self, frame: NDArray[np.uint8]) -> None:
+        self.frames.append(frame)
+
+
+def _envelope(source_id: str, ring: FrameRing | None=None) -> FrameEnvelope:
+    envelope: FrameEnvelope = FrameEnvelope(frame=np.zeros((2, 3, 3), dtype=np.uint8),
+                                            source_id=source_id,
+                                            presentation_time_ns=time.monotonic_ns(),
+                                            ring=ring)
+    if ring is not None:
+        ring.push(envelope)
+
+    return envelope
+
+
+def test_drop_oldest_frame_of_source() -> None:
+    released: _Released = _Released()
+    queue: FrameQueue = FrameQueue(2, released)
+
+    first: FrameEnvelope = _envelope("a")
+    queue.put(first)
+    queue.put(_envelope("b"))
+    queue.put(_envelope("a"))
+    assert queue.dropped == 0
+
+    # the third frame of 'a' supersedes its first one, the frame of 'b' stays
+    queue.put(_envelope("a"))
+    assert queue.dropped == 1
+    assert released.frames == [first.frame]
+    assert queue.qsize() == 3
+    assert [envelope.source_id for envelope in queue.queue] == ["b", "a", "a"]
+
+    # the dropped frame is not counted as unfinished
+    for _ in range(3):
+        assert queue.get_due_or_interrupt() is not None
+        queue.task_done()
+    assert queue.unfinished_tasks == 0
+
+
+def test_discard_source() -> None:
+    released: _Released = _Released()
+    queue: FrameQueue = FrameQueue(4, released)
+    ring: FrameRing = FrameRing(4)
+
+    discarded: list[FrameEnvelope] = [_envelope("a", ring) for _ in range(2)]
+    other: FrameEnvelope = _envelope("b")
+    queue.put(discarded[0])
+    queue.put(other)
+    queue.put(discarded[1])
+
+    queue.discard("a")
+    assert [id(frame) for frame in released.frames] == [id(envelope.frame) for envelope in discarded]
+    # the producer can render ahead again
+    assert len(ring) == 0
+    assert list(queue.queue) == [other]
+    assert queue.unfinished_tasks == 1
+
+    # nothing left to discard
+    queue.discard("a")
+    assert len(released.frames) == 2
+
+    assert queue.get_due_or_interrupt() is other
+    queue.task_done()
+    # would block if the discarded frames were still unfinished
+    queue.join()
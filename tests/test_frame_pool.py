@@ -0,0 +1,54 @@
+"""
+Lease and release the buffers of the frame pool.
+"""
+import numpy as np
+from numpy.typing import NDArray
+
+from led_matrix.common.frame_pool import FramePool
+
+
+def test_reuse_released_buffer() -> None:
+    pool: FramePool = FramePool(width=3, height=2, size=1)
+
+    frame: NDArray[np.uint8] = pool.lease()
+    assert frame.shape == (2, 3, 3)
+    assert frame.dtype == np.uint8
+
+    # all buffers are in use, so a new one is allocated
+    other: NDArray[np.uint8] = pool.lease()
+    assert other is not frame
+    assert pool.allocated == 2
+
+    pool.release(frame)
+    assert pool.lease() is frame
+    assert pool.allocated == 2
+
+
+def test_release_foreign_frame() -> None:
+    pool: FramePool = FramePool(width=3, height=2, size=1)
+
+    pool.release(np.zeros((2, 3, 3), dtype=np.uint8))
+    assert pool.allocated == 1
+
+
+def test_shared_release() -> None:
+    pool: FramePool = FramePool(width=3, height=2, size=1)
+
+    frame: NDArray[np.uint8] = pool.lease(users=3)
+
+    # the buffer is only free after all users released it
+    pool.release(frame)
+    pool.release(frame)
+    other: NDArray[np.uint8] = pool.lease()
+    assert other is not frame
+
+    pool.release(frame)
+    assert pool.lease() is frame
+
+    # a released buffer is not shared anymore when it is leased again
+    pool.release(frame)
+    assert pool.lease(users=1) is frame
+    pool.release(frame)
+    pool.release(other)
+    assert pool.allocated == 2
+    assert {id(pool.lease()), id(pool.lease())} == {id(frame), id(other)}
@@ -0,0 +1,95 @@
+"""
+Record frames with the Recorder display and read them back with the RecordingReader.
+"""
+from pathlib import Path
+
+import numpy as np
+import pytest
+from numpy.typing import NDArray
+
+from led_matrix.config.settings import MainSettings
+from led_matrix.config.settings import Recorder as RecorderSettings
+from led_matrix.config.settings import Settings
+from led_matrix.config.types import ColorTemp
+from led_matrix.display.recorder import Recorder, RecordingReader
+
+
+def _record(directory: Path, compression: bool, frames: list[NDArray[np.uint8]]) -> Path:
+    recorder: Recorder = Recorder(Settings(main=MainSettings(display_width=4, display_height=3),
+                                           recorder=RecorderSettings(directory=directory,
+                                                                     compression=compression,
+                                                                     keyframe_interval=3)))
+
+    i: int
+    frame: NDArray[np.uint8]
+    for i, frame in enumerate(frames):
+        # the brightness is stored with each frame
+        recorder.set_brightness(100 - i)
+        recorder.update_frame_buffer(frame)
+        recorder.show()
+
+    recorder.close()
+    return recorder.file_path
+
+
+@pytest.fixture(name="frames")
+def fixture_frames() -> list[NDArray[np.uint8]]:
+    rng: np.random.Generator = np.random.default_rng(0)
+    # some pixels change from one frame to the next, like in an animation
+    frames: list[NDArray[np.uint8]] = [rng.integers(0, 256, (3, 4, 3), dtype=np.uint8)]
+    for _ in range(9):
+        frame: NDArray[np.uint8] = frames[-1].copy()
+        frame[rng.integers(0, 3), rng.integers(0, 4)] = rng.integers(0, 256, 3, dtype=np.uint8)
+        frames.append(frame)
+
+    return frames
+
+
+@pytest.mark.parametrize("compression", [True, False])
+def test_round_trip(tmp_path: Path, frames: list[NDArray[np.uint8]], compression: bool) -> None:
+    reader: RecordingReader = RecordingReader(_record(tmp_path, compression, frames))
+
+    assert (reader.width, reader.height) == (4, 3)
+    assert len(reader) == len(frames)
+    assert np.all(np.diff(reader.timestamps) >= 0)
+
+    # in order, backwards and across keyframes
+    index: int
+    for index in [*range(len(frames)), *reversed(range(len(frames))), 7, 2, 5, -1]:
+        assert np.array_equal(reader[index].frame, frames[index])
+        assert reader[index].brightness == 100 - (index % len(frames))
+
+    with pytest.raises(IndexError):
+        reader[len(frames)]  # pylint: disable=W0104
+
+    reader.close()
+
+
+def test_color_temperature(tmp_path: Path) -> None:
+    recorder: Recorder = Recorder(Settings(main=MainSettings(display_width=4, display_height=3),
+                                           recorder=RecorderSettings(directory=tmp_path)))
+    recorder.set_color_temp(ColorTemp.K_3200)
+
+    frame: NDArray[np.uint8] = np.full((3, 4, 3), 200, dtype=np.uint8)
+    recorder.update_frame_buffer(frame)
+    recorder.show()
+    recorder.close()
+
+    reader: RecordingReader = RecordingReader(recorder.file_path)
+    # the recording contains the frames like they are displayed
+    assert np.array_equal(reader[0].frame,
+                          np.ceil(frame * np.array(ColorTemp.K_3200.value)).astype(np.uint8))
+    reader.close()
+
+
+def test_incomplete_record(tmp_path: Path, frames: list[NDArray[np.uint8]]) -> None:
+    file_path: Path = _record(tmp_path, True, frames)
+
+    # e.g. after a crash while writing
+    truncated_path: Path = tmp_path / "truncated.ledrec"
+    truncated_path.write_bytes(file_path.read_bytes()[:-1])
+
+    reader: RecordingReader = RecordingReader(truncated_path)
+    assert len(reader) == len(frames) - 1
+    assert np.array_equal(reader[-1].frame, frames[-2])
+    reader.close()
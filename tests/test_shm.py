@@ -0,0 +1,145 @@
+"""
+Read the frames of the shared memory display with the reader of other processes.
+"""
+import os
+import sys
+from typing import Any, Callable, Generator
+from uuid import uuid4
+
+import numpy as np
+import pytest
+from numpy.typing import NDArray
+
+from led_matrix.config.settings import MainSettings, Settings
+from led_matrix.config.settings import Shm as ShmSettings
+
+pytestmark = pytest.mark.skipif(sys.platform != "linux", reason="The shared memory display is only available on Linux.")
+
+if sys.platform == "linux":
+    from led_matrix.display import shm
+    from led_matrix.display.shm import SHM_DIR, Shm, ShmFrame, ShmFrameReader
+
+
+@pytest.fixture(name="shm_name")
+def fixture_shm_name() -> Generator[str, None, None]:
+    name: str = f"led-matrix-test-{uuid4().hex}"
+
+    yield name
+
+    # if a test failed before its display was closed
+    try:
+        os.unlink(SHM_DIR / name)
+    except FileNotFoundError:
+        pass
+
+
+def _create_display(name: str, slots: int) -> "Shm":
+    return Shm(Settings(main=MainSettings(display_width=3, display_height=2),
+                        shm=ShmSettings(name=name, slots=slots)))
+
+
+def _frame(value: int) -> NDArray[np.uint8]:
+    return np.full((2, 3, 3), value, dtype=np.uint8)
+
+
+def _show(display: "Shm", value: int) -> None:
+    display.update_frame_buffer(_frame(value))
+    display.show()
+
+
+def test_read_frames(shm_name: str) -> None:
+    display: Shm = _create_display(shm_name, slots=3)
+    reader: ShmFrameReader = ShmFrameReader(shm_name)
+
+    assert reader.frame_count == 0
+    assert reader.read() is None
+
+    value: int
+    for value in range(1, 6):
+        _show(display, value)
+    display.set_brightness(40)
+
+    assert reader.frame_count == 5
+    latest: ShmFrame | None = reader.read()
+    assert latest is not None
+    assert latest.frame_number == 4
+    assert latest.brightness == 40
+    assert np.array_equal(latest.frame, _frame(5))
+
+    # the last frames are kept in the slots
+    out: NDArray[np.uint8] = np.zeros((2, 3, 3), dtype=np.uint8)
+    older: ShmFrame | None = reader.read_into(out, frame_number=2)
+    assert older is not None
+    assert older.frame is out
+    assert np.array_equal(out, _frame(3))
+
+    assert reader.read(1) is None
+    assert reader.read(5) is None
+
+    reader.close()
+    display.close()
+
+
+def test_frame_written_while_reading(shm_name: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    display: Shm = _create_display(shm_name, slots=1)
+    reader: ShmFrameReader = ShmFrameReader(shm_name)
+    _show(display, 1)
+
+    copyto: Callable[..., Any] = np.copyto
+
+    def overwrite_while_copying(*args: Any, **kwargs: Any) -> None:
+        copyto(*args, **kwargs)
+        # the only slot gets the next frame
+        monkeypatch.setattr(shm.np, "copyto", copyto)
+        _show(display, 2)
+
+    monkeypatch.setattr(shm.np, "copyto", overwrite_while_copying)
+    assert reader.read() is None
+
+    # the next try gets the new frame
+    latest: ShmFrame | None = reader.read()
+    assert latest is not None
+    assert latest.frame_number == 1
+    assert np.array_equal(latest.frame, _frame(2))
+
+    reader.close()
+    display.close()
+
+
+def test_frame_read_while_writing(shm_name: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    display: Shm = _create_display(shm_name, slots=1)
+    reader: ShmFrameReader = ShmFrameReader(shm_name)
+    _show(display, 1)
+
+    read_frames: list[ShmFrame | None] = []
+    apply_color_lut: Callable[..., NDArray[np.uint8]] = Shm._apply_color_lut  # pylint: disable=W0212
+
+    def read_while_writing(*args: Any, **kwargs: Any) -> NDArray[np.uint8]:
+        # the slot of the previous frame is being overwritten
+        read_frames.append(reader.read())
+        return apply_color_lut(*args, **kwargs)
+
+    monkeypatch.setattr(Shm, "_apply_color_lut", staticmethod(read_while_writing))
+    _show(display, 2)
+
+    assert read_frames == [None]
+
+    reader.close()
+    display.close()
+
+
+def test_close_removes_file(shm_name: str) -> None:
+    display: Shm = _create_display(shm_name, slots=2)
+    reader: ShmFrameReader = ShmFrameReader(shm_name)
+    assert not reader.is_replaced
+
+    # a new display replaces the file, closing the old one must not remove the new file
+    new_display: Shm = _create_display(shm_name, slots=2)
+    assert reader.is_replaced
+    display.close()
+    assert (SHM_DIR / shm_name).exists()
+
+    new_display.close()
+    assert not (SHM_DIR / shm_name).exists()
+
+    reader.close()